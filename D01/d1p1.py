@@ -24,39 +24,65 @@
 # Answer for sample input: 142
 # Answer for input: 54601
 
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.chunks import sum_chunks
+
 FILENAME = 'input.txt'
 
-# Ingest input file
-try:
-    with open(FILENAME, 'r') as f:
-        data = f.read().splitlines()
-except FileNotFoundError:
-    print(f"File {FILENAME} not found.")
-    exit(1)
-
-runningTotal = 0
-
-# Go line by line
-for line in data:
-    
-    firstNum = None
-    lastNum = None
-
-    # Find the first numeric character
-    for char in line:
-        if char.isdigit():
-            firstNum = int(char)
-            break
-    
-    # Find the last numeric character
-    for char in reversed(line):
-        if char.isdigit():
-            lastNum = int(char)
-            break
-
-    if firstNum is not None and lastNum is not None:
-        # Concatenate the string representation of the numbers
-        finalNum = int(str(firstNum) + str(lastNum))
-        runningTotal += finalNum
-
-print(f"Final total: {runningTotal}")
+def parse_input(file_name):
+    """
+    Reads the calibration document as a uint8 array of its raw bytes
+    """
+    # Ingest input file
+    try:
+        return np.fromfile(file_name, dtype=np.uint8)
+    except (FileNotFoundError, IOError) as e:
+        raise RuntimeError(f"An error occurred: {e}") from e
+
+def solve(data):
+    """
+    Returns the sum of the calibration values of every line in the document, given its bytes.
+    Instead of looping over each line's characters, this finds every digit in the document at
+    once and keeps the first and last digit of each line.
+    """
+    digit_positions = np.flatnonzero((data >= ord('0')) & (data <= ord('9')))
+    if digit_positions.size == 0:
+        return 0
+
+    # The line a digit is on is the number of newlines before it
+    newline_positions = np.flatnonzero(data == ord('\n'))
+    digit_lines = np.searchsorted(newline_positions, digit_positions)
+    digits = data[digit_positions].astype(np.int64) - ord('0')
+
+    # Digits are in document order, so a line's first digit is one whose predecessor is on an
+    # earlier line, and its last digit is one whose successor is on a later line
+    line_changes = digit_lines[1:] != digit_lines[:-1]
+    is_first = np.concatenate(([True], line_changes))
+    is_last = np.concatenate((line_changes, [True]))
+
+    return int(digits[is_first].sum() * 10 + digits[is_last].sum())
+
+def solve_file(file_name, workers=None):
+    """
+    Returns the calibration total of a whole document. Large documents are memory-mapped and
+    split into chunks on newlines, which are summed in parallel.
+    """
+    return sum_chunks(solve, 1, 1, file_name, workers, raw=True)
+
+def main():
+    """
+    Reads in the calibration document and prints the final total
+    """
+    runningTotal = solve_file(FILENAME)
+    print(f"Final total: {runningTotal}")
+
+if __name__ == "__main__":
+    main()
@@ -17,45 +17,137 @@
 # Answer for sample input: 281
 # Answer for input: 54078
 
-import re
+from collections import deque
+import sys
+from pathlib import Path
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.chunks import sum_chunks
 
 FILENAME = 'input.txt'
 
-# Convert a word to a number
-def word_to_num(word):
-    word_to_digit = {
-        "one": 1, "two": 2, "three": 3, "four": 4,"five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9,
-    }
-    return word_to_digit.get(word.lower(), None)
-
-# Helper function to take a digit like 2 or a word like 'two' and return the string of the integer (e.g. '2') for either
-def convert_to_string(num):
-    if num.isdigit():
-        return str(num)
-    else:
-        return str(word_to_num(num))
-
-# Ingest input file
-try:
-    with open(FILENAME, 'r') as f:
-        data = f.read().splitlines()
-except FileNotFoundError:
-    print(f"File {FILENAME} not found.")
-    exit(1)
-
-runningTotal = 0
-
-# Go line by line in the input file and compute over each line
-for line in data:
-    # Using Regexp, look for any matches of numbers or number spelled out as words
-    matches = re.findall(r'(?=(one|two|three|four|five|six|seven|eight|nine|\d))', line)
-    
-    if matches:  
-        firstNum = convert_to_string(matches[0])
-        lastNum = convert_to_string(matches[-1])
-
-        print(f"Line: {line}; firstNum: {firstNum}; lastNum: {lastNum}")
-        finalNum = int(firstNum + lastNum)
-        runningTotal += finalNum
-
-print(f"Final total: {runningTotal}")
+# Print each line's digits as it's solved. Printing is much slower than solving, so it's off
+# by default.
+VERBOSE = False
+
+DIGIT_WORDS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9,
+}
+
+# Every way a digit can appear in a line, spelled out or as the digit itself
+DIGIT_PATTERNS = {**DIGIT_WORDS, **{str(digit): digit for digit in range(10)}}
+
+def build_automaton(patterns):
+    """
+    Builds an Aho-Corasick automaton that matches any of the patterns in a single pass.
+    Returns (transitions, outputs): transitions[state] maps a character to the next state, with
+    the failure links already folded in, and outputs[state] is the digit of the pattern that ends
+    in that state (None if none does). Characters with no transition go back to the start state.
+    No pattern is a suffix of another, so a state completes at most one pattern.
+    """
+    transitions = [{}]
+    outputs = [None]
+
+    # Build a trie of the patterns
+    for pattern, digit in patterns.items():
+        state = 0
+        for char in pattern:
+            if char not in transitions[state]:
+                transitions.append({})
+                outputs.append(None)
+                transitions[state][char] = len(transitions) - 1
+            state = transitions[state][char]
+        outputs[state] = digit
+
+    # Breadth-first over the trie, filling in each state's missing transitions from its failure
+    # state (the longest proper suffix that is also in the trie). The failure state is always
+    # shallower, so its transitions are already complete by the time they're copied.
+    failure = [0] * len(transitions)
+    queue = deque(transitions[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, next_state in list(transitions[state].items()):
+            queue.append(next_state)
+            failure[next_state] = transitions[failure[state]].get(char, 0) if state else 0
+            if outputs[next_state] is None:
+                outputs[next_state] = outputs[failure[next_state]]
+        for char, next_state in transitions[failure[state]].items():
+            transitions[state].setdefault(char, next_state)
+
+    return transitions, outputs
+
+# One automaton finds the first digit scanning forwards, the other finds the last digit by
+# scanning the line backwards for the reversed patterns
+FORWARD_AUTOMATON = build_automaton(DIGIT_PATTERNS)
+REVERSE_AUTOMATON = build_automaton({pattern[::-1]: digit for pattern, digit in DIGIT_PATTERNS.items()})
+
+def find_first_digit(chars, automaton):
+    """
+    Feeds characters through the automaton and returns the digit of the first pattern matched,
+    stopping there, or None if there isn't one
+    """
+    transitions, outputs = automaton
+    state = 0
+    for char in chars:
+        state = transitions[state].get(char, 0)
+        if outputs[state] is not None:
+            return outputs[state]
+    return None
+
+def parse_input(file_name):
+    """
+    Reads the calibration document into a list of lines
+    """
+    # Ingest input file
+    try:
+        with open(file_name, 'r', encoding='utf-8') as f:
+            return f.read().splitlines()
+    except (FileNotFoundError, IOError) as e:
+        raise RuntimeError(f"An error occurred: {e}") from e
+
+def solve(data, verbose=None):
+    """
+    Returns the sum of the calibration values of every line, counting spelled-out digits.
+    verbose defaults to the module's VERBOSE setting at the time of the call.
+    """
+    if verbose is None:
+        verbose = VERBOSE
+    runningTotal = 0
+
+    # Go line by line
+    for line in data:
+        # Scan from each end only as far as the nearest digit or digit word
+        firstNum = find_first_digit(line, FORWARD_AUTOMATON)
+
+        if firstNum is not None:
+            lastNum = find_first_digit(reversed(line), REVERSE_AUTOMATON)
+
+            if verbose:
+                print(f"Line: {line}; firstNum: {firstNum}; lastNum: {lastNum}")
+            finalNum = firstNum * 10 + lastNum
+            runningTotal += finalNum
+
+    return runningTotal
+
+def solve_file(file_name, workers=None, verbose=None):
+    """
+    Returns the calibration total of a whole document. Large documents are memory-mapped and
+    split into chunks on newlines, which are summed in parallel.
+    """
+    # Workers load their own copy of this module, so pass the setting along explicitly
+    if verbose is None:
+        verbose = VERBOSE
+    return sum_chunks(solve, 1, 2, file_name, workers, solve_args=(verbose,))
+
+def main():
+    """
+    Reads in the calibration document and prints the final total
+    """
+    runningTotal = solve_file(FILENAME)
+    print(f"Final total: {runningTotal}")
+
+if __name__ == "__main__":
+    main()
@@ -29,60 +29,96 @@
 
 import re
 
+import numpy as np
+
 FILENAME = 'input.txt'
 BAG_CONTENTS = {'red': 12, 'green': 13, 'blue': 14}
+COLOR_COLUMNS = {'red': 0, 'green': 1, 'blue': 2}
+CUBE_PATTERN = re.compile(r'(\d+) (red|blue|green)')
 
-# Ingest input file
-try:
-    with open(FILENAME, 'r') as f:
-        data = f.read().splitlines()
-except FileNotFoundError:
-    print(f"File {FILENAME} not found.")
-    exit(1)
-
-# Helper function to take a game text file and break it down into game events stored in a dictionary
-def game_parser(game_file):
-    game_dict = {}
-    game_id = 1
+# Helper function to take a game text file and break it down into a table of cube counts
+def game_parser(file_name):
+    """
+    Parses a game text file into an (n_games, 3) array of the most red, green and blue cubes
+    revealed at once in each game. Row i holds game i + 1.
+    """
+    # Ingest input file
+    try:
+        with open(file_name, 'r', encoding='utf-8') as f:
+            game_file = f.read().splitlines()
+    except (FileNotFoundError, IOError) as e:
+        raise RuntimeError(f"An error occurred: {e}") from e
 
-    # Clean up each row in the game text file and store it in a dictionary
     # Sample game string: 'Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green'
-    # Cube color revelations are separated by '; '
-    for line in game_file:
-        game_dict[game_id] = {}
-
-        # Split the string into a list of cube color revelations
-        # For instance, a reveal will look like: '3 blue, 4 red'
-        cube_reveals = line.split('; ')
-
-        # For each cube reveal string, turn it into a dictionary of cube colors and their counts
-        reveal_id = 1
-        for reveal in cube_reveals:
-            game_dict[game_id][reveal_id] = {'red': 0, 'green': 0, 'blue': 0}
-
-            # User regexp to find the number of cubes of each color
-            reveal_colors = re.findall(r'(\d+) (red|blue|green)', reveal)
-
-            for count, color in reveal_colors:
-                game_dict[game_id][reveal_id][color] = int(count)
-            reveal_id += 1
-        game_id += 1
-    return game_dict
-
-# Iterate through each game and each reveal in each game
-# If we ever exceed the number of cubes in the bag, mark that as an impossible game
-games = game_parser(data)
-sum_possible_game_ids = 0
-
-print(f"Cubes in bag: {BAG_CONTENTS}")
-for game_id, game in games.items():
-    game_is_possible = True
-    for reveal_id, reveal in game.items():
-        if reveal['red'] > BAG_CONTENTS['red'] or reveal['blue'] > BAG_CONTENTS['blue'] or reveal['green'] > BAG_CONTENTS['green']:
-            print(f"Game {game_id} is impossible because of this reveal: {reveal}.")
-            game_is_possible = False
-            break
-    if(game_is_possible):
-        sum_possible_game_ids += game_id
-
-print(f"Sum of possible game IDs: {sum_possible_game_ids}")
\ No newline at end of file
+    # Only the largest count of each colour matters, so the reveals don't need to be kept apart.
+    # Collect every (game, colour, count) in one pass, then take the per-colour maxima at once.
+    rows, columns, counts = [], [], []
+    for row, line in enumerate(game_file):
+        for count, color in CUBE_PATTERN.findall(line):
+            rows.append(row)
+            columns.append(COLOR_COLUMNS[color])
+            counts.append(int(count))
+
+    games = np.zeros((len(game_file), len(COLOR_COLUMNS)), dtype=np.int64)
+    np.maximum.at(games, (rows, columns), counts)
+    return games
+
+def solve(games):
+    """
+    Returns the sum of the IDs of the games that are possible with the cubes in the bag
+    """
+    # A game is possible if none of its reveals needed more cubes of a colour than the bag holds
+    print(f"Cubes in bag: {BAG_CONTENTS}")
+    bag = np.array([BAG_CONTENTS[color] for color in COLOR_COLUMNS])
+    possible_games = (games <= bag).all(axis=1)
+
+    return int((np.flatnonzero(possible_games) + 1).sum())
+
+def build_feasibility_index(games):
+    """
+    Builds an index for asking which games are possible for many different bags.
+    Each colour's distinct maxima become the levels of one axis of a 3D table, and cell
+    (r, g, b) counts the games (and sums their IDs) whose maxima are at or below the r-th red,
+    g-th green and b-th blue level. Level 0 of each axis stands for "below every game".
+    Returns (levels, counts, id_sums).
+    """
+    levels = [np.unique(games[:, column]) for column in range(games.shape[1])]
+    shape = tuple(len(color_levels) + 1 for color_levels in levels)
+
+    # Put each game in the cell for its own maxima...
+    cells = tuple(np.searchsorted(levels[column], games[:, column]) + 1
+                  for column in range(games.shape[1]))
+    counts = np.zeros(shape, dtype=np.int64)
+    id_sums = np.zeros(shape, dtype=np.int64)
+    np.add.at(counts, cells, 1)
+    np.add.at(id_sums, cells, np.arange(1, len(games) + 1))
+
+    # ...then prefix sum along every axis, so each cell covers all the games it dominates
+    for axis in range(len(shape)):
+        counts = counts.cumsum(axis=axis)
+        id_sums = id_sums.cumsum(axis=axis)
+
+    return levels, counts, id_sums
+
+def query_bags(index, bags):
+    """
+    Returns two arrays: the number of possible games and the sum of their IDs for each
+    (red, green, blue) bag, without rescanning the games
+    """
+    levels, counts, id_sums = index
+    bags = np.asarray(bags).reshape(-1, len(levels))
+
+    # A bag covers every level up to its own count of that colour
+    cells = tuple(np.searchsorted(levels[column], bags[:, column], side='right')
+                  for column in range(len(levels)))
+    return counts[cells], id_sums[cells]
+
+def main():
+    """
+    Reads in the game file and prints the sum of the possible game IDs
+    """
+    games = game_parser(FILENAME)
+    print(f"Sum of possible game IDs: {solve(games)}")
+
+if __name__ == "__main__":
+    main()
@@ -24,68 +24,53 @@
 
 import re
 
-FILENAME = 'input.txt'
+import numpy as np
 
-# Ingest input file
-try:
-    with open(FILENAME, 'r') as f:
-        data = f.read().splitlines()
-except FileNotFoundError:
-    print(f"File {FILENAME} not found.")
-    exit(1)
+FILENAME = 'input.txt'
+COLOR_COLUMNS = {'red': 0, 'green': 1, 'blue': 2}
+CUBE_PATTERN = re.compile(r'(\d+) (red|blue|green)')
 
-def game_parser(game_file):
+# Helper function to take a game text file and break it down into a table of cube counts
+def game_parser(file_name):
     """
-    Parses a game text file and returns a dictionary representation of the games.
+    Parses a game text file into an (n_games, 3) array of the most red, green and blue cubes
+    revealed at once in each game. Row i holds game i + 1.
     """
-    game_dict = {}
-    game_id = 1
+    # Ingest input file
+    try:
+        with open(file_name, 'r', encoding='utf-8') as f:
+            game_file = f.read().splitlines()
+    except (FileNotFoundError, IOError) as e:
+        raise RuntimeError(f"An error occurred: {e}") from e
 
-    # Clean up each row in the game text file and store it in a dictionary
     # Sample game string: 'Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green'
-    # Cube color revelations are separated by '; '
-    for line in game_file:
-        game_dict[game_id] = {}
-
-        # Split the string into a list of cube color revelations
-        # For instance, a reveal will look like: '3 blue, 4 red'
-        cube_reveals = line.split('; ')
-
-        # For each cube reveal string, turn it into a dictionary of cube colors and their counts
-        reveal_id = 1
-        for reveal in cube_reveals:
-            game_dict[game_id][reveal_id] = {'red': 0, 'green': 0, 'blue': 0}
-
-            # User regexp to find the number of cubes of each color
-            reveal_colors = re.findall(r'(\d+) (red|blue|green)', reveal)
-
-            for count, color in reveal_colors:
-                game_dict[game_id][reveal_id][color] = int(count)
-            reveal_id += 1
-        game_id += 1
-    return game_dict
-
-def game_power(game):
+    # Only the largest count of each colour matters, so the reveals don't need to be kept apart.
+    # Collect every (game, colour, count) in one pass, then take the per-colour maxima at once.
+    rows, columns, counts = [], [], []
+    for row, line in enumerate(game_file):
+        for count, color in CUBE_PATTERN.findall(line):
+            rows.append(row)
+            columns.append(COLOR_COLUMNS[color])
+            counts.append(int(count))
+
+    games = np.zeros((len(game_file), len(COLOR_COLUMNS)), dtype=np.int64)
+    np.maximum.at(games, (rows, columns), counts)
+    return games
+
+def solve(games):
     """
-    Calculates the "power" of a game, defined as the product of the minimum number of each color cube needed.
+    Returns the sum of the powers of all the games
     """
-    cube_minimums = {'red': 0, 'green': 0, 'blue': 0}
+    # A game's "power" is the product of the minimum number of each color cube needed, which is
+    # the most of each color it ever revealed
+    return int(games.prod(axis=1).sum())
 
-    for reveal_id, reveal in game.items():
-        for color in ['red', 'green', 'blue']:
-            if game[reveal_id][color] > cube_minimums[color]:
-                cube_minimums[color] = game[reveal_id][color]
-
-    return cube_minimums['red'] * cube_minimums['green'] * cube_minimums['blue']
-
-
-games = game_parser(data)
-
-# Sum up the game powers for each game
-sum_of_game_powers = 0
-for game in games:
-    game_power_value = game_power(games[game])
-    sum_of_game_powers += game_power_value
-    print(f"Game {game} power: {game_power_value}")
+def main():
+    """
+    Reads in the game file and prints the sum of the game powers
+    """
+    games = game_parser(FILENAME)
+    print(f"Sum of game powers: {solve(games)}")
 
-print(f"Sum of game powers: {sum_of_game_powers}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -41,82 +41,122 @@
 # Answer for sample input: 4361 Answer for input: 535235
 
 import re
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.grid import Grid
+from aoc.streaming import read_rows, sliding_rows
 
 FILENAME = 'input.txt'
 
-# Ingest input file
-try:
-    with open(FILENAME, 'r') as f:
-        data = f.read().splitlines()
-except FileNotFoundError:
-    print(f"File {FILENAME} not found.")
-    exit(1)
+NUMBER_PATTERN = re.compile(r'\d+')
+SYMBOL_PATTERN = re.compile(r'[^.\d]')
+
+def engine_parser(file_name):
+    """
+    Parses an engine file into a Grid of characters.
+    """
+    # Ingest input file
+    try:
+        with open(file_name, 'r', encoding='utf-8') as f:
+            engine_file = f.read().splitlines()
+    except (FileNotFoundError, IOError) as e:
+        raise RuntimeError(f"An error occurred: {e}") from e
+
+    return Grid.from_lines(engine_file)
 
-def engine_parser(engine_file):
+def find_symbols(engine):
     """
-    Parses an engine file into a 2D array of characters.
+    Returns a boolean mask of the engine marking every cell that holds a symbol.
+    A symbol is anything that is not a digit or a period.
     """
-    parsed_engine = []
-    for line in engine_file:
-        parsed_engine.append(list(line))
-    return parsed_engine
+    return ~engine.mask('.0123456789')
 
-def find_candidate_part_numbers(engine):
+def dilate(mask):
     """
-    Returns all candidate part numbers in an engine schematic along with their location in the engine.
-    Returns an array of part dictionaries of the form {part_number, row, col}.
+    Returns a boolean mask that's set wherever the given mask is set in the cell or any of its 8
+    neighbours. The 3x3 window is applied as a 3-wide OR along the rows and then down the columns.
     """
-    candidate_part_numbers = []
+    padded = np.pad(mask, 1)
+    across = padded[:, :-2] | padded[:, 1:-1] | padded[:, 2:]
+    return across[:-2] | across[1:-1] | across[2:]
 
-    for row_id, row in enumerate(engine):
-        engine_string = ''.join(row)
-        
-        matches = re.compile(r'\d+').finditer(engine_string)
-        for m in matches:
-            candidate_part_numbers.append({'part_number': m.group(), 'row': row_id, 'col': m.start()})
+def label_digit_runs(digits):
+    """
+    Given a boolean mask of the engine's digit cells, returns an array where each cell of a run of
+    digits holds that run's label (counting from 1), or 0 for cells outside a run, along with the
+    number of runs. Runs only join horizontally, so each run is one part number.
+    """
+    # A run starts at a digit with no digit to its left, including at the start of a row
+    run_starts = digits.copy()
+    run_starts[:, 1:] &= ~digits[:, :-1]
 
-    return candidate_part_numbers
+    digit_labels = np.cumsum(run_starts, dtype=np.int64).reshape(digits.shape)
+    digit_labels[~digits] = 0
+    return digit_labels, int(digit_labels.max(initial=0))
 
-def is_symbol(char):
+def get_run_values(engine, digit_labels, num_runs):
     """
-    Returns True if the given character is an engine 'symbol', False otherwise. Periods are not symbols.
+    Returns an array of the number each labelled run of digits spells out, indexed by label
     """
-    if(char == '.' or char.isdigit()):
-        return False
-    else:
-        return True
+    positions = np.flatnonzero(digit_labels)
+    labels = digit_labels.ravel()[positions]
+    digits = engine.cells.ravel()[positions].astype(np.int64) - ord('0')
 
-def validate_part(part, engine):
+    # Each digit is worth a power of ten given by how far it is from the last digit of its run
+    values = np.zeros(num_runs + 1, dtype=np.int64)
+    if num_runs == 0:
+        return values
+    is_last = np.append(labels[1:] != labels[:-1], True)
+    run_ends = positions[is_last]
+    place_values = 10 ** (run_ends[labels - 1] - positions)
+
+    np.add.at(values, labels, digits * place_values)
+    return values
+
+def solve(engine):
     """
-    Given a part object of the form {part_number, row, col} and an engine, checks to see if the part is valid.
-    An invalid part will have no adjacent symbols
+    Returns the sum of all the part numbers that are adjacent to a symbol.
+    Rather than checking around each part number, the symbol mask is grown by one cell in every
+    direction and the digit runs it touches are the valid parts.
     """
+    digit_labels, num_runs = label_digit_runs(engine.mask('0123456789'))
+    near_symbol = dilate(find_symbols(engine))
 
-    # Determine the boundaries of the scanning window
-    start_col = max(0, part['col'] - 1)
-    end_col = min(len(engine[part['row']]) - 1, part['col'] + len(str(part['part_number'])))
-    start_row = max(0, part['row'] - 1)
-    end_row = min(len(engine) - 1, part['row'] + 1)
+    valid_labels = np.unique(digit_labels[near_symbol & (digit_labels > 0)])
+    values = get_run_values(engine, digit_labels, num_runs)
+    print(f'{len(valid_labels)} of {num_runs} part numbers are valid.')
 
-    #print(f"Part: {part['part_number']}, Start Col: {start_col}, End Col: {end_col}, Start Row: {start_row}, End Row: {end_row}")
+    return int(values[valid_labels].sum())
 
-    # Scan the window for symbols
-    # If we have at least one valid symbol in the scan window, it's a valid part
-    for row in range(start_row, end_row + 1):
-        for col in range(start_col, end_col + 1):
-            if is_symbol(engine[row][col]):
-                return True
-    return False
+def stream_part_numbers(rows):
+    """
+    Yields each valid part number as soon as the rows above and below its row have been read.
+    Takes the schematic one row at a time and only ever holds three rows.
+    """
+    for previous, current, following in sliding_rows(rows):
+        for m in NUMBER_PATTERN.finditer(current):
+            start, end = max(0, m.start() - 1), m.end() + 1
+            if any(SYMBOL_PATTERN.search(row, start, end) for row in (previous, current, following)):
+                yield int(m.group())
 
-engine = engine_parser(data)
-candidate_part_numbers = find_candidate_part_numbers(engine)
+def solve_file(file_name):
+    """
+    Returns the sum of the valid part numbers in a schematic file, streaming it row by row
+    """
+    return sum(stream_part_numbers(read_rows(file_name)))
 
-sum_of_valid_part_numbers = 0
-for part in candidate_part_numbers:
-    if validate_part(part, engine):
-        print(f'Part {part["part_number"]} is valid.')
-        sum_of_valid_part_numbers += int(part['part_number'])
-    else:
-        print(f'Part {part["part_number"]} is invalid.')
+def main():
+    """
+    Streams in the engine schematic and prints the sum of the valid part numbers
+    """
+    print(f'Sum of valid part numbers: {solve_file(FILENAME)}')
 
-print(f'Sum of valid part numbers: {sum_of_valid_part_numbers}')
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -29,25 +29,34 @@
 # Answer for input: 79844424
 
 import re
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.grid import Grid
+from aoc.streaming import read_rows, sliding_rows
 
 FILENAME = 'input.txt'
 
-# Ingest input file
-try:
-    with open(FILENAME, 'r') as f:
-        data = f.read().splitlines()
-except FileNotFoundError:
-    print(f"File {FILENAME} not found.")
-    exit(1)
+NUMBER_PATTERN = re.compile(r'\d+')
 
-def engine_parser(engine_file):
+def engine_parser(file_name):
     """
-    Parses an engine file into a 2D array of characters.
+    Parses an engine file into a Grid of characters.
     """
-    engine = []
-    for line in engine_file:
-        engine.append(list(line))
-    return engine
+    # Ingest input file
+    try:
+        with open(file_name, 'r', encoding='utf-8') as f:
+            engine_file = f.read().splitlines()
+    except (FileNotFoundError, IOError) as e:
+        raise RuntimeError(f"An error occurred: {e}") from e
+
+    return Grid.from_lines(engine_file)
 
 def find_part_numbers(engine):
     """
@@ -57,72 +66,101 @@ def find_part_numbers(engine):
     """
     candidate_part_numbers = []
 
-    for row_id, row in enumerate(engine):
-        engine_string = ''.join(row)
-        
-        matches = re.compile(r'\d+').finditer(engine_string)
+    for row_id, engine_string in enumerate(engine.lines()):
+        matches = NUMBER_PATTERN.finditer(engine_string)
         for m in matches:
             candidate_part_numbers.append({'part_number': m.group(), 'row': row_id, 'col': m.start()})
 
     return candidate_part_numbers
 
+def label_part_numbers(engine, part_numbers):
+    """
+    Returns an array the shape of the engine where each cell holds the ID of the part number
+    covering it, or 0 if there isn't one. Part IDs count from 1 in the order of part_numbers.
+    """
+    part_labels = np.zeros(engine.shape, dtype=np.int32)
+    for part_id, part in enumerate(part_numbers, start=1):
+        part_labels[part['row'], part['col']:part['col'] + len(part['part_number'])] = part_id
+    return part_labels
+
+def get_adjacent_part_ids(part_labels, row, col):
+    """
+    Returns the IDs of the part numbers in the 8 cells around (row, col)
+    """
+    window = part_labels[max(0, row - 1):row + 2, max(0, col - 1):col + 2]
+    return set(window[window > 0].tolist())
+
 def find_candidate_gears(engine):
     """
     Returns all candidate gears in an engine schematic along with their location in the engine.
     Returns an array of gear dictionaries of the form {gear_number, row, col}.
     """
-    candidate_gears = []
-
-    for row_id, row in enumerate(engine):
-        for col_id, char in enumerate(row):
-            if(char == '*'):
-                candidate_gears.append({'gear_number': char, 'row': row_id, 'col': col_id})
+    return [{'gear_number': '*', 'row': row_id, 'col': col_id}
+            for row_id, col_id in engine.find_all('*')]
 
-    return candidate_gears
-
-def get_gear_ratio(gear, engine, part_numbers):
+def get_gear_ratio(gear, part_labels, part_numbers):
     """
-    Given a gear object of the form {gear_number, row, col}, an engine, and a list of part_numbers, returns the gear ratio.
+    Given a gear object of the form {gear_number, row, col}, the part label grid and the list of
+    part_numbers it labels, returns the gear ratio.
     """
-    adjacent_part_numbers = []
-
-    # Determine the boundaries of the scanning window
-    start_col = max(0, gear['col'] - 1)
-    end_col = min(len(engine[gear['row']]) - 1, gear['col'] + 1)
-    start_row = max(0, gear['row'] - 1)
-    end_row = min(len(engine) - 1, gear['row'] + 1)
-
-    # Find all part numbers that are adjacent to this gear
-    for part in part_numbers:
-        part_length = len(str(part['part_number']))
-
-        # Check if the part number is in this gear's row window
-        if(part['row'] >= start_row and part['row'] <= end_row):
-            # Check if the part number begins in this gear's column window
-            if(part['col'] >= start_col and part['col'] <= end_col):
-                adjacent_part_numbers.append(part)
-
-            # Check if the part number ends in this gear's column window
-            elif(part['col'] < start_col and part['col'] + part_length - 1 >= start_col):
-                adjacent_part_numbers.append(part)
+    # Only the gear's 8 neighbours need checking, rather than every part number
+    adjacent_part_ids = sorted(get_adjacent_part_ids(part_labels, gear['row'], gear['col']))
 
     # If we have exactly two adjacent part numbers, calculate the gear ratio
     # If there are not two adjacent part numbers, the gear ratio is 0 and it's not a valid gear
-    if(len(adjacent_part_numbers) == 2):
-        gear_ratio = int(adjacent_part_numbers[0]['part_number']) * int(adjacent_part_numbers[1]['part_number'])
+    if(len(adjacent_part_ids) == 2):
+        first_part, second_part = (part_numbers[part_id - 1] for part_id in adjacent_part_ids)
+        gear_ratio = int(first_part['part_number']) * int(second_part['part_number'])
     else:
         gear_ratio = 0
 
     return gear_ratio
 
-engine = engine_parser(data)
-part_numbers = find_part_numbers(engine)
-candidate_gears = find_candidate_gears(engine)
+def solve(engine):
+    """
+    Returns the sum of the gear ratios of every gear in the engine
+    """
+    part_numbers = find_part_numbers(engine)
+    part_labels = label_part_numbers(engine, part_numbers)
+    candidate_gears = find_candidate_gears(engine)
 
-sum_of_gear_ratios = 0
+    sum_of_gear_ratios = 0
 
-for gear in candidate_gears:
-    gear_ratio = get_gear_ratio(gear, engine, part_numbers)
-    sum_of_gear_ratios += gear_ratio
+    for gear in candidate_gears:
+        gear_ratio = get_gear_ratio(gear, part_labels, part_numbers)
+        sum_of_gear_ratios += gear_ratio
+
+    return sum_of_gear_ratios
+
+def stream_gear_ratios(rows):
+    """
+    Yields the gear ratio of each gear as soon as the rows above and below its row have been read.
+    Takes the schematic one row at a time and only ever holds three rows, each with its numbers.
+    """
+    numbered_rows = ((row, list(NUMBER_PATTERN.finditer(row))) for row in rows)
+    for previous, current, following in sliding_rows(numbered_rows, empty=('', [])):
+        for col, char in enumerate(current[0]):
+            if char != '*':
+                continue
+
+            # A number is adjacent if it spans any of the columns col - 1 to col + 1
+            adjacent_part_numbers = [int(m.group())
+                                     for _, matches in (previous, current, following)
+                                     for m in matches if m.start() <= col + 1 and m.end() >= col]
+            if len(adjacent_part_numbers) == 2:
+                yield adjacent_part_numbers[0] * adjacent_part_numbers[1]
+
+def solve_file(file_name):
+    """
+    Returns the sum of the gear ratios in a schematic file, streaming it row by row
+    """
+    return sum(stream_gear_ratios(read_rows(file_name)))
+
+def main():
+    """
+    Streams in the engine schematic and prints the sum of the gear ratios
+    """
+    print(f'Sum of gear ratios: {solve_file(FILENAME)}')
 
-print(f'Sum of gear ratios: {sum_of_gear_ratios}')
\ No newline at end of file
+if __name__ == "__main__":
+    main()
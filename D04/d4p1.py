@@ -34,50 +34,62 @@
 # Answer for sample input: 13
 # Answer for input: 23028
 
-FILENAME = 'input.txt'
+import numpy as np
 
-# Ingest input file
-try:
-    with open(FILENAME, 'r') as f:
-        data = f.read().splitlines()
-except FileNotFoundError:
-    print(f"File {FILENAME} not found.")
-    exit(1)
+FILENAME = 'input.txt'
 
-def card_parser(data):
+def card_parser(file_name):
     """
-    Parses a card file into a array. Each element of the array has two lists: a winning numbers list and a your numbers list 
+    Parses a card file into two integer matrices with one row per card:
+    the winning numbers and your numbers
     """
-    cards = []
+    # Ingest input file
+    try:
+        with open(file_name, 'r', encoding='utf-8') as f:
+            card_data = f.read().splitlines()
+    except (FileNotFoundError, IOError) as e:
+        raise RuntimeError(f"An error occurred: {e}") from e
+
+    if not card_data:
+        return np.zeros((0, 0), dtype=np.int64), np.zeros((0, 0), dtype=np.int64)
 
-    for line in data:
-        # Splits on the first colon to ditch the game ID string, then splits the second part on the pipe
-        # Sample string: 'Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53'
-        winning_numbers, your_numbers = line.split(':', 1)[1].split('|')
-        cards.append((
-            [int(num) for num in winning_numbers.split()],
-            [int(num) for num in your_numbers.split()]
-        ))
-    return cards
+    # Every card has the same number of winning numbers and your numbers, so the numbers after
+    # each card's colon can all be read as one flat list and cut into fixed-width rows
+    # Sample string: 'Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53'
+    winning_numbers, your_numbers = card_data[0].split(':', 1)[1].split('|')
+    num_winning = len(winning_numbers.split())
+    num_yours = len(your_numbers.split())
 
-def get_card_score(card):
+    numbers = ' '.join(line.split(':', 1)[1].replace('|', ' ') for line in card_data)
+    numbers = np.fromstring(numbers, dtype=np.int64, sep=' ')
+    numbers = numbers.reshape(len(card_data), num_winning + num_yours)
+    return numbers[:, :num_winning], numbers[:, num_winning:]
+
+def count_matches(winning_numbers, your_numbers):
     """
-    Returns the score of a card.
+    Returns the number of your numbers that are winning numbers on each card.
+    Compares every card at once, one column of winning numbers at a time.
     """
-    matches = 0
-    for num in card[1]:
-        if num in card[0]:
-            matches += 1
-
-    if(matches):
-        return 2 ** (matches - 1)
-    else:
-        return 0
+    matches = np.zeros(len(winning_numbers), dtype=np.int64)
+    for winning_column in winning_numbers.T:
+        matches += (your_numbers == winning_column[:, None]).sum(axis=1)
+    return matches
 
-cards = card_parser(data)
+def solve(cards):
+    """
+    Returns the total score of all the cards. A card with N matches scores 2 ** (N - 1),
+    or 0 with no matches, which is 1 shifted left by N and then right by 1.
+    """
+    winning_numbers, your_numbers = cards
+    matches = count_matches(winning_numbers, your_numbers)
+    return int(((1 << matches) >> 1).sum())
 
-running_total = 0
-for card in cards:
-    running_total += get_card_score(card)
+def main():
+    """
+    Reads in the card file and prints the total card score
+    """
+    cards = card_parser(FILENAME)
+    print(f"Total card score: {solve(cards)}")
 
-print(f"Total card score: {running_total}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
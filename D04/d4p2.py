@@ -54,14 +54,15 @@ It calculates the total number of scratchcards based on the rules provided.
 # Answer for sample input: 30
 # Answer for input: 9236992
 
+import numpy as np
+
 FILENAME = 'input.txt'
 
-def card_parser(file_name) -> list:
+def card_parser(file_name):
     """
-    Parses a card file into a list. Each element of the list has two lists: 
-    a winning numbers list and a your numbers list 
+    Parses a card file into two integer matrices with one row per card:
+    the winning numbers and your numbers
     """
-
     # Ingest input file
     try:
         with open(file_name, 'r', encoding='utf-8') as f:
@@ -69,48 +70,67 @@ def card_parser(file_name) -> list:
     except (FileNotFoundError, IOError) as e:
         raise RuntimeError(f"An error occurred: {e}") from e
 
-    parsed_cards = []
+    if not card_data:
+        return np.zeros((0, 0), dtype=np.int64), np.zeros((0, 0), dtype=np.int64)
 
-    for line in card_data:
-        # Splits on the first colon to ditch the game ID string,
-        # then splits the second part on the pipe
-        # Sample string: 'Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53'
-        winning_numbers, your_numbers = line.split(':', 1)[1].split('|')
-        parsed_cards.append((
-            [int(num) for num in winning_numbers.split()],
-            [int(num) for num in your_numbers.split()]
-        ))
-    return parsed_cards
+    # Every card has the same number of winning numbers and your numbers, so the numbers after
+    # each card's colon can all be read as one flat list and cut into fixed-width rows
+    # Sample string: 'Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53'
+    winning_numbers, your_numbers = card_data[0].split(':', 1)[1].split('|')
+    num_winning = len(winning_numbers.split())
+    num_yours = len(your_numbers.split())
 
-def get_card_score(card_to_score) -> int:
+    numbers = ' '.join(line.split(':', 1)[1].replace('|', ' ') for line in card_data)
+    numbers = np.fromstring(numbers, dtype=np.int64, sep=' ')
+    numbers = numbers.reshape(len(card_data), num_winning + num_yours)
+    return numbers[:, :num_winning], numbers[:, num_winning:]
+
+def count_matches(winning_numbers, your_numbers):
     """
-    Returns the score of a card. Compares "your numbers" vs. "winning numbers"
-    and returns the number of matches
+    Returns the number of your numbers that are winning numbers on each card.
+    Compares every card at once, one column of winning numbers at a time. This takes the place of
+    per-card bitmasks and popcounts, which still cost a Python loop over every card and number,
+    and it doesn't depend on the numbers being small enough to fit in a mask.
     """
-    return sum(num in card_to_score[0] for num in card_to_score[1])
+    matches = np.zeros(len(winning_numbers), dtype=np.int64)
+    for winning_column in winning_numbers.T:
+        matches += (your_numbers == winning_column[:, None]).sum(axis=1)
+    return matches
 
-def main():
+def solve(cards) -> int:
     """
-    Main function that reads the input file, parses the cards, calculates the
-    score for each card, and prints the total number of scratchcards.
+    Calculates the score for each card, cascades the card copies and returns the
+    total number of scratchcards.
     """
+    # Rather than adding N copies to each of the next Y cards one at a time, a card
+    # records +N where its run of won copies starts and -N just past where it ends.
+    # A running sum of those differences gives the copies won of each card in turn.
+    winning_numbers, your_numbers = cards
+    num_cards = len(winning_numbers)
+    copy_differences = [0] * (num_cards + 1)
+    won_copies = 0
+    total_cards = 0
 
-    cards = card_parser(FILENAME)
-
-    # Initialize card count dictionary to show we have 1 of each card initially
-    card_counts = {card_id: 1 for card_id in range(len(cards))}
-
-    # Iterate through cards, get value of each, increment subsequent card counts
-    for card_id, card in enumerate(cards):
-        score = get_card_score(card)
+    for card_id, score in enumerate(count_matches(winning_numbers, your_numbers).tolist()):
+        won_copies += copy_differences[card_id]
+        card_count = 1 + won_copies
+        total_cards += card_count
 
         # If we have N of the current card and we scored Y on it, we get N more
-        # of the next Y cards
-        for i in range(score):
-            card_counts[card_id + i + 1] += 1 * card_counts[card_id]
+        # of the next Y cards (there are no cards past the end of the table)
+        if score:
+            copy_differences[card_id + 1] += card_count
+            copy_differences[min(card_id + 1 + score, num_cards)] -= card_count
+
+    return total_cards
 
-    # Sum up card counts
-    print(f"Sum of total scratchcards: {sum(card_counts.values())}")
+def main():
+    """
+    Main function that reads the input file, parses the cards, calculates the
+    score for each card, and prints the total number of scratchcards.
+    """
+    cards = card_parser(FILENAME)
+    print(f"Sum of total scratchcards: {solve(cards)}")
 
 if __name__ == "__main__":
     main()
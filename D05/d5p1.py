@@ -133,6 +133,11 @@ location value for the list of seeds.
 # Answer for sample input: 35
 # Answer for input: 84470622
 
+import math
+from functools import cache
+
+import numpy as np
+
 FILENAME = 'input.txt'
 
 def map_parser(file_name):
@@ -176,25 +181,103 @@ def map_parser(file_name):
        
     return seeds, maps
 
-def traverse_maps(seed, maps):
+def create_map_arrays(maps):
     """
-    Traverses maps starting with the seed and returns the score of the final map.
+    Converts each map into sorted NumPy arrays of its entries' source starts, source ends and
+    offsets. The maps never change and their entries never overlap, so a sorted array and a
+    binary search is all a lookup needs.
     """
-
-    value = seed
+    map_arrays = []
     for map_instance in maps:
-        # print(f"Current map insance: {map_instance} ")
-        # Read each map entry and see if our current value is in the given entry
-        # If there are no matches, value will remain the same over a given map
-        for map_entry in map_instance:
-            destination_range_start = int(map_entry[0])
-            source_range_start = int(map_entry[1])
-            range_length = int(map_entry[2])
-
-            if value >= source_range_start and value < source_range_start + range_length:
-                value = destination_range_start + (value - source_range_start)
-                break
-    return value
+        entries = np.array(map_instance, dtype=np.int64).reshape(-1, 3)
+        dest_starts, src_starts, range_lens = entries[np.argsort(entries[:, 1])].T
+        map_arrays.append((src_starts, src_starts + range_lens, dest_starts - src_starts))
+    return map_arrays
+
+def map_range(start, end, map_array):
+    """
+    Maps the range of values [start, end) through one map and returns the list of [start, end)
+    ranges it lands on. The range is split wherever it crosses the edge of a map entry: each piece
+    inside an entry is shifted by that entry's offset, and pieces between entries map to themselves.
+    """
+    starts, ends, offsets = map_array
+    mapped_ranges = []
+
+    # Entries are sorted by start, so walk them from the first one that ends after the range starts
+    entry = int(np.searchsorted(ends, start, side='right'))
+    while entry < len(starts) and starts[entry] < end:
+        entry_start, entry_end, offset = int(starts[entry]), int(ends[entry]), int(offsets[entry])
+        if entry_start > start:
+            mapped_ranges.append((start, entry_start))
+        piece_end = min(end, entry_end)
+        mapped_ranges.append((max(start, entry_start) + offset, piece_end + offset))
+        start = piece_end
+        entry += 1
+
+    if start < end:
+        mapped_ranges.append((start, end))
+    return mapped_ranges
+
+def compose_maps(map_arrays):
+    """
+    Composes the maps into a single table from seed to location. Every map shifts each of its
+    ranges by a constant offset, so their composition does too: the table is a sorted array of the
+    seeds where the offset changes, and the offset that applies from each of them onwards.
+    """
+    # Start from the identity over every seed and push each piece through the next map in turn
+    pieces = [(0, math.inf, 0)]
+    for map_array in map_arrays:
+        composed_pieces = []
+        for start, end, offset in pieces:
+            piece_start = start
+            for mapped_start, mapped_end in map_range(start + offset, end + offset, map_array):
+                piece_end = piece_start + (mapped_end - mapped_start)
+                composed_pieces.append((piece_start, piece_end, mapped_start - piece_start))
+                piece_start = piece_end
+        pieces = composed_pieces
+
+    # Neighbouring pieces with the same offset are one piece as far as lookups are concerned
+    starts, offsets = [], []
+    for start, _, offset in pieces:
+        if not offsets or offset != offsets[-1]:
+            starts.append(start)
+            offsets.append(offset)
+    return np.array(starts, dtype=np.int64), np.array(offsets, dtype=np.int64)
+
+@cache
+def build_almanac_table(map_key):
+    """
+    Builds the seed to location table for a hashable copy of the maps, so each almanac is only
+    composed once
+    """
+    starts, offsets = compose_maps(create_map_arrays(map_key))
+    # The table is shared by every caller, so it mustn't be changed in place
+    starts.flags.writeable = False
+    offsets.flags.writeable = False
+    return starts, offsets
+
+def get_almanac_table(maps):
+    """
+    Returns the (cached) seed to location table for the maps
+    """
+    return build_almanac_table(tuple(tuple(map(tuple, map_instance)) for map_instance in maps))
+
+def lookup_locations(seeds, almanac_table):
+    """
+    Returns the locations an array of seeds map to, found for every seed at once with a single
+    binary search of the almanac table
+    """
+    starts, offsets = almanac_table
+    seeds = np.asarray(seeds, dtype=np.int64)
+    return seeds + offsets[np.searchsorted(starts, seeds, side='right') - 1]
+
+def solve(almanac):
+    """
+    Looks up every seed in the almanac at once and returns the smallest location
+    """
+    seeds, maps = almanac
+    locations = lookup_locations(seeds, get_almanac_table(maps))
+    return int(locations.min())
 
 def main():
     """
@@ -202,14 +285,10 @@ def main():
     and prints the total number of scratchcards.
     """
 
-    seeds, maps = map_parser(FILENAME)
+    almanac = map_parser(FILENAME)
 
-    locations = []
-    for seed in seeds:
-        locations.append(traverse_maps(seed,maps))
-    
     # Print the smallest mapped location
-    print(min(locations))
+    print(solve(almanac))
     
 
 if __name__ == "__main__":
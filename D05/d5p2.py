@@ -4,8 +4,11 @@ The primary difference is that we now have a range of seeds to test, rather than
 This increase in the number of seeds to test makes the naive approach of testing each seed
 in the range too slow.
 
-To speed this up, while we're mapping a given seed, we'll keep track of the largest step size that
-it's safe to make so that we can jump ahead and only evaluate the minimum number of critical seeds
+To speed this up, we use the fact that every map shifts each of its ranges by a constant offset.
+Pushing whole ranges through the maps, splitting them wherever they cross an entry's edge, composes
+all seven maps into one sorted table of pieces from seed to location. Every seed in a piece moves by
+the same offset, so the smallest location in a seed range is the smallest shifted start among the
+pieces it covers, found with a binary search into the table.
 """
 # --- Part Two ---
 # Everyone will starve if you only plant such a small number of seeds. Re-reading the almanac, 
@@ -32,11 +35,33 @@ it's safe to make so that we can jump ahead and only evaluate the minimum number
 # Answer for sample input: 46
 # Answer for input: 26714516
 
+import math
+import sys
 import time
-from intervaltree import IntervalTree
+from functools import cache
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.workers import map_tasks
 
 FILENAME = 'input.txt'
 
+# Set PARALLEL to spread the seed ranges over a pool of worker processes, with ranges of more
+# than SUBRANGE_SIZE seeds split into pieces of that size
+PARALLEL = False
+SUBRANGE_SIZE = 1 << 24
+
+# Set CROSS_CHECK to also find the smallest location by traversing the maps for every seed,
+# BATCH_SIZE seeds at a time, and check it matches. Real seed ranges hold billions of seeds, so
+# this runs on the worker pool and still takes minutes.
+CROSS_CHECK = False
+BATCH_SIZE = 1 << 20
+
 def map_parser(file_name):
     """
     Parses a map file into a list 
@@ -78,91 +103,204 @@ def map_parser(file_name):
             
     return seeds, maps
 
-def create_interval_trees(maps):
+def create_map_arrays(maps):
     """
-    This function creates interval trees from the provided maps. Each map is converted into an
-    interval tree where each interval represents a mapping from a source range to a destination
-    offset. The resulting list of interval trees is returned.
+    Converts each map into sorted NumPy arrays of its entries' source starts, source ends and
+    offsets. The maps never change and their entries never overlap, so a sorted array and a
+    binary search is all a lookup needs.
     """
-    interval_trees = []
+    map_arrays = []
     for map_instance in maps:
-        tree = IntervalTree()
-        for map_entry in map_instance:
-            dest_start, src_start, range_len = map(int, map_entry)
-            tree[src_start:src_start + range_len] = dest_start - src_start
-        interval_trees.append(tree)
-    return interval_trees
-
-def traverse_maps(seed, interval_trees):
-    """
-    Traverses maps starting with the seed and returns the score of the final map.
-    Returns the value the seed maps to as well as a step size that's safe to jump to from the seed.
-    The insight here is that the maps are all monotonically increasing, so we should be able to
-    jump ahead many seeds at once as long as we don't cross any range boundaries.
-    
-    While we're computing the mapped value, this function keeps track of the possible jump sizes
-    we could make to the end of each range, and returns the smallest of those jump sizes, which
-    guarantees we won't cross any boundaries while jumping.
-    """
-    value = seed
-    possible_step_sizes = []
-
-    for tree in interval_trees:
-        intervals = tree.at(value)
-        if intervals:
-            interval = intervals.pop()
-            possible_step_size = interval.end - value
-            value = interval.data + value
-            possible_step_sizes.append(possible_step_size)
-
-    if possible_step_sizes:
-        largest_safe_step_size = min(possible_step_sizes)
-    else:
-        largest_safe_step_size = 1
-    
-    return value, largest_safe_step_size
+        entries = np.array(map_instance, dtype=np.int64).reshape(-1, 3)
+        dest_starts, src_starts, range_lens = entries[np.argsort(entries[:, 1])].T
+        map_arrays.append((src_starts, src_starts + range_lens, dest_starts - src_starts))
+    return map_arrays
+
+def map_range(start, end, map_array):
+    """
+    Maps the range of values [start, end) through one map and returns the list of [start, end)
+    ranges it lands on. The range is split wherever it crosses the edge of a map entry: each piece
+    inside an entry is shifted by that entry's offset, and pieces between entries map to themselves.
+    """
+    starts, ends, offsets = map_array
+    mapped_ranges = []
 
+    # Entries are sorted by start, so walk them from the first one that ends after the range starts
+    entry = int(np.searchsorted(ends, start, side='right'))
+    while entry < len(starts) and starts[entry] < end:
+        entry_start, entry_end, offset = int(starts[entry]), int(ends[entry]), int(offsets[entry])
+        if entry_start > start:
+            mapped_ranges.append((start, entry_start))
+        piece_end = min(end, entry_end)
+        mapped_ranges.append((max(start, entry_start) + offset, piece_end + offset))
+        start = piece_end
+        entry += 1
 
-def process_seed_range(start_seed, end_seed, interval_trees):
+    if start < end:
+        mapped_ranges.append((start, end))
+    return mapped_ranges
+
+def compose_maps(map_arrays):
     """
-    This function processes a range of seeds from start_seed to end_seed using the provided interval
-    trees. It traverses the maps starting with each seed and returns the smallest location found in
-    the range. It optimistically jumps ahead by the largest safe step size each time so we don't
-    waste time scanning parts of the range that are monotonically increasing.
+    Composes the maps into a single table from seed to location. Every map shifts each of its
+    ranges by a constant offset, so their composition does too: the table is a sorted array of the
+    seeds where the offset changes, and the offset that applies from each of them onwards.
+    """
+    # Start from the identity over every seed and push each piece through the next map in turn
+    pieces = [(0, math.inf, 0)]
+    for map_array in map_arrays:
+        composed_pieces = []
+        for start, end, offset in pieces:
+            piece_start = start
+            for mapped_start, mapped_end in map_range(start + offset, end + offset, map_array):
+                piece_end = piece_start + (mapped_end - mapped_start)
+                composed_pieces.append((piece_start, piece_end, mapped_start - piece_start))
+                piece_start = piece_end
+        pieces = composed_pieces
+
+    # Neighbouring pieces with the same offset are one piece as far as lookups are concerned
+    starts, offsets = [], []
+    for start, _, offset in pieces:
+        if not offsets or offset != offsets[-1]:
+            starts.append(start)
+            offsets.append(offset)
+    return np.array(starts, dtype=np.int64), np.array(offsets, dtype=np.int64)
+
+@cache
+def build_almanac_table(map_key):
+    """
+    Builds the seed to location table for a hashable copy of the maps, so each almanac is only
+    composed once
+    """
+    starts, offsets = compose_maps(create_map_arrays(map_key))
+    # The table is shared by every caller, so it mustn't be changed in place
+    starts.flags.writeable = False
+    offsets.flags.writeable = False
+    return starts, offsets
+
+def get_almanac_table(maps):
+    """
+    Returns the (cached) seed to location table for the maps
+    """
+    return build_almanac_table(tuple(tuple(map(tuple, map_instance)) for map_instance in maps))
+
+def traverse_maps(seeds, map_arrays):
+    """
+    Traverses maps starting with an array of seeds and returns the locations they end up at.
+    Each map is applied to every seed at once, without the composed table, which makes this an
+    independent check on it.
+    """
+    values = np.asarray(seeds, dtype=np.int64)
+    for starts, ends, offsets in map_arrays:
+        entry = np.searchsorted(starts, values, side='right') - 1
+        in_entry = (entry >= 0) & (values < ends[entry])
+        values = values + np.where(in_entry, offsets[entry], 0)
+    return values
+
+def process_seed_range(start_seed, end_seed, almanac_table):
+    """
+    This function processes a range of seeds from start_seed to end_seed using the composed almanac
+    table and returns the smallest location found in the range. Within a piece of the table every
+    seed is shifted by the same offset, so only the first seed of each piece the range covers can be
+    the smallest, and those pieces are found with a binary search.
+    """
+    starts, offsets = almanac_table
+    first_piece = int(np.searchsorted(starts, start_seed, side='right')) - 1
+    end_piece = int(np.searchsorted(starts, end_seed, side='right'))
+
+    piece_starts = starts[first_piece:end_piece].copy()
+    piece_starts[0] = start_seed
+    return int((piece_starts + offsets[first_piece:end_piece]).min())
+
+def brute_force_seed_range(start_seed, end_seed, map_arrays, batch_size=BATCH_SIZE):
+    """
+    Returns the smallest location in a range of seeds by traversing the maps for every single seed,
+    batch_size seeds at a time. This is far slower than process_seed_range and is only used to
+    cross-check it.
     """
-    
     smallest_location = None
-    current_seed = start_seed
-    
-    while current_seed <= end_seed:
-        location, step_size = traverse_maps(current_seed, interval_trees)
-        
-        # If this is the new smallest location, store it
+    for batch_start in range(start_seed, end_seed + 1, batch_size):
+        seeds = np.arange(batch_start, min(batch_start + batch_size, end_seed + 1), dtype=np.int64)
+        location = int(traverse_maps(seeds, map_arrays).min())
         if smallest_location is None or location < smallest_location:
             smallest_location = location
-
-        current_seed = current_seed + step_size
     return smallest_location
 
+_worker_almanac = None
 
-def main():
+def init_worker(maps):
     """
-    Main function that reads the input file, parses the cards, calculates the score for each card,
-    and prints the total number of scratchcards.
+    Runs once in each worker process: builds the almanac table and map arrays from the maps
     """
-    start_time = time.time()
-    seeds, maps = map_parser(FILENAME)
+    global _worker_almanac
+    _worker_almanac = get_almanac_table(maps), create_map_arrays(maps)
+
+def find_smallest_location(start_seed, end_seed, brute_force):
+    """
+    Runs in a worker process: returns the smallest location in a range of seeds using the worker's
+    almanac, checking every seed if brute_force is set
+    """
+    almanac_table, map_arrays = _worker_almanac
+    if brute_force:
+        return brute_force_seed_range(start_seed, end_seed, map_arrays)
+    return process_seed_range(start_seed, end_seed, almanac_table)
+
+def split_seed_ranges(seeds, subrange_size=SUBRANGE_SIZE):
+    """
+    Returns the (start_seed, end_seed) of each seed range in the seeds list, with ranges of more
+    than subrange_size seeds split into pieces of that size
+    """
+    seed_ranges = []
+    for seed_range in range(0, len(seeds), 2):
+        start_seed = seeds[seed_range]
+        end_seed = start_seed + seeds[seed_range+1] - 1
+        for piece_start in range(start_seed, end_seed + 1, subrange_size):
+            seed_ranges.append((piece_start, min(piece_start + subrange_size - 1, end_seed)))
+    return seed_ranges
+
+def solve_parallel(almanac, workers=None, brute_force=False, subrange_size=SUBRANGE_SIZE):
+    """
+    Processes the seed ranges in the almanac on a pool of worker processes and returns the smallest
+    location found. The maps are sent to each worker once, when it starts, rather than with every
+    seed range.
+    """
+    seeds, maps = almanac
+    tasks = [(start_seed, end_seed, brute_force)
+             for start_seed, end_seed in split_seed_ranges(seeds, subrange_size)]
+    return min(map_tasks(5, 2, 'find_smallest_location', tasks, workers,
+                         initializer='init_worker', initargs=(maps,)))
+
+def solve(almanac):
+    """
+    Processes every seed range in the almanac and returns the smallest location found
+    """
+    seeds, maps = almanac
 
     smallest_locations = []
-    interval_trees = create_interval_trees(maps)
- 
+    almanac_table = get_almanac_table(maps)
+
     # The seeds list now contains a seed followed by a range, so we'll ingest two values at a time
     for seed_range in range(0, len(seeds), 2):
         start_seed = seeds[seed_range]
         end_seed = start_seed + seeds[seed_range+1] - 1
-        smallest_locations.append(process_seed_range(start_seed, end_seed, interval_trees))
-  
-    print(f'Smallest location found: {min(smallest_locations)}')
+        smallest_locations.append(process_seed_range(start_seed, end_seed, almanac_table))
+
+    smallest_location = min(smallest_locations)
+    if CROSS_CHECK:
+        brute_force_location = solve_parallel(almanac, brute_force=True)
+        assert smallest_location == brute_force_location, \
+            f'{smallest_location} != {brute_force_location} when checking every seed'
+    return smallest_location
+
+def main():
+    """
+    Main function that reads the almanac, finds the smallest location for every seed range (on a
+    pool of worker processes if PARALLEL is set) and prints the smallest of them.
+    """
+    start_time = time.time()
+    almanac = map_parser(FILENAME)
+    smallest_location = solve_parallel(almanac) if PARALLEL else solve(almanac)
+    print(f'Smallest location found: {smallest_location}')
     elapsed_time = time.time() - start_time
     print(f"Execution time: {round(elapsed_time*1000)}ms")
 
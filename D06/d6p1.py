@@ -1,7 +1,8 @@
 """
 This module solves Part One of Day 6's problem of the Advent of Code challenge.
-Note that this is the naive brute force approach, whereas in Part Two we use the "correct"
-constant-time solution by computing the roots of the implied polynomial.
+Each race is solved by computing the roots of the implied polynomial with exact integer math,
+and all the races are scored in one batched call. Part Two sends its single long race through the
+same ways_to_win_batch, which is kept identical in both parts so each script stays standalone.
 """
 # --- Day 6: Wait For It --- The ferry quickly brings you across Island Island. After asking around,
 # you discover that there is indeed normally a large pile of sand somewhere near here, but you don't
@@ -72,11 +73,18 @@ constant-time solution by computing the roots of the implied polynomial.
 # Answer for sample input: 288
 # Answer for input: 781200
 
+import math
+
+import numpy as np
+
 FILENAME = 'input.txt'
 
+# Past this race time, t**2 no longer fits in an int64
+MAX_BATCH_TIME = math.isqrt(np.iinfo(np.int64).max)
+
 def race_parser(file_name):
     """
-    Parses a race record file into a list 
+    Parses a race record file into a list of race times and a list of record distances
     """
 
     # Ingest input file
@@ -85,28 +93,81 @@ def race_parser(file_name):
             race_data = f.read().splitlines()
     except (FileNotFoundError, IOError) as e:
         raise RuntimeError(f"An error occurred: {e}") from e
-    
-    # Creates a list of tuples where each tuple is the time and distance of that race
-    race_results = race_data[0].split()[1:]
-    for race_id, race_distance in enumerate(race_data[1].split()[1:]):
-        race_results[race_id] = [race_results[race_id], race_distance]
 
-    return race_results
+    race_times = [int(race_time) for race_time in race_data[0].split()[1:]]
+    race_distances = [int(race_distance) for race_distance in race_data[1].split()[1:]]
+
+    return race_times, race_distances
 
-def ways_to_win(race):
+def ways_to_win(race_time, race_distance):
     """
-    Naive solution to just brute force checking each possible button hold time
+    First, solve the hold time that exactly gets you the record distance
+    hold time = record distance / (race time - hold time)
+    For example, 7 second race, 10 m distance gets you 2 = 10 / (7 - 2))
+    So you need to hold for 2 seconds to match that distance
+
+    Solving for required hold gets you two polynomial roots
+    h1 = t/2 - (t**2 - 4*r)**0.5/2
+    h2 = t/2 + (t**2 - 4*r)**0.5/2
+    So our ways to win is just the amount of integers between those values.
+    The square root is taken with math.isqrt and the hold time corrected with exact integer checks,
+    since floats can't tell neighbouring integers apart past 2**53.
     """
-    race_time = int(race[0])
-    race_distance = int(race[1])
-    
-    total_ways_to_win = 0
-    for button_hold_time in range(race_time):
-        distance = button_hold_time * (race_time - button_hold_time)
-        print(distance)
-        if distance > race_distance:
-            total_ways_to_win += 1
-    return total_ways_to_win
+    discriminant = race_time**2 - 4*race_distance
+    if discriminant <= 0:
+        return 0
+
+    # Start near h1 and step to the shortest hold that beats the record
+    hold_time = (race_time - math.isqrt(discriminant)) // 2
+    while hold_time > 0 and hold_time * (race_time - hold_time) > race_distance:
+        hold_time -= 1
+    while hold_time * (race_time - hold_time) <= race_distance and 2 * hold_time <= race_time:
+        hold_time += 1
+
+    # The winning hold times are symmetric about t/2, so the longest one is t - h1
+    return max(0, race_time - 2 * hold_time + 1)
+
+def ways_to_win_batch(race_times, race_distances):
+    """
+    Returns an array of the ways to win each race, given arrays of race times and record distances.
+    Races are solved all at once with the same integer corrections as ways_to_win, as long as
+    t**2 fits in an int64; otherwise each race goes through ways_to_win.
+    """
+    try:
+        t = np.asarray(race_times, dtype=np.int64)
+        d = np.asarray(race_distances, dtype=np.int64)
+    except OverflowError:
+        t = None
+    if t is None or (t.size and t.max() > MAX_BATCH_TIME):
+        return np.array([ways_to_win(int(race_time), int(race_distance))
+                         for race_time, race_distance in zip(race_times, race_distances)],
+                        dtype=object)
+
+    # Records that can't be beaten would make the discriminant negative (or overflow 4*d)
+    winnable = d < (t * t + 3) // 4
+    d = np.where(winnable, d, 0)
+    discriminant = t * t - 4 * d
+
+    # The float square root is within one of the exact one, so correct it with integer checks
+    root = np.floor(np.sqrt(discriminant.astype(np.float64))).astype(np.int64)
+    root -= root * root > discriminant
+    root += (root + 1) * (root + 1) <= discriminant
+
+    hold_time = (t - root) // 2
+    while (beats_record := (hold_time > 0) & (hold_time * (t - hold_time) > d)).any():
+        hold_time -= beats_record
+    while (short_of_record := (hold_time * (t - hold_time) <= d) & (2 * hold_time <= t)).any():
+        hold_time += short_of_record
+
+    return np.where(winnable, np.maximum(0, t - 2 * hold_time + 1), 0)
+
+def solve(race_results):
+    """
+    Returns the product of the ways to win each race
+    """
+    race_times, race_distances = race_results
+    # The product can outgrow an int64, so multiply as Python ints
+    return math.prod(ways_to_win_batch(race_times, race_distances).tolist())
 
 def main():
     """
@@ -115,13 +176,7 @@ def main():
     """
 
     race_results = race_parser(FILENAME)
-
-    total_ways_to_win = 1
-    # Get the product of all the ways to win    
-    for race in race_results:
-        total_ways_to_win = total_ways_to_win * ways_to_win(race)
-    
-    print(f'Total ways to win: {total_ways_to_win}')
+    print(f'Total ways to win: {solve(race_results)}')
     
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 """
 This module solves Part Two of Day 6's problem of the Advent of Code challenge.
 The main insight & improvement is that we can solve for the hold time that exactly gets us 
-the record distance by realizing that this problem is just finding the roots of a polynomial
+the record distance by realizing that this problem is just finding the roots of a polynomial.
+The solver is the same exact integer one as in Part One, copied so each script stays standalone.
 """
 # --- Part Two --- 
 # As the race is about to start, you realize the piece of paper with race times and
@@ -28,8 +29,13 @@ the record distance by realizing that this problem is just finding the roots of
 import time
 import math
 
+import numpy as np
+
 FILENAME = 'input.txt'
 
+# Past this race time, t**2 no longer fits in an int64
+MAX_BATCH_TIME = math.isqrt(np.iinfo(np.int64).max)
+
 def race_parser(file_name):
     """
     Parses a race record file into a time and distance
@@ -52,17 +58,68 @@ def ways_to_win(race_time, race_distance):
     hold time = record distance / (race time - hold time)
     For example, 7 second race, 10 m distance gets you 2 = 10 / (7 - 2))
     So you need to hold for 2 seconds to match that distance
-    
+
     Solving for required hold gets you two polynomial roots
     h1 = t/2 - (t**2 - 4*r)**0.5/2
     h2 = t/2 + (t**2 - 4*r)**0.5/2
-    So our ways to win is just the amount of integers between those values
+    So our ways to win is just the amount of integers between those values.
+    The square root is taken with math.isqrt and the hold time corrected with exact integer checks,
+    since floats can't tell neighbouring integers apart past 2**53.
     """
-        
-    h1 = math.ceil(race_time/2 - (race_time**2 - 4*race_distance)**0.5/2)
-    h2 = math.floor(race_time/2 + (race_time**2 - 4*race_distance)**0.5/2)
-    
-    return h2 - h1 + 1
+    discriminant = race_time**2 - 4*race_distance
+    if discriminant <= 0:
+        return 0
+
+    # Start near h1 and step to the shortest hold that beats the record
+    hold_time = (race_time - math.isqrt(discriminant)) // 2
+    while hold_time > 0 and hold_time * (race_time - hold_time) > race_distance:
+        hold_time -= 1
+    while hold_time * (race_time - hold_time) <= race_distance and 2 * hold_time <= race_time:
+        hold_time += 1
+
+    # The winning hold times are symmetric about t/2, so the longest one is t - h1
+    return max(0, race_time - 2 * hold_time + 1)
+
+def ways_to_win_batch(race_times, race_distances):
+    """
+    Returns an array of the ways to win each race, given arrays of race times and record distances.
+    Races are solved all at once with the same integer corrections as ways_to_win, as long as
+    t**2 fits in an int64; otherwise each race goes through ways_to_win.
+    """
+    try:
+        t = np.asarray(race_times, dtype=np.int64)
+        d = np.asarray(race_distances, dtype=np.int64)
+    except OverflowError:
+        t = None
+    if t is None or (t.size and t.max() > MAX_BATCH_TIME):
+        return np.array([ways_to_win(int(race_time), int(race_distance))
+                         for race_time, race_distance in zip(race_times, race_distances)],
+                        dtype=object)
+
+    # Records that can't be beaten would make the discriminant negative (or overflow 4*d)
+    winnable = d < (t * t + 3) // 4
+    d = np.where(winnable, d, 0)
+    discriminant = t * t - 4 * d
+
+    # The float square root is within one of the exact one, so correct it with integer checks
+    root = np.floor(np.sqrt(discriminant.astype(np.float64))).astype(np.int64)
+    root -= root * root > discriminant
+    root += (root + 1) * (root + 1) <= discriminant
+
+    hold_time = (t - root) // 2
+    while (beats_record := (hold_time > 0) & (hold_time * (t - hold_time) > d)).any():
+        hold_time -= beats_record
+    while (short_of_record := (hold_time * (t - hold_time) <= d) & (2 * hold_time <= t)).any():
+        hold_time += short_of_record
+
+    return np.where(winnable, np.maximum(0, t - 2 * hold_time + 1), 0)
+
+def solve(race):
+    """
+    Returns the ways to win the single long race
+    """
+    race_time, race_distance = race
+    return int(ways_to_win_batch([race_time], [race_distance])[0])
 
 def main():
     """
@@ -71,8 +128,8 @@ def main():
     """
     
     start_time = time.time()
-    race_time, race_distance = race_parser(FILENAME)
-    print(f'Total ways to win: {ways_to_win(race_time, race_distance)}')
+    race = race_parser(FILENAME)
+    print(f'Total ways to win: {solve(race)}')
     elapsed_time = time.time() - start_time
     print(f"Execution time: {round(elapsed_time)*1000}ms")
 
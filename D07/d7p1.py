@@ -85,6 +85,10 @@ We take advantage of Python's ability to take custom keys for sorting.
 
 FILENAME = 'input.txt'
 
+# Built once when the module loads, so solving many inputs doesn't rebuild it
+CARD_RANKS = {'A': 14, 'K': 13, 'Q': 12, 'J': 11, 'T': 10,
+              **{str(value): value for value in range(2, 10)}}
+
 def hand_parser(file_name) -> list(tuple()):
     """
     Parses a Camel Cards file into a list
@@ -150,18 +154,7 @@ def card_ranker(card: str) -> int:
     Returns the rank of a card
     """
 
-    if card == 'A':
-        return 14
-    elif card == 'K':
-        return 13
-    elif card == 'Q':
-        return 12
-    elif card == 'J':
-        return 11
-    elif card == 'T':
-        return 10
-    else:
-        return int(card)
+    return CARD_RANKS[card]
 
 def hand_ranker(hand: tuple) -> int:
     """
@@ -192,20 +185,26 @@ def hand_ranker(hand: tuple) -> int:
 
     return hand_type_value
 
-def main():
+def solve(hands) -> int:
     """
-    Main function that reads the input file, parses the hands, sorts them, and calculates
-    total winnings
+    Sorts the hands by rank and returns the total winnings
     """
-
-    hands = hand_parser(FILENAME)
     sorted_hands = sorted(hands, key=hand_ranker)
 
     winnings = 0
     for hand_rank, hand in enumerate(sorted_hands):
         winnings = winnings + (hand_rank + 1) * int(hand[1])
-        
-    print(f'Winnings: {winnings}')
+
+    return winnings
+
+def main():
+    """
+    Main function that reads the input file, parses the hands, sorts them, and calculates
+    total winnings
+    """
+
+    hands = hand_parser(FILENAME)
+    print(f'Winnings: {solve(hands)}')
     
 if __name__ == "__main__":
     main()
@@ -112,13 +112,19 @@ def traverse_map(maps, steps) -> int:
     # They'll all reach the end node at the same time
     return math.lcm(*cycle_lengths)
 
+def solve(network) -> int:
+    """
+    Traverses the maps and returns the number of steps needed
+    """
+    maps, steps = network
+    return traverse_map(maps, steps)
+
 def main():
     """
     Main function that reads the input file, parses the maps, and traverses them
     """
-    maps, steps = parse_map(FILENAME)
-    steps_needed = traverse_map(maps, steps)
-    print(f'Steps needed: {steps_needed}')
+    network = parse_map(FILENAME)
+    print(f'Steps needed: {solve(network)}')
     
 if __name__ == "__main__":
     main()
@@ -127,16 +127,21 @@ def get_next_val(sequence: list) -> int:
     
     return int(sequence[-1]) + get_next_val(diffs)
 
+def solve(sequences) -> int:
+    """
+    Returns the sum of the next values of every sequence
+    """
+    next_vals = [get_next_val(sequence) for sequence in sequences]
+    return sum(next_vals)
+
 def main():
     """
     Main function that reads the input file, parses the sequences, and sums the next values
     """
     sequences = parse_sequences(FILENAME)
 
-    next_vals = [get_next_val(sequence) for sequence in sequences]
-        
     # Display sum of next vals
-    print(f'Sum of final sequence values: {sum(next_vals)}')    
+    print(f'Sum of final sequence values: {solve(sequences)}')
      
 if __name__ == "__main__":
     main()
@@ -62,16 +62,21 @@ def get_prev_val(sequence: list) -> int:
 
     return int(sequence[0]) - get_prev_val(diffs)
 
+def solve(sequences) -> int:
+    """
+    Returns the sum of the previous values of every sequence
+    """
+    prev_vals = [get_prev_val(sequence) for sequence in sequences]
+    return sum(prev_vals)
+
 def main():
     """
     Main function that reads the input file, parses the sequences, and sums the previous values
     """
     sequences = parse_sequences(FILENAME)
 
-    prev_vals = [get_prev_val(sequence) for sequence in sequences]
-        
     # Display sum of previous vals
-    print(f'Sum of final sequence values: {sum(prev_vals)}')    
+    print(f'Sum of final sequence values: {solve(sequences)}')
      
 if __name__ == "__main__":
     main()
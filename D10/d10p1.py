@@ -107,11 +107,20 @@ in half to the get the maximum distance.
 # Answer for sample input: 4
 # Answer for input: 6923
 
+import sys
+from pathlib import Path
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.grid import Grid
+
 FILENAME = 'input.txt'
 
-def parse_maze(file_name: str) -> list[list[str]]:
+def parse_maze(file_name: str) -> Grid:
     """
-    Parses a maze file and returns a list of lists containing the maze characters
+    Parses a maze file and returns a Grid of the maze characters
     """
 
     # Ingest input file
@@ -121,12 +130,12 @@ def parse_maze(file_name: str) -> list[list[str]]:
     except (FileNotFoundError, IOError) as e:
         raise RuntimeError(f"An error occurred: {e}") from e
     
-    maze = [list(line.strip()) for line in data]
+    maze = Grid.from_lines([line.strip() for line in data])
 
     return maze
 
 
-def get_next_step(maze: list[list[str]], 
+def get_next_step(maze: Grid, 
                   current_coords: tuple[int, int], 
                   current_symbol: str, 
                   prev_coords: tuple[int,int]) -> tuple[int, int]:
@@ -145,16 +154,16 @@ def get_next_step(maze: list[list[str]],
     # Special case: If we're at the animal, we can go anywhere valid
     if current_symbol == 'S':
         # Check above
-        if current_coords[0] > 0 and maze[current_coords[0] - 1][current_coords[1]] in ['F','|','7']:
+        if current_coords[0] > 0 and maze[current_coords[0] - 1, current_coords[1]] in ['F','|','7']:
             return (current_coords[0] - 1, current_coords[1])
         # Check below
-        if current_coords[0] < len(maze) - 1 and maze[current_coords[0] + 1][current_coords[1]] in ['J','|','L']:
+        if current_coords[0] < len(maze) - 1 and maze[current_coords[0] + 1, current_coords[1]] in ['J','|','L']:
             return (current_coords[0] + 1, current_coords[1])
         # Check left
-        if current_coords[1] > 0 and maze[current_coords[0]][current_coords[1] - 1] in ['L','-','F']:
+        if current_coords[1] > 0 and maze[current_coords[0], current_coords[1] - 1] in ['L','-','F']:
             return (current_coords[0], current_coords[1] - 1)
         # Check right
-        if current_coords[1] < len(maze[0]) - 1 and maze[current_coords[0]][current_coords[1] + 1] in ['7','-','J']:
+        if current_coords[1] < maze.width - 1 and maze[current_coords[0], current_coords[1] + 1] in ['7','-','J']:
             return (current_coords[0], current_coords[1] + 1)
         else:
             return None
@@ -170,17 +179,13 @@ def get_next_step(maze: list[list[str]],
     return (current_coords[0] + symbol_directions[current_symbol][0][0], 
                 current_coords[1] + symbol_directions[current_symbol][0][1])
 
-def get_farthest_point(maze: list[list[str]]) -> int:
+def get_farthest_point(maze: Grid) -> int:
     """
     Finds the animal, then traverses maze until it cycles back to start
     Answer will be half the cycle length
     """
     # Find animal
-    animal_coords = None
-    for row_index, row in enumerate(maze):
-        print(row_index, row)
-        if 'S' in row:
-            animal_coords = (row_index, row.index('S'))
+    animal_coords = maze.find('S')
     print(animal_coords)
 
     # Traverse maze starting from the animal
@@ -198,18 +203,24 @@ def get_farthest_point(maze: list[list[str]]) -> int:
         steps_taken += 1
         prev_coords = current_coords
         current_coords = next_coords
-        current_symbol = maze[current_coords[0]][current_coords[1]]
+        current_symbol = maze[current_coords]
 
         # If we've looped back to the animal, we're done
         if current_symbol == 'S':
             return steps_taken / 2
 
+def solve(maze: Grid) -> int:
+    """
+    Returns the number of steps to get to the farthest point of the loop
+    """
+    return get_farthest_point(maze)
+
 def main():
     """
     Main function that reads the input file, parses the maze, and finds farthest point
     """
     maze = parse_maze(FILENAME)
-    print(f'Steps to get to farthest point away: {get_farthest_point(maze)}')  
+    print(f'Steps to get to farthest point away: {solve(maze)}')
      
 if __name__ == "__main__":
     main()
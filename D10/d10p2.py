@@ -117,11 +117,22 @@ or right and then filling any other junk tiles that were touched on that side.
 # 
 # Answer for input: 529
 
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.grid import Grid
+
 FILENAME = 'input.txt'
 
-def parse_maze(file_name: str) -> list[list[str]]:
+def parse_maze(file_name: str) -> Grid:
     """
-    Parses a maze file and returns a list of lists containing the maze characters
+    Parses a maze file and returns a Grid of the maze characters
     """
 
     # Ingest input file
@@ -131,12 +142,12 @@ def parse_maze(file_name: str) -> list[list[str]]:
     except (FileNotFoundError, IOError) as e:
         raise RuntimeError(f"An error occurred: {e}") from e
     
-    maze = [list(line.strip()) for line in data]
+    maze = Grid.from_lines([line.strip() for line in data])
 
     return maze
 
 
-def get_next_step(maze: list[list[str]], current_coords: tuple[int, int], current_symbol: str, prev_coords: tuple[int,int]) -> tuple[int, int]:
+def get_next_step(maze: Grid, current_coords: tuple[int, int], current_symbol: str, prev_coords: tuple[int,int]) -> tuple[int, int]:
     """
     Returns the coordinates of the next step in the maze
     """
@@ -152,16 +163,16 @@ def get_next_step(maze: list[list[str]], current_coords: tuple[int, int], curren
     # Special case: If we're at the animal, we can go anywhere valid
     if current_symbol == 'S':
         # Check above
-        if current_coords[0] > 0 and maze[current_coords[0] - 1][current_coords[1]] in ['F','|','7']:
+        if current_coords[0] > 0 and maze[current_coords[0] - 1, current_coords[1]] in ['F','|','7']:
             return (current_coords[0] - 1, current_coords[1])
         # Check below
-        if current_coords[0] < len(maze) - 1 and maze[current_coords[0] + 1][current_coords[1]] in ['J','|','L']:
+        if current_coords[0] < len(maze) - 1 and maze[current_coords[0] + 1, current_coords[1]] in ['J','|','L']:
             return (current_coords[0] + 1, current_coords[1])
         # Check left
-        if current_coords[1] > 0 and maze[current_coords[0]][current_coords[1] - 1] in ['L','-','F']:
+        if current_coords[1] > 0 and maze[current_coords[0], current_coords[1] - 1] in ['L','-','F']:
             return (current_coords[0], current_coords[1] - 1)
         # Check right
-        if current_coords[1] < len(maze[0]) - 1 and maze[current_coords[0]][current_coords[1] + 1] in ['7','-','J']:
+        if current_coords[1] < maze.width - 1 and maze[current_coords[0], current_coords[1] + 1] in ['7','-','J']:
             return (current_coords[0], current_coords[1] + 1)
         else:
             return None
@@ -175,16 +186,13 @@ def get_next_step(maze: list[list[str]], current_coords: tuple[int, int], curren
     else:
         return (current_coords[0] + symbol_directions[current_symbol][0][0], current_coords[1] + symbol_directions[current_symbol][0][1])
 
-def get_pipe_coordinates(maze: list[list[str]]) -> list[tuple[int, int]]:
+def get_pipe_coordinates(maze: Grid) -> list[tuple[int, int]]:
     """
     Finds the animal, then traverses maze until it cycles back to start
     Keeps track of coordinates of all valid pipe segments
     """
     # Find animal
-    animal_coords = None
-    for row_index, row in enumerate(maze):
-        if 'S' in row:
-            animal_coords = (row_index, row.index('S'))
+    animal_coords = maze.find('S')
 
     # Traverse maze starting from the animal
     steps_taken = 0
@@ -203,24 +211,23 @@ def get_pipe_coordinates(maze: list[list[str]]) -> list[tuple[int, int]]:
         prev_coords = current_coords
         current_coords = next_coords
         pipe_coords.append(current_coords)
-        current_symbol = maze[current_coords[0]][current_coords[1]]
+        current_symbol = maze[current_coords]
 
         # If we've looped back to the animal, we're done
         if current_symbol == 'S':
             return pipe_coords
 
-def flood_fill(maze: list[list[str]], pipe_coordinates: list[tuple[int, int]], coords_to_visit: tuple[int, int]):
+def flood_fill(maze: Grid, pipe_coordinates: list[tuple[int, int]], coords_to_visit: tuple[int, int]):
     """
     Flood fills the maze to find the enclosed tiles
     """
 
     print(f'Flood filling {coords_to_visit}')
-    for line in maze:
-        print(''.join(line))
+    print(maze)
     print("\n")
 
     # Check if tile is out of bounds
-    if coords_to_visit[0] < 0 or coords_to_visit[0] >= len(maze) or coords_to_visit[1] < 0 or coords_to_visit[1] >= len(maze[0]):
+    if not maze.in_bounds(*coords_to_visit):
         return
 
     # Check if tile is a pipe segment
@@ -228,14 +235,13 @@ def flood_fill(maze: list[list[str]], pipe_coordinates: list[tuple[int, int]], c
         return
     
     # Check if tile has already been flooded
-    if maze[coords_to_visit[0]][coords_to_visit[1]] == 'O':
+    if maze[coords_to_visit] == 'O':
         return
     
     # Mark tile as flooded
-    maze[coords_to_visit[0]][coords_to_visit[1]] = 'O'
+    maze[coords_to_visit] = 'O'
 
-    for line in maze:
-        print(''.join(line))
+    print(maze)
     print("\n")
     
     # Recursively flood fill the tile and those around it
@@ -244,65 +250,61 @@ def flood_fill(maze: list[list[str]], pipe_coordinates: list[tuple[int, int]], c
             if dx != 0 or dy != 0:  # Avoid adding the current tile
                 flood_fill(maze, pipe_coordinates, (coords_to_visit[0] + dx, coords_to_visit[1] + dy))
 
-def is_point_in_poly(maze: list[list[str]], pipe_coordinates: list[tuple[int, int]], point: tuple[int, int]) -> bool:
+def get_pipe_mask(maze: Grid, pipe_coordinates: list[tuple[int, int]]) -> np.ndarray:
     """
-    Ray casts from a point diagonally to the right to see if it intersects with the polygon
+    Returns a boolean array marking the tiles that are part of the pipe loop
     """
-    x, y = point
-    intersections = 0
-    maze_height = len(maze)
-    maze_width = len(maze[0])
+    pipe = np.zeros(maze.shape, dtype=bool)
+    pipe[tuple(zip(*pipe_coordinates))] = True
+    return pipe
 
-    # Cast the ray diagonally to the right
-    while x < maze_width and y < maze_height:
-        if (x, y) in pipe_coordinates and maze[x][y] not in ['L', '7']:
-            intersections += 1
-        x += 1
-        y += 1
-
-    #print(f'Casting ray from {point} diagonally to the right, found {intersections} intersections')
+def get_ray_crossings(maze: Grid, pipe: np.ndarray) -> np.ndarray:
+    """
+    Ray casts from every tile diagonally down and to the right and returns how many pipe segments
+    each ray crosses. Corner tiles L and 7 only graze a diagonal ray, so they don't count.
+    The count for a tile is its own crossing plus the count of the tile diagonally after it, so
+    we can fill in the whole grid one row at a time working up from the bottom.
+    """
+    crossings = (pipe & ~maze.mask('L7')).astype(np.int32)
 
-    # If the number of intersections is odd, the point is inside the polygon
-    return intersections % 2 == 1
-    
+    for row in range(maze.height - 2, -1, -1):
+        crossings[row, :-1] += crossings[row + 1, 1:]
 
+    return crossings
 
-def count_enclosed(maze: list[list[str]], pipe_coordinates: list[tuple[int, int]]) -> int:
+def count_enclosed(maze: Grid, pipe: np.ndarray) -> int:
     """
     Counts all tiles that are not marked as 'O' and are not pipe segments
     """
-    enclosed_tiles = 0
-    for row_index, row in enumerate(maze):
-        for col_index, col in enumerate(row):
-            if col != 'O' and (row_index, col_index) not in pipe_coordinates:
-                enclosed_tiles += 1
-                maze[row_index][col_index] = 'I'
-    return enclosed_tiles
+    enclosed = ~pipe & (maze.cells != Grid.code('O'))
+    maze.cells[enclosed] = Grid.code('I')
+    return int(enclosed.sum())
 
-def main():
+def solve(maze: Grid) -> int:
     """
-    Main function that reads the input file, parses the maze, and finds farthest point
+    Marks every tile that isn't part of the pipe as inside (I) or outside (O) and returns
+    the number of enclosed tiles
     """
-    maze = parse_maze(FILENAME)
-    pipe_coordinates = get_pipe_coordinates(maze)
-
-    for i in range(len(maze)):
-        for j in range(len(maze[0])):
-            if (i,j) in pipe_coordinates:
-                continue
-            if is_point_in_poly(maze, pipe_coordinates, (i, j)):
-                maze[i][j] = 'I'
-            else:
-                maze[i][j] = 'O'
+    pipe = get_pipe_mask(maze, get_pipe_coordinates(maze))
 
-    for line in maze:
-        print(''.join(line))
+    # If the number of intersections is odd, the point is inside the polygon
+    inside = get_ray_crossings(maze, pipe) % 2 == 1
+    maze.cells[~pipe & inside] = Grid.code('I')
+    maze.cells[~pipe & ~inside] = Grid.code('O')
 
     # Count the number of enclosed tiles, which will be any remaining characters that aren't flooded and aren't pipes
-    print(f'Number of enclosed tiles: {count_enclosed(maze, pipe_coordinates)}')
+    return count_enclosed(maze, pipe)
+
+def main():
+    """
+    Main function that reads the input file, parses the maze, and finds farthest point
+    """
+    maze = parse_maze(FILENAME)
+    enclosed_tiles = solve(maze)
 
+    print(maze)
 
-    #print(f'Number of enclosed tiles: {count_enclosed_tiles(maze, pipe_coordinates)}')
+    print(f'Number of enclosed tiles: {enclosed_tiles}')
      
 if __name__ == "__main__":
     main()
@@ -114,11 +114,22 @@ the sum of the absolute values of the differences of the x and y coordinates.
 # Answer for sample input: 374
 # Answer for input: 9536038
 
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.grid import Grid
+
 FILENAME = 'sample input.txt'
 
-def parse_input(file_name: str) -> list[list[str]]:
+def parse_input(file_name: str) -> Grid:
     """
-    Parses a star map file and returns a list of lists containing the star map characters
+    Parses a star map file and returns a Grid of the star map characters
     """
 
     # Ingest input file
@@ -128,61 +139,46 @@ def parse_input(file_name: str) -> list[list[str]]:
     except (FileNotFoundError, IOError) as e:
         raise RuntimeError(f"An error occurred: {e}") from e
     
-    star_map = [list(line.strip()) for line in data]
+    star_map = Grid.from_lines([line.strip() for line in data])
 
     return star_map
 
-def expand_map(star_map: list[list[str]]) -> list[list[str]]:
+def expand_map(star_map: Grid) -> Grid:
     """
     Expands the star map by adding one row/col for each row/col that doesn't contain a galaxy
     """
-    
-    new_star_map = []
-    for row in star_map:
-        new_star_map.append(row)
-        if '#' not in row:
-            new_star_map.append(['.'] * len(row))
-
-    star_map = new_star_map
-
-    star_map = new_star_map
-    added_cols = 0
-
-    new_star_map = [row.copy() for row in star_map]
+    galaxies = star_map.cells == Grid.code('#')
+    row_copies = np.where(galaxies.any(axis=1), 1, 2)
+    col_copies = np.where(galaxies.any(axis=0), 1, 2)
 
-    for col in range(len(star_map[0])):
-        if '#' not in [row[col] for row in star_map]:
-            added_cols += 1
-            for row in new_star_map:
-                row.insert(col+added_cols, '.')
+    return Grid(np.repeat(np.repeat(star_map.cells, row_copies, axis=0), col_copies, axis=1))
 
-    return new_star_map
-
-def get_galaxy_coords(star_map: list[list[str]]) -> list[tuple[int, int]]:
+def get_galaxy_coords(star_map: Grid) -> list[tuple[int, int]]:
     """
     Returns the coordinates of all the # galaxy characters in the star map
     """
-    galaxy_coords = []
-    for row_idx, row in enumerate(star_map):
-        for col_idx, col in enumerate(row):
-            if col == '#':
-                galaxy_coords.append((row_idx, col_idx))
-
-    return galaxy_coords
+    return star_map.find_all('#')
 
 def get_sum_shortest_paths(galaxy_coords: list[tuple[int, int]]) -> int:
     """
     Returns the sum of the shortest paths from the galaxy coordinates to all other galaxy 
     coordinates
+    Rows and columns add up separately, and once a list of values is sorted, the i-th smallest is
+    subtracted from the n-i-1 larger ones and has the i smaller ones subtracted from it, so it
+    contributes value * (2i - n + 1) to the sum of all pairwise differences
     """
-    shortest_paths = []
-    for i, galaxy_one in enumerate(galaxy_coords):
-        for galaxy_two in galaxy_coords[i+1:]:
-            x_diff = abs(galaxy_one[0] - galaxy_two[0])
-            y_diff = abs(galaxy_one[1] - galaxy_two[1])
-            shortest_paths.append(x_diff + y_diff)
+    galaxy_count = len(galaxy_coords)
+    weights = 2 * np.arange(galaxy_count, dtype=np.int64) - galaxy_count + 1
+    rows, cols = np.array(galaxy_coords, dtype=np.int64).reshape(-1, 2).T
 
-    return sum(shortest_paths)
+    return int((np.sort(rows) * weights).sum() + (np.sort(cols) * weights).sum())
+
+def solve(star_map: Grid) -> int:
+    """
+    Expands the star map and returns the sum of the shortest paths between all galaxies
+    """
+    star_map = expand_map(star_map)
+    return get_sum_shortest_paths(get_galaxy_coords(star_map))
 
 def main():
     """
@@ -190,13 +186,11 @@ def main():
     """
     star_map = parse_input(FILENAME)
 
-    star_map = expand_map(star_map)
     print('Expanded Star Map:')
-    for row in star_map:
-        print(''.join(row))
+    print(expand_map(star_map))
     print("\n")
 
-    print(f'Sum of shortest paths: {get_sum_shortest_paths(get_galaxy_coords(star_map))}')
+    print(f'Sum of shortest paths: {solve(star_map)}')
 
 if __name__ == "__main__":
     main()
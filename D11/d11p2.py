@@ -22,11 +22,22 @@ factors when calculating distance. There's no need to touch the map at all.
 # Answer for sample input: 1030
 # Answer for input: 447744640566
 
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.grid import Grid
+
 FILENAME = 'input.txt'
 
-def parse_input(file_name: str) -> list[list[str]]:
+def parse_input(file_name: str) -> Grid:
     """
-    Parses a star map file and returns a list of lists containing the star map characters
+    Parses a star map file and returns a Grid of the star map characters
     """
 
     # Ingest input file
@@ -36,80 +47,65 @@ def parse_input(file_name: str) -> list[list[str]]:
     except (FileNotFoundError, IOError) as e:
         raise RuntimeError(f"An error occurred: {e}") from e
     
-    star_map = [list(line.strip()) for line in data]
+    star_map = Grid.from_lines([line.strip() for line in data])
 
     return star_map
 
-def expand_map(expansion_factor: int, star_map: list[list[str]]) -> tuple[list[int], list[int]]:
+def expand_map(expansion_factor: int, star_map: Grid) -> tuple[np.ndarray, np.ndarray]:
     """
     Expands the star map by creating row/col arrays to store expansion factor for each row/col that
     doesn't contain a galaxy. Stores 1 for each row/col that contains a galaxy and does not need to
     be expanded
     """
-    row_expansions = []
-    col_expansions = []
-
-    for row in star_map:
-        if '#' not in row:
-            row_expansions.append(expansion_factor)
-        else:
-            row_expansions.append(1)
-
-    for col in range(len(star_map[0])):
-        if '#' not in [row[col] for row in star_map]:
-            col_expansions.append(expansion_factor)
-        else:
-            col_expansions.append(1)
+    galaxies = star_map.cells == Grid.code('#')
+    row_expansions = np.where(galaxies.any(axis=1), 1, expansion_factor)
+    col_expansions = np.where(galaxies.any(axis=0), 1, expansion_factor)
 
     return row_expansions, col_expansions
 
-def get_galaxy_coords(star_map: list[list[str]]) -> list[tuple[int, int]]:
+def get_galaxy_coords(star_map: Grid) -> list[tuple[int, int]]:
     """
     Returns the coordinates of all the # galaxy characters in the star map
     """
-    galaxy_coords = []
-    for row_idx, row in enumerate(star_map):
-        for col_idx, col in enumerate(row):
-            if col == '#':
-                galaxy_coords.append((row_idx, col_idx))
-
-    return galaxy_coords
+    return star_map.find_all('#')
 
 def get_sum_shortest_paths(galaxy_coords:list[tuple[int, int]], 
-                           row_expansions:list[int], 
-                           col_expansions:list[int]) -> int:
+                           row_expansions:np.ndarray, 
+                           col_expansions:np.ndarray) -> int:
     """
     Returns the sum of the shortest paths from the galaxy coordinates to all other galaxy
     coordinates
+    Each galaxy's expanded position is the total size of the rows/cols before it. Once the expanded
+    positions are sorted, the i-th smallest is subtracted from the n-i-1 larger ones and has the
+    i smaller ones subtracted from it, so it contributes position * (2i - n + 1) to the sum
     """
-    shortest_paths = []
-    for i, galaxy_one in enumerate(galaxy_coords):
-        for galaxy_two in galaxy_coords[i+1:]:
-            x_diff = sum(row_expansions[min(galaxy_one[0], galaxy_two[0]): 
-                max(galaxy_one[0], galaxy_two[0])])
-            y_diff = sum(col_expansions[min(galaxy_one[1], galaxy_two[1]):
-                max(galaxy_one[1], galaxy_two[1])])
+    rows, cols = np.array(galaxy_coords, dtype=np.int64).reshape(-1, 2).T
+    row_positions = np.concatenate(([0], np.cumsum(row_expansions, dtype=np.int64)))[rows]
+    col_positions = np.concatenate(([0], np.cumsum(col_expansions, dtype=np.int64)))[cols]
 
-            shortest_paths.append(x_diff + y_diff)
+    galaxy_count = len(galaxy_coords)
+    weights = 2 * np.arange(galaxy_count, dtype=np.int64) - galaxy_count + 1
+    return int((np.sort(row_positions) * weights).sum() + (np.sort(col_positions) * weights).sum())
 
-    return sum(shortest_paths)
+def solve(star_map: Grid, expansion_factor: int = 1000000) -> int:
+    """
+    Expands the star map by the expansion factor and returns the sum of the shortest paths
+    between all galaxies
+    """
+    row_expansions, col_expansions = expand_map(expansion_factor, star_map)
+    return get_sum_shortest_paths(get_galaxy_coords(star_map), row_expansions, col_expansions)
 
 def main():
     """
     Main function that reads the input file, parses the starmap, and finds sum of shortest paths
     """
-    expansion_factor = 1000000 
     star_map = parse_input(FILENAME)
 
     print('Star Map:') 
-    for row in star_map:
-        print(''.join(row))
+    print(star_map)
     print("\n")
 
-    row_expansions, col_expansions = expand_map(expansion_factor, star_map)
-
-    print(f'Sum of shortest paths: {get_sum_shortest_paths(get_galaxy_coords(star_map), 
-          row_expansions, col_expansions)}')
+    print(f'Sum of shortest paths: {solve(star_map)}')
 
 if __name__ == "__main__":
     main()
@@ -111,7 +111,14 @@ In part 2, we will further optimize this to get a large performance gain.
 # Answer for sample input: 21
 # Answer for input: 7110
 
-from tqdm import tqdm
+import sys
+from pathlib import Path
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import tqdm
 FILENAME = 'input.txt'
 
 def parse_input(file_name: str) -> list[list[str]]:
@@ -188,13 +195,19 @@ def get_sum_of_arrangements(spring_list, condition_list) -> int:
 
     return sum(num_arrangements)
 
+def solve(springs) -> int:
+    """
+    Returns the sum of the possible arrangements of every row of springs
+    """
+    spring_list, condition_list = springs
+    return get_sum_of_arrangements(spring_list, condition_list)
+
 def main():
     """
     Main function that reads the input file, parses the springs, and finds sum of permutations
     """
-    spring_list, condition_list = parse_input(FILENAME)
-
-    print(f'Sum of arrangements: {get_sum_of_arrangements(spring_list, condition_list)}')
+    springs = parse_input(FILENAME)
+    print(f'Sum of arrangements: {solve(springs)}')
 
 if __name__ == "__main__":
     main()
@@ -86,11 +86,20 @@ This module solves Part One of Day 13's problem of the Advent of Code challenge.
 # Answer for input: 30535
 
 import sys
-from tqdm import tqdm
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import tqdm
+from aoc.grid import Grid
 
 FILENAME = 'input.txt'
 
-def parse_input(file_name: str) -> list[list[str]]:
+def parse_input(file_name: str) -> list[Grid]:
     """
     Parses pattern records from input file
     """
@@ -110,52 +119,50 @@ def parse_input(file_name: str) -> list[list[str]]:
             pattern.append(line)
         else:
             if pattern:
-                patterns.append(pattern)
+                patterns.append(Grid.from_lines(pattern))
                 pattern = []
 
     # Append the last pattern if it wasn't followed by a blank line
     if pattern:
-        patterns.append(pattern)
+        patterns.append(Grid.from_lines(pattern))
 
     return patterns            
 
-def rotate_pattern(pattern: list[str]) -> list[str]:
+def rotate_pattern(pattern: Grid) -> Grid:
     """
-    Rotates a pattern 90 degrees clockwise
+    Turns a pattern's columns into rows so vertical reflections can be found like horizontal ones.
+    A transpose is enough: unlike a rotation it keeps the column order, and it's a view rather
+    than a copy.
     """
-    return [''.join(reversed(i)) for i in zip(*pattern)]
+    return pattern.transposed()
 
-def are_subsegments_mirrors(set_one, set_two) -> bool:
+def is_mirror_line(pattern: Grid, line: int) -> bool:
     """
-    Validates whether two sets of mirrors are valid mirrors of each other
+    Checks whether the rows above the given line mirror the rows below it, as far as the nearer
+    edge of the pattern
     """
-    for i, value in enumerate(set_one):
-        if i > len(set_two) - 1:
-            return True
-        if value != set_two[i]:
-            return False
-    
-    return True
+    reach = min(line, len(pattern) - line)
+    above = pattern.cells[line - reach:line][::-1]
+    below = pattern.cells[line:line + reach]
+    return bool(reach) and np.array_equal(above, below)
 
-def find_mirror_line(pattern: list[str]) -> int:
+def find_mirror_line(pattern: Grid) -> int:
     """
     Helper function to find a line of horizontal or vertical reflection in a pattern and return the
     index of the mirror position.
     """
     for i in range(len(pattern) - 1):
-        if pattern[i] == pattern[i+1]:
-            # We're using ::-1 to reverse the second subset for the mirror comparison
-            if are_subsegments_mirrors(pattern[0:i][::-1], pattern[i+2:]):
-                return i + 1
+        if is_mirror_line(pattern, i + 1):
+            return i + 1
     return -1
 
 
-def get_mirror_value(pattern: list[str]) -> int:
+def get_mirror_value(pattern: Grid) -> int:
     """
     Looks for a line of horizontal or vertical reflection in a pattern and returns the value of the
     mirror position.
     """
-    # Get a 90 degree rotation of the pattern so we can avoid annoying index manipulation to look
+    # Get a transposed view of the pattern so we can avoid annoying index manipulation to look
     # for vertical lines of reflection
     rotated_pattern = rotate_pattern(pattern)
 
@@ -170,17 +177,22 @@ def get_mirror_value(pattern: list[str]) -> int:
     print(f'Failed to find mirror line in pattern {pattern}')
     sys.exit(1)
 
-def main():
+def solve(patterns: list[Grid]) -> int:
     """
-    Main function that reads the pattern file, calcs sum of mirror positions
+    Returns the sum of the mirror values of every pattern
     """
-    patterns = parse_input(FILENAME)
-    
     mirror_values = []
     for pattern in tqdm(patterns):
         mirror_values.append(get_mirror_value(pattern))
 
-    print(f'Sum of mirror values: {sum(mirror_values)}')
+    return sum(mirror_values)
+
+def main():
+    """
+    Main function that reads the pattern file, calcs sum of mirror positions
+    """
+    patterns = parse_input(FILENAME)
+    print(f'Sum of mirror values: {solve(patterns)}')
 
 if __name__ == "__main__":
     main()
@@ -1,8 +1,9 @@
 """
 This module solves Part Two of Day 13's problem of the Advent of Code challenge.
 We look for the smudge in the pattern that causes a different reflection line to be valid.
-Only modification is that we need to make sure we scan for a new mirror value even if we find the
-old value, since the smudge doesn't necessarily invalidate the old pattern.
+The smudged line is the one where exactly one symbol differs across the mirror, so we count
+differences instead of flipping symbols. That also skips the old line, which has no differences,
+even though the smudge doesn't necessarily invalidate the old pattern.
 """
 # --- Part Two ---
 # You resume walking through the valley of mirrors and - SMACK! - run directly into one. Hopefully
@@ -68,11 +69,20 @@ old value, since the smudge doesn't necessarily invalidate the old pattern.
 # Answer for input: 30844
 
 import sys
-from tqdm import tqdm
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import tqdm
+from aoc.grid import Grid
 
 FILENAME = 'input.txt'
 
-def parse_input(file_name: str) -> list[list[str]]:
+def parse_input(file_name: str) -> list[Grid]:
     """
     Parses pattern records from input file
     """
@@ -92,98 +102,71 @@ def parse_input(file_name: str) -> list[list[str]]:
             pattern.append(line)
         else:
             if pattern:
-                patterns.append(pattern)
+                patterns.append(Grid.from_lines(pattern))
                 pattern = []
 
     # Append the last pattern if it wasn't followed by a blank line
     if pattern:
-        patterns.append(pattern)
+        patterns.append(Grid.from_lines(pattern))
 
     return patterns            
 
-def rotate_pattern(pattern: list[str]) -> list[str]:
+def rotate_pattern(pattern: Grid) -> Grid:
     """
-    Rotates a pattern 90 degrees clockwise
+    Turns a pattern's columns into rows so vertical reflections can be found like horizontal ones.
+    A transpose is enough: unlike a rotation it keeps the column order, and it's a view rather
+    than a copy.
     """
-   
-    return [''.join(reversed(i)) for i in zip(*pattern)]
+    return pattern.transposed()
 
-def are_subsegments_mirrors(set_one, set_two) -> bool:
+def count_mirror_differences(pattern: Grid, line: int) -> int:
     """
-    Validates whether two sets of mirrors are valid mirrors of each other
+    Counts the cells that differ between the rows above the given line and their mirror images
+    below it, as far as the nearer edge of the pattern
     """
-    for i, value in enumerate(set_one):
-        if i > len(set_two) - 1:
-            return True
-        if value != set_two[i]:
-            return False
-    
-    return True
-    
-def get_mirror_value(pattern: list[str], original_value = None) -> int:
+    reach = min(line, len(pattern) - line)
+    above = pattern.cells[line - reach:line][::-1]
+    below = pattern.cells[line:line + reach]
+    return int(np.count_nonzero(above != below))
+
+def get_smudge_value(pattern: Grid) -> int:
     """
-    Looks for a line of horizontal or vertical reflection in a pattern and returns the value of the
-    mirror position. Original Value can be passed in to ensure we will keep scanning for a mirror
-    value even if we find the original one in the first pass, due to the fact that the smudge
-    doesn't necessarily invalidate the old pattern
+    Looks for the line that the smudge is hiding and returns its mirror value.
+    Flipping one symbol can only create a new reflection line if that line mirrors everything
+    except that one symbol, so instead of flipping every symbol and rescanning the pattern we
+    look for the line with exactly one difference across it. The original line has none, so it
+    can never be picked by mistake.
     """
-    # Get a 90 degree rotation of the pattern so we can scan vertical/horizontal with one block
+    # Get a transposed view of the pattern so we can scan vertical/horizontal with one block
     # of code in one forward pass
     rotated_pattern = rotate_pattern(pattern)
 
-    # Once we find a mirrored line, validate whether the mirrored lines radiating away from both
-    # sides are also mirrored. If so, return the mirror value
     for i in range(len(pattern) - 1):
-        if pattern[i] == pattern[i+1]:
-            # We're using ::-1 to reverse the second subset for the mirror comparison
-            if are_subsegments_mirrors(pattern[0:i][::-1], pattern[i+2:]):
-                value = (i + 1) * 100
-                if not original_value or value != original_value:
-                    return value 
+        if count_mirror_differences(pattern, i + 1) == 1:
+            return (i + 1) * 100
     for i in range(len(rotated_pattern) - 1):
-        if rotated_pattern[i] == rotated_pattern[i+1]:
-            if are_subsegments_mirrors(rotated_pattern[0:i][::-1], rotated_pattern[i+2:]):
-                value = i + 1
-                if not original_value or value != original_value:
-                    return value 
+        if count_mirror_differences(rotated_pattern, i + 1) == 1:
+            return i + 1
 
-    return 0
-
-def get_smudge_value(pattern: list[str]) -> int:
-    """
-    Looks for a symbol that, if flipped, would change the mirror index of the given pattern
-    This is just doing a naive search of flipping each character and checking the mirror value
-    changes from the original. Surprisingly, this was more than fast enough and didn't require
-    caching or anything clever.
-    """
-    
-    original_mirror_value = get_mirror_value(pattern)
-    
-    # Start by trying naive solution of flipping each char and checking the mirror value
-    for i, row in enumerate(pattern):
-        for j, char in enumerate(row):
-            # Create a new row with the flipped character
-            new_row = row[:j] + ('#' if char == '.' else '.') + row[j+1:]
-            # Create a new pattern with the modified row
-            new_pattern = pattern[:i] + [new_row] + pattern[i+1:]
-            new_mirror_value = get_mirror_value(new_pattern, original_mirror_value)
-            if new_mirror_value != original_mirror_value and new_mirror_value != 0:
-                return new_mirror_value
-            
     print(f'ERROR: No smudge value found for pattern {pattern}')
     sys.exit(1)
 
-def main():
+def solve(patterns: list[Grid]) -> int:
     """
-    Main function that reads the pattern file, calcs sum of mirror positions
+    Returns the sum of the mirror values of every pattern
     """
-    patterns = parse_input(FILENAME)
-    
     mirror_values = []
     for pattern in tqdm(patterns):
         mirror_values.append(get_smudge_value(pattern))
 
-    print(f'Sum of mirror values: {sum(mirror_values)}')
+    return sum(mirror_values)
+
+def main():
+    """
+    Main function that reads the pattern file, calcs sum of mirror positions
+    """
+    patterns = parse_input(FILENAME)
+    print(f'Sum of mirror values: {solve(patterns)}')
 
 if __name__ == "__main__":
     main()
@@ -74,11 +74,23 @@ first element since the rocks stack up behind each other.
 # Answer for sample input: 136
 # Answer for input: 103614
 
-import copy
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.grid import Grid
 
 FILENAME = 'input.txt'
 
-def parse_input(file_name: str) -> list[list[str]]:
+ROUND_ROCK = Grid.code('O')
+CUBE_ROCK = Grid.code('#')
+
+def parse_input(file_name: str) -> Grid:
     """
     Parses pattern records from input file
     """
@@ -90,20 +102,32 @@ def parse_input(file_name: str) -> list[list[str]]:
     except (FileNotFoundError, IOError) as e:
         raise RuntimeError(f"An error occurred: {e}") from e
     
-    # Read all the lines into a 2D list
-    rock_map = [list(line) for line in data]
+    # Read all the lines into a grid
+    rock_map = Grid.from_lines(data)
 
     return rock_map            
 
-def rotate_rocks(rock_map: list[list[str]], rotations: int) -> list[list[str]]:
+def rotate_rocks(rock_map: Grid, rotations: int) -> Grid:
     """
-    Rotates a rock list 90 degrees clockwise for a given number of rotations
+    Rotates a rock map 90 degrees clockwise for a given number of rotations
+    The rotated map is a view, so rolling rocks on it moves them on the original map too
     """
-    for _ in range(rotations):
-        rock_map = [list(reversed(i)) for i in zip(*rock_map)]
-    return rock_map
+    return rock_map.rotated(rotations)
 
-def roll_rocks(rock_map: list[list[str]], direction:str) -> list[list[str]]:
+def roll_east(cells: np.ndarray):
+    """
+    Rolls every round rock as far east as it will go, in place
+    Each cube rock (and the start of each row) starts a new segment that rocks can't roll out of.
+    Sorting the cells by segment and then by character keeps the cube rock at the start of its
+    segment, followed by the empty spaces and then the round rocks, since '#' < '.' < 'O'.
+    """
+    new_segment = cells == CUBE_ROCK
+    new_segment[:, 0] = True
+    segments = np.cumsum(new_segment.ravel())
+    flat_cells = cells.ravel()
+    cells[...] = flat_cells[np.lexsort((flat_cells, segments))].reshape(cells.shape)
+
+def roll_rocks(rock_map: Grid, direction:str) -> Grid:
     """
     Rolls the rocks in the rock map and returns the rolled rocks
     """
@@ -112,58 +136,33 @@ def roll_rocks(rock_map: list[list[str]], direction:str) -> list[list[str]]:
     if direction == "N":
         rotations = 1
     
-    rotated_rocks = copy.deepcopy(rotate_rocks(rock_map, rotations))
+    rotated_rocks = rotate_rocks(rock_map.copy(), rotations)
     
-    width = len(rotated_rocks[0])
-    for row_id in range(len(rotated_rocks)):
-        # Scan backwards from the end of the row to the first element
-        for col_id in range(width - 2, -1, -1):
-            spaces_rolled = 0
-            # Only roll round rocks
-            if rotated_rocks[row_id][col_id] in ("#","."):
-                continue
-            # Scan from here to the end of the row to find out how far to roll
-            for col_id2 in range(col_id+1, width):
-                # We hit a stopping point
-                if rotated_rocks[row_id][col_id2] in ("#", "O"):
-                    roll_destination_col_id = col_id2 - 1
-                    break
-                # We hit the edge and should stop here
-                if col_id2 == width - 1:
-                    roll_destination_col_id = col_id2
-                    spaces_rolled += 1
-                    break
-                spaces_rolled += 1
-            # If we rolled, we need to update the column
-            if spaces_rolled > 0:
-                rotated_rocks[row_id][col_id] = "."
-                rotated_rocks[row_id][roll_destination_col_id] = "O"
+    roll_east(rotated_rocks.cells)
                 
     return rotated_rocks
 
-def compute_load(rock_map: list[list[str]]) -> int:
+def compute_load(rock_map: Grid) -> int:
     """
     Computes the total load of the rock map
     Assumes it's always rotated so that load of each rock is its column value + 1
     """
-    load = 0
-    for row in rock_map:
-        for col_id, rock in enumerate(row):
-            if rock == "O":
-                load += col_id + 1
-    return load
+    _, col_ids = np.nonzero(rock_map.cells == ROUND_ROCK)
+    return int((col_ids + 1).sum())
+
+def solve(rock_map: Grid) -> int:
+    """
+    Rolls the rocks to the north and returns the total load
+    """
+    rolled_rocks = roll_rocks(rock_map,"N")
+    return compute_load(rolled_rocks)
 
 def main():
     """
     Main function that reads the file, rolls the rocks and gets the total load
     """
     rock_map = parse_input(FILENAME)
-    
-    rolled_rocks = roll_rocks(rock_map,"N")
-    
-    load = compute_load(rolled_rocks)
-    
-    print(f'Total load: {load}')
+    print(f'Total load: {solve(rock_map)}')
 
 if __name__ == "__main__":
     main()
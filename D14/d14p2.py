@@ -64,12 +64,24 @@ of cycles. We also extended the roll_rocks function to support rolling in all fo
 # Answer for sample input: 64
 # Answer for input: 83790
 
-import copy
-from tqdm import tqdm
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import tqdm
+from aoc.grid import Grid
 
 FILENAME = 'input.txt'
 
-def parse_input(file_name: str) -> list[list[str]]:
+ROUND_ROCK = Grid.code('O')
+CUBE_ROCK = Grid.code('#')
+
+def parse_input(file_name: str) -> Grid:
     """
     Parses pattern records from input file
     """
@@ -81,63 +93,53 @@ def parse_input(file_name: str) -> list[list[str]]:
     except (FileNotFoundError, IOError) as e:
         raise RuntimeError(f"An error occurred: {e}") from e
     
-    # Read all the lines into a 2D list
-    rock_map = [list(line) for line in data]
+    # Read all the lines into a grid
+    rock_map = Grid.from_lines(data)
 
     return rock_map           
 
-def rotate_rocks(rock_map: list[list[str]], rotations: int) -> list[list[str]]:
+def rotate_rocks(rock_map: Grid, rotations: int) -> Grid:
+    """
+    Rotates a rock map 90 degrees clockwise for a given number of rotations
+    The rotated map is a view, so rolling rocks on it moves them on the original map too
+    """
+    return rock_map.rotated(rotations)
+
+def roll_east(cells: np.ndarray):
     """
-    Rotates a rock list 90 degrees clockwise for a given number of rotations
+    Rolls every round rock as far east as it will go, in place
+    Each cube rock (and the start of each row) starts a new segment that rocks can't roll out of.
+    Sorting the cells by segment and then by character keeps the cube rock at the start of its
+    segment, followed by the empty spaces and then the round rocks, since '#' < '.' < 'O'.
     """
-    for _ in range(rotations):
-        rock_map = [list(reversed(i)) for i in zip(*rock_map)]
-    return rock_map
+    new_segment = cells == CUBE_ROCK
+    new_segment[:, 0] = True
+    segments = np.cumsum(new_segment.ravel())
+    flat_cells = cells.ravel()
+    cells[...] = flat_cells[np.lexsort((flat_cells, segments))].reshape(cells.shape)
 
-def roll_rocks(rock_map: list[list[str]], direction:str) -> list[list[str]]:
+def roll_rocks(rock_map: Grid, direction:str) -> Grid:
     """
     Rolls the rocks in the rock map and returns the rolled rocks
     """
     
     rotations = {'N': 1, 'E': 0, 'S': 3, 'W': 2}
     
-    rotated_rocks = copy.deepcopy(rotate_rocks(rock_map, rotations[direction]))
-    
-    width = len(rotated_rocks[0])
-    for row_id in range(len(rotated_rocks)):
-        # Scan backwards from the end of the row to the first element
-        for col_id in range(width - 2, -1, -1):
-            spaces_rolled = 0
-            # Only roll round rocks
-            if rotated_rocks[row_id][col_id] in ("#","."):
-                continue
-            # Scan from here to the end of the row to find out how far to roll
-            for col_id2 in range(col_id+1, width):
-                # We hit a stopping point
-                if rotated_rocks[row_id][col_id2] in ("#", "O"):
-                    roll_destination_col_id = col_id2 - 1
-                    break
-                # We hit the edge and should stop here
-                if col_id2 == width - 1:
-                    roll_destination_col_id = col_id2
-                    spaces_rolled += 1
-                    break
-                spaces_rolled += 1
-            # If we rolled, we need to update the column
-            if spaces_rolled > 0:
-                rotated_rocks[row_id][col_id] = "."
-                rotated_rocks[row_id][roll_destination_col_id] = "O"
-    
-    # Rotate back to normal orientation
-    return rotate_rocks(rotated_rocks, 4 - rotations[direction])
-    
-
-def roll_rocks_one_cycle(rock_map: list[list[str]]) -> list[list[str]]:
+    rolled_rocks = rock_map.copy()
+    
+    # Rolling east on a rotated view rolls the rocks on the map itself, so there's no need to
+    # rotate back to normal orientation
+    roll_east(rotate_rocks(rolled_rocks, rotations[direction]).cells)
+    
+    return rolled_rocks
+    
+
+def roll_rocks_one_cycle(rock_map: Grid) -> Grid:
     """
     Rolls the rocks in the rock map one cycle and returns the rolled rocks
     """
     
-    rolled_rocks = copy.deepcopy(rock_map)
+    rolled_rocks = rock_map
     
     # Roll north
     rolled_rocks = roll_rocks(rolled_rocks, "N")
@@ -153,24 +155,19 @@ def roll_rocks_one_cycle(rock_map: list[list[str]]) -> list[list[str]]:
     
     return rolled_rocks
 
-def compute_load(rock_map: list[list[str]]) -> int:
+def compute_load(rock_map: Grid) -> int:
     """
     Computes the total load of the rock map
     Rocks in the top row are worth total row count - current row index
     """
-    load = 0
-    for row_id, row in enumerate(rock_map):
-        for rock in row:
-            if rock == "O":
-                load += len(rock_map) - row_id
-    return load
+    row_ids, _ = np.nonzero(rock_map.cells == ROUND_ROCK)
+    return int((len(rock_map) - row_ids).sum())
 
-def main():
+def solve(rock_map: Grid) -> int:
     """
-    Main function that reads the file, rolls the rocks and gets the total load
+    Rolls the rocks and returns the total load after 1Bn cycles
     Does cycle detection to get to 1Bn cycles without actually rolling the rocks
     """
-    rock_map = parse_input(FILENAME)
     rolled_rocks = rock_map
     
     rock_cache = {}
@@ -179,11 +176,11 @@ def main():
     cycles = 1
     cycle_start = []
     while True:
-        if str(rolled_rocks) in rock_cache:
+        if rolled_rocks.tobytes() in rock_cache:
             cycle_start = rolled_rocks
             break
         new_rolled_rocks = roll_rocks_one_cycle(rolled_rocks)
-        rock_cache[str(rolled_rocks)] = new_rolled_rocks
+        rock_cache[rolled_rocks.tobytes()] = new_rolled_rocks
         rolled_rocks = new_rolled_rocks
         cycles += 1
     
@@ -192,7 +189,7 @@ def main():
     # We can do this by rolling the rocks until we get back to the first pattern again
     cycle_period = 0
     while True:
-        rolled_rocks = rock_cache[str(rolled_rocks)]
+        rolled_rocks = rock_cache[rolled_rocks.tobytes()]
         cycle_period += 1
         if rolled_rocks == cycle_start:
             break
@@ -203,9 +200,16 @@ def main():
     # Now we need to roll the rocks the remaining number of cycles
     # We can do this by rolling the rocks until we get back to the first pattern again
     for _ in tqdm(range(needed_cycles)):
-        rolled_rocks = rock_cache[str(rolled_rocks)]
+        rolled_rocks = rock_cache[rolled_rocks.tobytes()]
     
-    print(f'{compute_load(rolled_rocks)}')
+    return compute_load(rolled_rocks)
+
+def main():
+    """
+    Main function that reads the file, rolls the rocks and gets the total load
+    """
+    rock_map = parse_input(FILENAME)
+    print(f'{solve(rock_map)}')
 
 if __name__ == "__main__":
     main()
@@ -75,6 +75,10 @@ Nothing tricky here - just following problem instructions
 
 FILENAME = 'input.txt'
 
+# HASH_TABLE[value][byte] is the next HASH value after adding a character to the current value.
+# Built once when the module loads, so solving many inputs doesn't rebuild it.
+HASH_TABLE = [[(value + byte) * 17 % 256 for byte in range(256)] for value in range(256)]
+
 def parse_input(file_name: str) -> list[list[str]]:
     """
     Parses input file
@@ -94,24 +98,27 @@ def convert_to_ascii(segment:str):
     Converts a segment of the instruction set to char_val per given rules
     """
     char_val = 0
-    for i in segment:
-        char_val += ord(i)
-        char_val *= 17
-        char_val %= 256
-        
+    for byte in segment.encode('ascii'):
+        char_val = HASH_TABLE[char_val][byte]
+
     return char_val
 
-def main():
+def solve(char_str: list[str]) -> int:
     """
-    Main function that reads the file, parses instructions
+    Returns the sum of the HASH values of every step in the initialization sequence
     """
-    char_str = parse_input(FILENAME)
-    
     total = 0
     for chars in char_str:
         total += convert_to_ascii(chars)
-        
-    print(sum) 
+
+    return total
+
+def main():
+    """
+    Main function that reads the file, parses instructions
+    """
+    char_str = parse_input(FILENAME)
+    print(solve(char_str))
 
 if __name__ == "__main__":
     main()
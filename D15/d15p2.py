@@ -113,6 +113,10 @@ Nothing tricky here - just following problem instructions
 
 FILENAME = 'input.txt'
 
+# HASH_TABLE[value][byte] is the next HASH value after adding a character to the current value.
+# Built once when the module loads, so solving many inputs doesn't rebuild it.
+HASH_TABLE = [[(value + byte) * 17 % 256 for byte in range(256)] for value in range(256)]
+
 def parse_input(file_name: str) -> list[list[str]]:
     """
     Parses input file
@@ -132,11 +136,9 @@ def convert_to_ascii(segment:str):
     Converts a segment of the instruction set to char_val per given rules
     """
     char_val = 0
-    for i in segment:
-        char_val += ord(i)
-        char_val *= 17
-        char_val %= 256
-        
+    for byte in segment.encode('ascii'):
+        char_val = HASH_TABLE[char_val][byte]
+
     return char_val
 
 def parse_instructions(instructions: list[str]) -> list[dict]:
@@ -204,12 +206,10 @@ def calculate_focusing_power(boxes, labels_to_focal_lengths):
             total_focusing_power += focusing_power
     return total_focusing_power
 
-def main():
+def solve(instructions: list[str]) -> int:
     """
-    Main function that reads the file, parses instructions
+    Runs the initialization sequence and returns the total focusing power of the lenses
     """
-    instructions = parse_input(FILENAME)
-    
     parsed_instructions = parse_instructions(instructions)
 
     # Initialize boxes and focal lengths lookup dictionary
@@ -220,7 +220,14 @@ def main():
     process_instructions(parsed_instructions, boxes, labels_to_focal_lengths)
 
     # Sum focusing power
-    print(f'Total focusing power: {calculate_focusing_power(boxes, labels_to_focal_lengths)}')    
+    return calculate_focusing_power(boxes, labels_to_focal_lengths)
+
+def main():
+    """
+    Main function that reads the file, parses instructions
+    """
+    instructions = parse_input(FILENAME)
+    print(f'Total focusing power: {solve(instructions)}')
         
 if __name__ == "__main__":
     main()
@@ -86,7 +86,17 @@ isn't enough to prune a beam.
 #
 # Your puzzle answer was 7939.
 
-from icecream import ic
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import ic
+from aoc.grid import Grid
 
 def parse_input(filename):
     """
@@ -94,8 +104,7 @@ def parse_input(filename):
     """
     
     data = open(filename).read().strip()
-    data = data.split('\n')
-    data = [[char for char in row] for row in data]
+    data = Grid.from_lines(data.split('\n'))
     
     return data
 
@@ -106,13 +115,12 @@ def processor(data):
     return data
 
 
-def main():
+def solve(data):
     """
-    Reads in the input file, processes and outputs the solution
+    Traces the beam from the top-left corner and returns the number of energized tiles
     """
-    data = parse_input("input.txt")
-    
-    energized = [[' ' for _ in range(len(data[0]))] for _ in range(len(data))]
+    energized = np.zeros(data.shape, dtype=bool)
+    rows = data.lines()
     
     beams = [(0,0,'E')]
     beams_cache = {}
@@ -124,8 +132,7 @@ def main():
             beam_row, beam_col, beam_heading = beam
             
             # Check if we're out of bounds
-            if beam_row < 0 or beam_row >= len(data) or \
-                beam_col < 0 or beam_col >= len(data[0]):
+            if not data.in_bounds(beam_row, beam_col):
                 del beams[beam_id]
                 continue
             
@@ -137,8 +144,8 @@ def main():
             else:
                 beams_cache[(beam_row, beam_col, beam_heading)] = True
             
-            tile = data[beam_row][beam_col]
-            energized[beam_row][beam_col] = '#'
+            tile = rows[beam_row][beam_col]
+            energized[beam_row, beam_col] = True
             # Case: proceed on vector
             if tile == '.' or \
                 (tile == '-' and beam_heading in ('E','W')) or \
@@ -187,7 +194,14 @@ def main():
                 continue
 
     ic(energized)
-    print(sum(row.count('#') for row in energized))
+    return int(energized.sum())
+
+def main():
+    """
+    Reads in the input file, processes and outputs the solution
+    """
+    data = parse_input("input.txt")
+    print(solve(data))
 
 if __name__ == "__main__":
     main()
@@ -46,14 +46,24 @@ energy value
 #
 # Your puzzle answer was 8318.
 
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.grid import Grid
+
 def parse_input(filename):
     """
     Reads in the input file and returns the contents
     """
     
     data = open(filename).read().strip()
-    data = data.split('\n')
-    data = [[char for char in row] for row in data]
+    data = Grid.from_lines(data.split('\n'))
     
     return data
 
@@ -62,7 +72,8 @@ def get_energy_value(data, start_beam):
     Processes the data
     """
     
-    energized = [[' ' for _ in range(len(data[0]))] for _ in range(len(data))]
+    energized = np.zeros(data.shape, dtype=bool)
+    rows = data.lines()
     beams = [start_beam]
     beams_cache = {}
  
@@ -73,8 +84,7 @@ def get_energy_value(data, start_beam):
             beam_row, beam_col, beam_heading = beam
             
             # Check if we're out of bounds
-            if beam_row < 0 or beam_row >= len(data) or \
-                beam_col < 0 or beam_col >= len(data[0]):
+            if not data.in_bounds(beam_row, beam_col):
                 del beams[beam_id]
                 continue
             
@@ -86,8 +96,8 @@ def get_energy_value(data, start_beam):
             else:
                 beams_cache[(beam_row, beam_col, beam_heading)] = True
             
-            tile = data[beam_row][beam_col]
-            energized[beam_row][beam_col] = '#'
+            tile = rows[beam_row][beam_col]
+            energized[beam_row, beam_col] = True
             # Case: proceed on vector
             if tile == '.' or \
                 (tile == '-' and beam_heading in ('E','W')) or \
@@ -135,26 +145,25 @@ def get_energy_value(data, start_beam):
                 beams[beam_id] = (beam_row, beam_col + 1, 'E')
                 continue
 
-    return sum(row.count('#') for row in energized)
+    return int(energized.sum())
 
-def main():
+def find_best_beam(data):
     """
-    Reads in the input file, processes and outputs the solution
+    Tries every entry beam along the edges and returns the highest energy value along with
+    the beam that produced it
     """
-    data = parse_input("input.txt")
-    
     best_beam = (0,0,'E')
     highest_energy = 0
     
     entry_beams = []
     # Create entry beams for top and bottom rows
-    for i in range(len(data[0])):
+    for i in range(data.width):
         entry_beams.append((0, i, 'S'))
         entry_beams.append((0, len(data) - 1, 'N'))
     # Create entry beams for left and right rows
     for j in range(len(data)):
         entry_beams.append((j, 0, 'E'))
-        entry_beams.append((j, len(data[0]) - 1, 'W'))
+        entry_beams.append((j, data.width - 1, 'W'))
     
     for beam in entry_beams:
         energy = get_energy_value(data, beam)
@@ -162,8 +171,23 @@ def main():
             highest_energy = energy
             best_beam = beam
     
+    return highest_energy, best_beam
+
+def solve(data):
+    """
+    Returns the highest energy value of any entry beam
+    """
+    highest_energy, _ = find_best_beam(data)
+    return highest_energy
+
+def main():
+    """
+    Reads in the input file, processes and outputs the solution
+    """
+    data = parse_input("input.txt")
+    highest_energy, best_beam = find_best_beam(data)
     print(highest_energy, best_beam)
-    
+
 
 if __name__ == "__main__":
     main()
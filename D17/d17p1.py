@@ -79,7 +79,17 @@ amount of steps between min and max. That made part 2 trivial, but part 1 was ve
 # Your puzzle answer was 1244.
 
 import heapq
-from icecream import ic
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import ic
+from aoc.grid import Grid
 
 def parse_input(filename):
     """
@@ -88,11 +98,39 @@ def parse_input(filename):
     
     data = open(filename).read().strip() ## Uncomment to split single-line by char: .split(',')
     lines = data.split('\n')
-    output = [[int(val) for val in row] for row in lines]
+    output = Grid.from_lines(lines)
     
     return output
 
-def get_possible_moves(data, location, vector):
+def get_heat_sums(data):
+    """
+    Returns running totals of the heat loss along every row and every column, so the heat lost
+    over a straight run of blocks is one subtraction instead of a sum over each block
+    row_sums[row][col] is the heat of the blocks in the row before col, and likewise for columns
+    """
+    heat = data.cells.astype(np.int64) - Grid.code('0')
+    row_sums = np.zeros((data.height, data.width + 1), dtype=np.int64)
+    row_sums[:, 1:] = np.cumsum(heat, axis=1)
+    col_sums = np.zeros((data.width, data.height + 1), dtype=np.int64)
+    col_sums[:, 1:] = np.cumsum(heat.T, axis=1)
+    return row_sums.tolist(), col_sums.tolist()
+
+def get_run_heat(heat_sums, location, turn, steps):
+    """
+    Returns the heat lost moving a number of steps from a location in the direction of a turn,
+    not counting the block we start on
+    """
+    row_sums, col_sums = heat_sums
+    row, col = location
+    if turn == (0, 1):
+        return row_sums[row][col + steps + 1] - row_sums[row][col + 1]
+    if turn == (0, -1):
+        return row_sums[row][col] - row_sums[row][col - steps]
+    if turn == (1, 0):
+        return col_sums[col][row + steps + 1] - col_sums[col][row + 1]
+    return col_sums[col][row] - col_sums[col][row - steps]
+
+def get_possible_moves(data, heat_sums, location, vector):
     """ 
     Helper function to return valid next steps & accumulated heat given a location and vector 
     """
@@ -122,16 +160,12 @@ def get_possible_moves(data, location, vector):
                 location[1] + (right_turn[1] * i))
         
         # Check bounds before calculating heat
-        if 0 <= left_loc[0] < len(data) and 0 <= left_loc[1] < len(data[0]):
-            left_heat = sum(data[loc[0]][loc[1]] 
-                            for loc in [(location[0] + (left_turn[0] * j), location[1] + (left_turn[1] * j)) 
-                                        for j in range(1, i+1)])
+        if data.in_bounds(*left_loc):
+            left_heat = get_run_heat(heat_sums, location, left_turn, i)
             new_locations.append([left_loc, left_vector, left_heat])
         
-        if 0 <= right_loc[0] < len(data) and 0 <= right_loc[1] < len(data[0]):
-            right_heat = sum(data[loc[0]][loc[1]] 
-                             for loc in [(location[0] + (right_turn[0] * j), location[1] + (right_turn[1] * j)) 
-                                         for j in range(1, i+1)])
+        if data.in_bounds(*right_loc):
+            right_heat = get_run_heat(heat_sums, location, right_turn, i)
             new_locations.append([right_loc, right_vector, right_heat])
     
     return new_locations
@@ -142,11 +176,12 @@ def dijkstra(data):
     the final cell
     """
     queue = [(0, (0, 0), 'E')]  # (heat_loss, location, vector)
+    heat_sums = get_heat_sums(data)
 
     # Initialize the minimum heat loss at each node to infinity
     min_heat_loss = [[[float('inf') for _ in range(4)] 
-                      for _ in range(len(data[0]))] 
-                     for _ in range(len(data))]
+                      for _ in range(data.width)] 
+                     for _ in range(data.height)]
 
     # The minimum heat loss at the starting node is 0
     min_heat_loss[0][0][0] = 0  # 0 for 'E'
@@ -155,7 +190,7 @@ def dijkstra(data):
         heat_loss, location, vector = heapq.heappop(queue)
         
         # For each valid next step
-        for new_loc, new_vector, new_heat_loss in get_possible_moves(data, location, vector):
+        for new_loc, new_vector, new_heat_loss in get_possible_moves(data, heat_sums, location, vector):
             vector_index = {'E': 0, 'N': 1, 'W': 2, 'S': 3}[new_vector]
 
             # Calculate the new heat loss
@@ -172,6 +207,7 @@ def dijkstra(data):
     return min(min_heat_loss[-1][-1])
 
 def debug_drive(data):
+    heat_sums = get_heat_sums(data)
     location = (0,0)
     vector = 'E'
     heat = 0
@@ -179,7 +215,7 @@ def debug_drive(data):
     while(True):
         print(f'You\'re at {location} facing {vector}. Heat is {heat}')
 
-        ways_to_go = get_possible_moves(data, location, vector)
+        ways_to_go = get_possible_moves(data, heat_sums, location, vector)
         for way_id, way in enumerate(ways_to_go):
             print(f'{way_id+1}. You can go to {way[0]} facing {way[1]}. Heat cost: {way[2]}')
         choice = input('Which way? ')
@@ -190,18 +226,24 @@ def debug_drive(data):
         vector = ways_to_go[int(choice)-1][1]
         path.append((location, vector))
         heat += ways_to_go[int(choice)-1][2]
-        data[location[0]][location[1]] = 0
+        data[location] = '0'
         # Print the grid
-        for row in data:
+        for row in data.lines():
             ic(row)
             
 
+def solve(data):
+    """
+    Returns the minimum heat loss to get from the top-left to the bottom-right block
+    """
+    return dijkstra(data)
+
 def main():
     """
     Reads in the input file, processes and outputs the solution
     """
     data = parse_input("input.txt")
-    heat_loss = dijkstra(data)
+    heat_loss = solve(data)
     print(heat_loss)
 
 if __name__ == "__main__":
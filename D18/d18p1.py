@@ -68,8 +68,14 @@ the point-in-poly approach takes 5+ mins to run.
 #
 # Your puzzle answer was 38188
 
-from icecream import ic
-from tqdm import tqdm
+import sys
+from pathlib import Path
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import ic, tqdm
 
 def parse_input(filename):
     """
@@ -174,26 +180,20 @@ def is_corner(point, grid):
         return True
     return False
 
+def solve(instructions):
+    """
+    Digs the trench, fills in the interior and returns the number of dug out tiles
+    """
+    grid, edges = dig(instructions)
+    infill(grid, edges)
+    return sum(char != '.' for row in grid for char in row)
+
 def main():
     """
     Reads in the input file, processes and outputs the solution
     """
     instructions = parse_input("sample.txt")
-    grid, edges = dig(instructions)
-    print(edges)
-    ic(grid)
-    infill(grid, edges)
-    
-    count_tiles = 0
-    for row in grid:
-        for char in row:
-            if char == '.':
-                print('.', end='')
-            else:
-                print('#', end='')
-                count_tiles += 1
-        print()
-    print(count_tiles)
+    print(solve(instructions))
 
 if __name__ == "__main__":
     main()
@@ -44,7 +44,14 @@ sum the interior points and boundary points to get the total area of the polygon
 #
 # Your puzzle answer was 93325849869340.
 
-from icecream import ic
+import sys
+from pathlib import Path
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import ic
 
 def parse_input(filename):
     """
@@ -109,12 +116,18 @@ def get_shoelace_area(vertices):
     area = abs(area) / 2.0
     return area
 
+def solve(instructions):
+    """
+    Returns the area of the lagoon dug out by the instructions
+    """
+    return dig(instructions)
+
 def main():
     """
     Reads in the input file, processes and outputs the solution
     """
     instructions = parse_input("input.txt")
-    area = dig(instructions)
+    area = solve(instructions)
     print(area)
 
 if __name__ == "__main__":
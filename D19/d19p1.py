@@ -73,7 +73,14 @@ bubble up the final results of the rule chain back to the original caller.
 #
 # Your puzzle answer was 397134
 
-from icecream import ic
+import sys
+from pathlib import Path
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import ic
 
 def parse_input(filename):
     """
@@ -148,13 +155,20 @@ def run_instruction(part, rule_dict, rules):
                 return 'R'
             return run_instruction(part, rule_dict, rule_dict[test_destination])
 
+def solve(parts_and_rules):
+    """
+    Returns the sum of the ratings of all the accepted parts
+    """
+    part_list, rule_dict = parts_and_rules
+    return run_instructions(part_list, rule_dict)
+
 def main():
     """
     Reads in the input file, processes and outputs the solution
     """
-    part_list, rule_dict = parse_input("input.txt")
+    parts_and_rules = parse_input("input.txt")
     
-    run_instructions(part_list, rule_dict)
+    solve(parts_and_rules)
 
 if __name__ == "__main__":
     main()
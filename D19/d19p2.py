@@ -22,7 +22,14 @@ of permutations in each interval set.
 # is no longer relevant. How many distinct combinations of ratings will be accepted by the Elves'
 # workflows?
 
-from icecream import ic
+import sys
+from pathlib import Path
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import ic
 
 MIN_VAL = 1
 MAX_VAL = 4000
@@ -169,13 +176,19 @@ def find_accepted_combinations(rule_dict):
     
     return total_combinations
 
+def solve(rule_dict):
+    """
+    Returns the number of distinct combinations of ratings that will be accepted
+    """
+    return find_accepted_combinations(rule_dict)
+
 def main():
     """
     Reads in the input file, processes and outputs the solution
     """
     rule_dict = parse_input("input.txt")
     
-    print(f'Total combinations: {find_accepted_combinations(rule_dict)}')
+    print(f'Total combinations: {solve(rule_dict)}')
     
     return
 
@@ -151,7 +151,14 @@ A stack is used to manage the signals being sent and received.
 # Your puzzle answer was 873301506.
 
 import heapq
-from icecream import ic
+import sys
+from pathlib import Path
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import ic
 
 def parse_input(filename):
     """
@@ -271,15 +278,20 @@ def push_button(modules):
         else:
             break
             
-    ic(pulses_sent['low'] * pulses_sent['high'])
-    return
+    return ic(pulses_sent['low'] * pulses_sent['high'])
+
+def solve(modules):
+    """
+    Pushes the button 1000 times and returns the product of the low and high pulses sent
+    """
+    return push_button(modules)
 
 def main():
     """
     Reads in the input file, processes and outputs the solution
     """
     modules = parse_input("input.txt")
-    push_button(modules)
+    solve(modules)
 
 if __name__ == "__main__":
     main()
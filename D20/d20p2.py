@@ -7,10 +7,14 @@ turns on the final module. Also added a bit of code to visualize the modules as
 """
 import heapq
 import math
-from icecream import ic
-import graphviz
+import sys
+from pathlib import Path
 
-modules = {}
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import ic
 
 def parse_input(filename):
     """
@@ -20,6 +24,7 @@ def parse_input(filename):
         data = file.read().splitlines()
     
     # Create initial modules list
+    modules = {}
     for line in data:
         category = None
         label = None
@@ -60,7 +65,7 @@ def parse_input(filename):
 
     return modules
 
-def process_signal(sender, strength, receiver):
+def process_signal(sender, strength, receiver, modules):
     """
     Given a signal strength and destination, process the signal and return a list of new signals
     """
@@ -113,7 +118,7 @@ def process_signal(sender, strength, receiver):
     ic(modules)
     return
 
-def push_button():
+def push_button(modules):
     """
     Sends initial pulse and traces out the signals
     """
@@ -131,7 +136,7 @@ def push_button():
             new_signals = []
             sender, strength, receiver = heapq.heappop(queue)
             pulses_sent[strength] += 1
-            new_signals = process_signal(sender, strength, receiver)
+            new_signals = process_signal(sender, strength, receiver, modules)
             for signal in new_signals:
                 heapq.heappush(queue, signal)
 
@@ -142,16 +147,19 @@ def push_button():
                     print(f'High pulse sent from {signal[0]} after {times_button_pressed} button presses')
                     if len(high_pri_signals) == 4:
                         print(f'High pulse sent from all modules: {high_pri_signals}')
-                        print(f'LCM of pulses: {math.lcm(*[signal for signal in high_pri_signals])}')
-                        return
+                        lcm = math.lcm(*[signal for signal in high_pri_signals])
+                        print(f'LCM of pulses: {lcm}')
+                        return lcm
         else:
             # We can push the button again if no signals in queue
             times_button_pressed += 1
             heapq.heappush(queue, ('button', 'low', 'broadcaster'))
     return
 
-def visualize_modules():
+def visualize_modules(modules):
     """ Code from Eugene to export graphviz notation of modules for render """
+    import graphviz
+
     dot = graphviz.Digraph(comment="Modules")
     for name, module in modules.items():
         # flip is red, conj is blue
@@ -166,13 +174,19 @@ def visualize_modules():
     with open('digraph.txt', 'w') as f:
         f.write(dot.source)
 
+def solve(modules):
+    """
+    Returns the number of button presses needed to send a low pulse to rx
+    """
+    return push_button(modules)
+
 def main():
     """
     Reads in the input file, processes and outputs the solution
     """
-    parse_input("input.txt")
-    visualize_modules()
-    push_button()
+    modules = parse_input("input.txt")
+    visualize_modules(modules)
+    solve(modules)
 
 if __name__ == "__main__":
     main()
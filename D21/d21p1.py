@@ -96,7 +96,17 @@ Just a simple iterative approach to parse every possible location, get its next
 # Starting from the garden plot marked S on your map, how many garden plots could the Elf reach in
 # exactly 64 steps?
 
-from icecream import ic
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import ic
+from aoc.grid import Grid
 
 def parse_input(filename):
     """
@@ -105,71 +115,60 @@ def parse_input(filename):
     with open(filename, 'r') as file:
         data = file.read().splitlines()
 
-    return ic(data)
+    return ic(Grid.from_lines(data))
+
+def take_step(positions, open_tiles):
+    """
+    Returns every position one step north, south, east or west of any of the current positions
+    that isn't a rock. Positions are a boolean array the same shape as the garden.
+    """
+    next_positions = np.zeros_like(positions)
+    next_positions[1:] |= positions[:-1]
+    next_positions[:-1] |= positions[1:]
+    next_positions[:, 1:] |= positions[:, :-1]
+    next_positions[:, :-1] |= positions[:, 1:]
+    return next_positions & open_tiles
 
 def find_steps(garden):
     """
     Steps through the garden array and returns the number of possible positions after 64 steps
     """
-    
     # Find the starting position, marked by 'S' in the grid:
-    start_row = None
-    start_col = None
-    for row, line in enumerate(garden):
-        if 'S' in line:
-            start_row = row
-            start_col = line.index('S')
-            break
-    
-    position = (start_row, start_col)
+    open_tiles = garden.cells != Grid.code('#')
+    current_positions = np.zeros(garden.shape, dtype=bool)
+    current_positions[garden.find('S')] = True
 
-    current_positions = [position]
     steps_taken = 0
-    
     while True:
         # Find all possible positions we can reach in the next step
         # This is any position that is one step north, south, east, or west of any possible
-        # Locations we could have been at right now
-        next_positions = []
-        for pos in current_positions:
-            for new_row, new_col in [(pos[0],pos[1]+1),
-                                     (pos[0],pos[1]-1),
-                                     (pos[0]+1,pos[1]),
-                                     (pos[0]-1,pos[1])]:
-                if is_valid_position(garden, (new_row, new_col)):
-                    next_positions.append((new_row, new_col))
-                
-        current_positions = set(next_positions)
+        # Locations we could have been at right now. Positions are a boolean grid, so
+        # they're de-duped for free
+        current_positions = take_step(current_positions, open_tiles)
+
         steps_taken += 1
 
-        
         # If we can't move anywhere, we're done
-        if not next_positions:
+        if not current_positions.any():
             break
+
         if steps_taken == 64:
             break
-        
-    return len(current_positions)
 
-def is_valid_position(garden, position):
+    return int(current_positions.sum())
+
+def solve(garden):
     """
-    Checks if a given position is valid to step to in the garden
+    Returns the number of garden plots the elf can reach
     """
-    row, col = position
-    if row < 0 or row >= len(garden):
-        return False
-    if col < 0 or col >= len(garden[0]):
-        return False
-    if garden[row][col] == '#':
-        return False
-    return True
+    return find_steps(garden)
 
 def main():
     """
     Reads in the input file, processes and outputs the solution
     """
     garden = parse_input("input.txt")
-    print(find_steps(garden))
+    print(solve(garden))
 
 if __name__ == "__main__":
     main()
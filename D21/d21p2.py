@@ -74,7 +74,21 @@ freeze all the inner tiles.
 # your infinite map, how many garden plots could the Elf reach in exactly 26501365 steps?
 #
 
-from icecream import ic
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import enabled, ic
+from aoc.grid import Grid
+
+STEPS = 1000
+# New-tile events are logged next to this script while debug output is on
+LOG_FILE = Path(__file__).resolve().parent / 'output.log'
 
 def parse_input(filename):
     """
@@ -83,115 +97,79 @@ def parse_input(filename):
     with open(filename, 'r') as file:
         data = file.read().splitlines()
     
-    return data
-
-def update_sub_position(position, garden):
-    """
-    Helper to do inner loop of position update for caching purposes.
-    Outside function retains the tile offset
-    """
-    next_positions = []
-    for row_offset, col_offset in [(0,1),(0,-1),(1,0),(-1,0)]:
-        new_row = position[0] + row_offset
-        new_col = position[1] + col_offset
-        new_row_tile_offset = position[2]
-        new_col_tile_offset = position[3]
-        # Since map is now infinite, we handle out of bounds by jumping to the other side
-        # of the same tile
-        if new_row < 0:
-            new_row = len(garden) - 1
-            new_row_tile_offset -= 1
-        elif new_row >= len(garden):
-            new_row = 0
-            new_row_tile_offset += 1
-        if new_col < 0:
-            new_col = len(garden[0]) - 1
-            new_col_tile_offset -= 1
-        elif new_col >= len(garden[0]):
-            new_col = 0
-            new_col_tile_offset += 1
-        if garden[new_row][new_col] == '#':
-            continue
-        next_positions.append((new_row, new_col, new_row_tile_offset, new_col_tile_offset))
-    return next_positions
+    return Grid.from_lines(data)
 
-def update_position(position, garden):
+def take_step(positions, open_tiles):
     """
-    Given a position, returns a list of all possible positions that can be reached from that
-    position in one step
+    Returns every position one step north, south, east or west of any of the current positions
+    that isn't a rock. Positions are a boolean array the same shape as the garden.
     """
-    next_positions = []
-    
-    stripped_position = (position[0], position[1], 0, 0)
-    next_positions = update_sub_position(stripped_position, garden)
-    
-    return [(pos[0], pos[1], pos[2] + position[2], pos[3] + position[3]) for pos in next_positions]
-    
+    next_positions = np.zeros_like(positions)
+    next_positions[1:] |= positions[:-1]
+    next_positions[:-1] |= positions[1:]
+    next_positions[:, 1:] |= positions[:, :-1]
+    next_positions[:, :-1] |= positions[:, 1:]
+    return next_positions & open_tiles
 
 def find_steps(garden):
     """ Calculates possible places elf can be in the garden after N steps """
     
-    # Find the starting position, marked by 'S' in the grid:
-    start_row = None
-    start_col = None
-    for row, line in enumerate(garden):
-        if 'S' in line:
-            start_row = row
-            start_col = line.index('S')
-            break
-    
-    # We add tile offsets to the starting position to keep track of where we are on the infinite
-    # tile grid, to make sure that equivalent positions on different tiles are not considered the
-    # same location
-    row_tile_offset = 0
-    col_tile_offset = 0
-    position = (start_row, start_col, row_tile_offset, col_tile_offset)
+    # The map is infinite, but after N steps we can't be more than N tiles away from the start,
+    # so a big enough patch of copies of the garden around the starting copy behaves the same.
+    # Keeping every copy in one big array makes sure that equivalent positions on different
+    # tiles are not considered the same location
+    reach = STEPS // min(garden.shape) + 1
+    copies = 2 * reach + 1
+    open_tiles = np.tile(garden.cells != Grid.code('#'), (copies, copies))
+
+    # Find the starting position, marked by 'S' in the grid, in the middle copy
+    start_row, start_col = garden.find('S')
+    current_positions = np.zeros(open_tiles.shape, dtype=bool)
+    current_positions[start_row + reach * garden.height, start_col + reach * garden.width] = True
     
     steps_taken = 0
-
-    current_positions = set([position])
     num_active_tiles = 1
     
     while True:
         # Find all possible positions we can reach in the next step
         # This is any position that is one step north, south, east, or west of any possible
         # Locations we could have been at right now
-        next_positions = set()
-        for position in current_positions:
-            next_positions.update(update_position(position, garden))
-                
-        # set() de-dupes the list of positions
-        current_positions = next_positions
+        current_positions = take_step(current_positions, open_tiles)
         
         steps_taken += 1
 
-        tile_counts = {}
-        for pos in current_positions:
-            tile = (pos[2], pos[3])
-            if tile not in tile_counts:
-                tile_counts[tile] = 0
-            tile_counts[tile] += 1
+        # Count the positions in each copy of the garden, labelled by its offset from the start
+        tile_counts = current_positions.reshape(copies, garden.height, copies, garden.width)
+        tile_counts = tile_counts.sum(axis=(1, 3))
         
         # Write critical inflection points to log (if we've reached a new tile)
-        if len(tile_counts) > num_active_tiles:
-            num_active_tiles = len(tile_counts) 
+        if np.count_nonzero(tile_counts) > num_active_tiles:
+            num_active_tiles = np.count_nonzero(tile_counts)
         
-            with open('output.log', 'a') as f:
-                f.write(f'{steps_taken}: Total reachable {len(current_positions)}\n')
-                for tile, count in tile_counts.items():
-                    f.write(f'Tile {tile}: {count} positions\n')
+            if enabled():
+                with open(LOG_FILE, 'a', encoding='utf-8') as f:
+                    f.write(f'{steps_taken}: Total reachable {tile_counts.sum()}\n')
+                    for row_offset, col_offset in zip(*np.nonzero(tile_counts)):
+                        tile = (int(row_offset) - reach, int(col_offset) - reach)
+                        f.write(f'Tile {tile}: {tile_counts[row_offset, col_offset]} positions\n')
         
-        if steps_taken == 1000:
+        if steps_taken == STEPS:
             break
         
-    return ic(len(current_positions))
+    return ic(int(current_positions.sum()))
         
+def solve(garden):
+    """
+    Returns the number of garden plots the elf can reach
+    """
+    return find_steps(garden)
+
 def main():
     """
     Reads in the input file, processes and outputs the solution
     """
     garden = parse_input("input.txt")
-    print(find_steps(garden))
+    print(solve(garden))
 
 if __name__ == "__main__":
     main()
@@ -153,8 +153,14 @@ Added some basic line drawing of the bricks in matplotlib. Upgraded to 3d prisms
 # 
 # Your puzzle answer was 501.
 
-import matplotlib.pyplot as plt
-from icecream import ic
+import sys
+from pathlib import Path
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import ic
 
 def parse_input(filename):
     """
@@ -280,6 +286,9 @@ def plot_bricks(bricks):
     """
     Visualize brick arrangement
     """
+    # Only the visualization needs matplotlib, and it's slow to import
+    import matplotlib.pyplot as plt
+
     fig = plt.figure()
     ax = fig.add_subplot(111, projection='3d')
 
@@ -304,14 +313,20 @@ def plot_bricks(bricks):
 
     plt.show()
 
+def solve(bricks):
+    """
+    Settles the bricks and returns the number of bricks that can be safely disintegrated
+    """
+    sim_gravity(bricks)
+    store_support_structure(bricks)
+    return get_disintegrate_count(bricks)
+
 def main():
     """
     Reads in the input file, processes and outputs the solution
     """
     bricks = parse_input("input.txt")
-    sim_gravity(bricks)
-    store_support_structure(bricks)
-    ic(get_disintegrate_count(bricks))
+    ic(solve(bricks))
     plot_bricks(bricks)
 
 if __name__ == "__main__":
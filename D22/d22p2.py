@@ -26,11 +26,14 @@ Also added 3D visualization of the prisms in matplotlib instead of lines.
 #
 # Your puzzle answer was 80948.
 
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-from matplotlib import cm
-import matplotlib.pyplot as plt
-from icecream import ic
-from tqdm import tqdm
+import sys
+from pathlib import Path
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import ic, tqdm
 
 def parse_input(filename):
     """
@@ -159,6 +162,11 @@ def plot_bricks(bricks):
     """
     Visualize brick arrangement in 3D using matplotlib
     """
+    # Only the visualization needs matplotlib, and it's slow to import
+    from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+    from matplotlib import cm
+    import matplotlib.pyplot as plt
+
     fig = plt.figure()
     ax = fig.add_subplot(111, projection='3d')
 
@@ -201,14 +209,20 @@ def plot_bricks(bricks):
 
     plt.show()
 
+def solve(bricks):
+    """
+    Settles the bricks and returns the sum of the bricks that would fall for each disintegration
+    """
+    sim_gravity(bricks)
+    store_support_structure(bricks)
+    return run_disintegration_chain(bricks)
+
 def main():
     """
     Reads in the input file, processes and outputs the solution
     """
     bricks = parse_input("input.txt")
-    sim_gravity(bricks)
-    store_support_structure(bricks)
-    ic(run_disintegration_chain(bricks))
+    ic(solve(bricks))
     plot_bricks(bricks)
 
 if __name__ == "__main__":
@@ -89,8 +89,17 @@ actually each needed their own copy.
 # Your puzzle answer was 2414.
 #
 
+import sys
 import time
-from icecream import ic
+from pathlib import Path
+
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import ic
+from aoc.grid import Grid
 
 def parse_input(filename):
     """
@@ -98,7 +107,7 @@ def parse_input(filename):
     """
     
     with open(filename, 'r') as file:
-        maze = file.read().splitlines()
+        maze = Grid.from_lines(file.read().splitlines())
     
     return maze
 
@@ -107,7 +116,8 @@ def walk_maze(maze):
     Does a DFS through the maze, keeping track of the longest path found so far
     """
     start = (0, 1)
-    end = (len(maze) - 1, len(maze[0]) - 2)
+    end = (maze.height - 1, maze.width - 2)
+    rows = maze.lines()
     paths = [([start], set([start]))]  # Each path now also keeps track of its own visited set
     slide_vectors = {'>': (0, 1), '<': (0, -1), '^': (-1, 0), 'v': (1, 0)}
     
@@ -125,15 +135,15 @@ def walk_maze(maze):
         for next_row, next_col in [(cur_row+1, cur_col), (cur_row-1, cur_col), 
                                    (cur_row, cur_col+1), (cur_row, cur_col-1)]:
             # Bounds checking to make sure we stay within maze
-            if next_row < 0 or next_row >= len(maze) or next_col < 0 or next_col >= len(maze[0]):
+            if not maze.in_bounds(next_row, next_col):
                 continue
-            if maze[next_row][next_col] == '#':
+            if rows[next_row][next_col] == '#':
                 continue
             if (next_row, next_col) in visited:
                 continue
-            if maze[next_row][next_col] in ['>', '<', '^', 'v']:
+            if rows[next_row][next_col] in ['>', '<', '^', 'v']:
                 # Continue in the direction of the slide
-                slide_vector = slide_vectors[maze[next_row][next_col]]
+                slide_vector = slide_vectors[rows[next_row][next_col]]
                 slide_row = next_row + slide_vector[0]
                 slide_col = next_col + slide_vector[1]
 
@@ -157,22 +167,27 @@ def animate_maze(maze, path):
     """
     
     # Create a copy of the maze to modify
-    maze_copy = [list(row) for row in maze]
+    maze_copy = maze.copy()
     
     # Mark the start and end points
-    maze_copy[0][1] = 'S'
-    maze_copy[-1][-2] = 'E'
+    maze_copy[0, 1] = 'S'
+    maze_copy[-1, -2] = 'E'
     
     # Mark the path
     for row, col in path:
-        maze_copy[row][col] = 'X'
+        maze_copy[row, col] = 'X'
         # Print the maze
-    for row in maze_copy:
-        print(''.join(row))
+    print(maze_copy)
     input()
     
     return
 
+def solve(data):
+    """
+    Returns the length of the longest path through the maze
+    """
+    return walk_maze(data)
+
 def main():
     """
     Reads in the input file, processes and outputs the solution
@@ -180,7 +195,7 @@ def main():
     data = parse_input("input.txt")
     
     start_time = time.time()
-    longest_path = walk_maze(data)
+    longest_path = solve(data)
     elapsed_time = time.time() - start_time
     
     print(f"Longest path: {longest_path}. Time elapsed: {round(elapsed_time, 2)} seconds.")
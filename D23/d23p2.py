@@ -46,8 +46,18 @@ would run endlessly.
 #
 # Your puzzle answer was 6598.
 
+import sys
 import time
-from icecream import ic
+from pathlib import Path
+
+import numpy as np
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import ic
+from aoc.grid import Grid
 
 def parse_input(filename):
     """
@@ -55,14 +65,10 @@ def parse_input(filename):
     """
     
     with open(filename, 'r') as file:
-        maze = file.read().splitlines()
+        maze = Grid.from_lines(file.read().splitlines())
         
     # Replace every '>', "<", "^", "v" with a . character
-    for row in range(len(maze)):
-        maze[row] = maze[row].replace('>', '.')
-        maze[row] = maze[row].replace('<', '.')
-        maze[row] = maze[row].replace('^', '.')
-        maze[row] = maze[row].replace('v', '.')
+    maze.cells[maze.mask('><^v')] = Grid.code('.')
     
     return maze
 
@@ -72,18 +78,17 @@ def animate_maze(maze, path):
     """
     
     # Create a copy of the maze to modify
-    maze_copy = [list(row) for row in maze]
+    maze_copy = maze.copy()
     
     # Mark the start and end points
-    maze_copy[0][1] = 'S'
-    maze_copy[-1][-2] = 'E'
+    maze_copy[0, 1] = 'S'
+    maze_copy[-1, -2] = 'E'
     
     # Mark the path
     for row, col in path:
-        maze_copy[row][col] = 'X'
+        maze_copy[row, col] = 'X'
         # Print the maze
-    for row in maze_copy:
-        print(''.join(row))
+    print(maze_copy)
     input()
     
     return
@@ -97,20 +102,18 @@ def convert_to_graph(maze):
     use DFS to find the longest path much faster.
     """
     start = (0, 1)
-    end = (len(maze) - 1, len(maze[0]) - 2)
+    end = (maze.height - 1, maze.width - 2)
     
     # Find critical nodes defined as start, end, or junctions
-    nodes = []
-    for i in range(len(maze)):
-        for j in range(len(maze[0])):
-            if maze[i][j] == '#':
-                continue
-            neighbors = 0
-            for neighbor in [(i+1, j), (i-1, j), (i, j+1), (i, j-1)]:
-                if in_bounds_and_not_a_wall(neighbor, maze):
-                    neighbors += 1               
-            if neighbors != 2 or (i, j) in [start, end]:  # Not a corridor or start/end
-                nodes.append((i, j))
+    # Count each tile's open neighbors all at once by shifting a copy of the maze padded with walls
+    # one step in each direction, so tiles on the edge don't need a bounds check
+    open_tiles = maze.padded('#').cells != Grid.code('#')
+    neighbors = (open_tiles[:-2, 1:-1].astype(int) + open_tiles[2:, 1:-1]
+                 + open_tiles[1:-1, :-2] + open_tiles[1:-1, 2:])
+    is_node = open_tiles[1:-1, 1:-1] & (neighbors != 2)  # Not a corridor
+    is_node[start] = is_node[end] = True
+    nodes = [(int(i), int(j)) for i, j in np.argwhere(is_node)]
+    node_set = set(nodes)
     
     # Go through each node and run a DFS to branch out and find the other nodes, then update
     # edge weights to be the length of the hallway connecting the nodes
@@ -123,7 +126,7 @@ def convert_to_graph(maze):
             if current in visited:
                 continue
             visited.add(current)
-            if current in nodes and current != node:
+            if current in node_set and current != node:
                 graph[node].append((current, cost))
                 continue
             for direction in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
@@ -133,7 +136,7 @@ def convert_to_graph(maze):
     
     return graph
 
-def dfs_graph(graph):
+def dfs_graph(graph, end):
     """
     Does a DFS on a graph representation of a maze to find the longest path
     This problem is NP-hard, so we the only reason this works is because the maze is
@@ -141,7 +144,6 @@ def dfs_graph(graph):
     """
 
     start = (0, 1)
-    end = (140, 139)
     stack = [(start, 0, [], set())]  # Stack for DFS: (current node, cost, path, visited)
     max_cost = 0
 
@@ -167,9 +169,15 @@ def in_bounds_and_not_a_wall(coordinates, maze):
     """
     Helper function to check if a position is within the maze
     """
-    row = coordinates[0]
-    col = coordinates[1]
-    return 0 <= row < len(maze) and 0 <= col < len(maze[0]) and maze[row][col] != '#'
+    return maze.in_bounds(*coordinates) and maze[coordinates] != '#'
+
+def solve(maze):
+    """
+    Compresses the maze into a graph and returns the length of the longest path through it
+    """
+    graph = convert_to_graph(maze)
+    end = (maze.height - 1, maze.width - 2)
+    return dfs_graph(graph, end)
 
 def main():
     """
@@ -177,8 +185,7 @@ def main():
     """
     maze = parse_input("input.txt")
     start_time = time.time()
-    graph = convert_to_graph(maze)
-    max_cost = dfs_graph(graph)
+    max_cost = solve(maze)
     elapsed_time = time.time() - start_time
     print(f"Longest path: {max_cost}. Time elapsed: {round(elapsed_time, 2)} seconds.")
 
@@ -153,13 +153,19 @@ def check_for_collisions(stones):
 
     return len(collisions)
 
+def solve(stones):
+    """
+    Returns the number of hailstone paths that cross inside the test area
+    """
+    return check_for_collisions(stones)
+
 def main():
     """
     Reads in the input file, processes and outputs the solution
     """
     stones = parse_input("input.txt")
     
-    print(f"Number of collisions: {check_for_collisions(stones)}")
+    print(f"Number of collisions: {solve(stones)}")
 
 if __name__ == "__main__":
     main()
@@ -72,8 +72,6 @@ and had trouble with the huge integer values in the input. Sympy solves the syst
 # collides with every hailstone. What do you get if you add up the X, Y, and Z coordinates of that
 # initial position?
 
-from sympy import symbols, Eq, solve
-
 def parse_input(filename):
     """
     Reads in the input file and returns the contents
@@ -99,6 +97,8 @@ def get_collision_vector(stones):
     that will collide with all of the stones. Relies on the fact that only 3 stones are needed
     to solve the system of equations. We use the solver from sympy to solve the system.
     """
+    # sympy is slow to import, so it's only loaded once there's a system to solve
+    from sympy import symbols, Eq, solve as solve_equations
     
     existing_objects = list(stones.values())[:3]
     x, y, z, vx, vy, vz, t1, t2, t3 = symbols('x y z vx vy vz t1 t2 t3')
@@ -112,18 +112,26 @@ def get_collision_vector(stones):
         eqs.append(Eq(y + vy * t, y_i + vy_i * t))
         eqs.append(Eq(z + vz * t, z_i + vz_i * t))
 
-    solution = solve(eqs, dict=True)
+    solution = solve_equations(eqs, dict=True)
     for sol in solution:
         for var, value in sol.items():
             print(f"{var}: {round(float(value.evalf()), 1)}")
         print(f"Sum of positions: {sol[x].evalf() + sol[y].evalf() + sol[z].evalf()}")
 
+    return int(solution[0][x] + solution[0][y] + solution[0][z])
+
+def solve(stones):
+    """
+    Returns the sum of the coordinates of the rock's initial position
+    """
+    return get_collision_vector(stones)
+
 def main():
     """
     Reads in the input file, processes and outputs the solution
     """
     stones = parse_input("input.txt")
-    get_collision_vector(stones)
+    solve(stones)
 
 if __name__ == "__main__":
     main()
@@ -74,9 +74,14 @@ which three connections to cut to divide the graph into two groups.
 #
 # Your puzzle answer was 527790.
 
-from icecream import ic
-import networkx as nx
-import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+# Make the aoc package importable when this runs as a script (see aoc/__init__.py)
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+from aoc.debug import ic
 
 def parse_input(filename):
     """
@@ -106,6 +111,8 @@ def find_min_cut(wires):
     """
     Finds the minimum cut value and partition of the graph using built-in networkx function
     """
+    import networkx as nx
+
     graph = nx.Graph()
 
     for node, connections in wires.items():
@@ -120,6 +127,10 @@ def visualize_graph(wires):
     """
     Render the network graph
     """
+    # Only the visualization needs matplotlib, and it's slow to import
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     graph = nx.Graph()
 
     for node, connections in wires.items():
@@ -129,12 +140,10 @@ def visualize_graph(wires):
     nx.draw(graph, with_labels=True)
     plt.show()
 
-def main():
+def solve(wires):
     """
-    Reads in the input file, processes and outputs the solution
+    Cuts the minimum number of wires and returns the product of the sizes of the two groups
     """
-    wires = parse_input("input.txt")
-    visualize_graph(wires)
     min_to_cut, groups = ic(find_min_cut(wires))
     print(f"Minimum number of connections to cut: {min_to_cut}")
     print(f"Number of groups: {len(groups)}")
@@ -143,8 +152,17 @@ def main():
     product = 1
     for size in group_sizes:
         product *= size
-    print(f"Product of group sizes: {product}")
-    
+
+    return product
+
+def main():
+    """
+    Reads in the input file, processes and outputs the solution
+    """
+    wires = parse_input("input.txt")
+    visualize_graph(wires)
+    print(f"Product of group sizes: {solve(wires)}")
+
 
 if __name__ == "__main__":
     main()
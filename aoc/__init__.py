@@ -0,0 +1,10 @@
+"""
+Shared tooling for loading, running and measuring the daily solvers.
+Every DXX/dXpY.py solver exposes a parser and a solve(data) function, so the tools in this
+package can run the whole year in a single interpreter with `python -m aoc`.
+
+The solvers are also standalone scripts, usually run from their own day's directory, where this
+package isn't on the import path. Each solver that uses it (Grid, the debug helpers and so on)
+adds the repo root to sys.path before its aoc imports, only if it isn't there already, so that
+loading every solver into one interpreter doesn't pile up duplicate entries.
+"""
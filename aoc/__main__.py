@@ -0,0 +1,214 @@
+"""
+Command line entry point for running the solvers in a single interpreter.
+
+Usage:
+    python -m aoc run --day 17 --part 2 --input path/to/input.txt
+    python -m aoc run            # every day and part
+    python -m aoc run --parallel --timeout 120 --memory-limit 2048   # every solver at once
+    python -m aoc run --cache    # reuse parsed inputs from earlier runs
+    python -m aoc run --day 17 --profile profiles   # cProfile, flame graph and line timings
+    python -m aoc run --day 12 --allocations 5      # where the memory goes at its peak
+    python -m aoc cache --clear  # empty the parse cache
+    python -m aoc imports --day 22   # what each solver costs to load
+    python -m aoc batch --day 7 --part 1 'inputs/d07/*.txt' --format csv --output d07.csv
+"""
+import argparse
+import contextlib
+import os
+import sys
+
+from aoc import cache
+from aoc.batch import ResultWriter, find_inputs, run_batch
+from aoc.importtime import format_report, measure_imports
+from aoc.pool import run_parallel
+from aoc.runner import format_bytes, format_result, format_sites, try_run_solver
+from aoc.solvers import available_solvers
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the command line argument parser
+    """
+    parser = argparse.ArgumentParser(prog='python -m aoc', description=__doc__.splitlines()[1])
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run solvers and report timings')
+    run_parser.add_argument('--day', type=int, help='Day to run (default: all days)')
+    run_parser.add_argument('--part', type=int, choices=(1, 2),
+                            help='Part to run (default: both parts)')
+    run_parser.add_argument('--input', help="Input file (default: the day's input.txt)")
+    run_parser.add_argument('--verbose', action='store_true',
+                            help="Show the solvers' own output")
+    run_parser.add_argument('--no-memory', action='store_true',
+                            help='Skip memory tracking, which slows the solvers down')
+    run_parser.add_argument('--parallel', action='store_true',
+                            help='Run the solvers at once on a process pool, printing results '
+                                 'as they finish')
+    run_parser.add_argument('--jobs', type=int,
+                            help='Worker processes for --parallel (default: number of CPUs)')
+    run_parser.add_argument('--timeout', type=float,
+                            help='With --parallel, seconds before a solver is stopped')
+    run_parser.add_argument('--memory-limit', type=int,
+                            help="With --parallel, MiB of memory each solver's process may use")
+    run_parser.add_argument('--cache', action='store_true',
+                            help='Read parsed inputs from the on-disk parse cache, parsing and '
+                                 'storing them on a miss')
+    run_parser.add_argument('--profile', metavar='DIR', default=os.environ.get('AOC_PROFILE'),
+                            help='Profile each solver and write its reports to DIR '
+                                 '(default: $AOC_PROFILE, if set)')
+    run_parser.add_argument('--profile-lines', metavar='NAMES',
+                            default=os.environ.get('AOC_PROFILE_LINES'),
+                            type=lambda value: [name for name in value.split(',') if name],
+                            help="Comma separated functions to time line by line (default: "
+                                 "$AOC_PROFILE_LINES, or each day's known hot functions)")
+    run_parser.add_argument('--allocations', type=int, default=0, metavar='N',
+                            help='List the N source lines holding the most memory at the '
+                                 'parse and solve peaks')
+
+    cache_parser = subparsers.add_parser('cache', help='Inspect or empty the parse cache')
+    cache_parser.add_argument('--clear', action='store_true', help='Delete every cache entry')
+
+    batch_parser = subparsers.add_parser('batch',
+                                         help='Solve many input files for one day and part')
+    batch_parser.add_argument('inputs', nargs='+', help='Input files or glob patterns')
+    batch_parser.add_argument('--day', type=int, required=True, help='Day to run')
+    batch_parser.add_argument('--part', type=int, choices=(1, 2), required=True,
+                              help='Part to run')
+    batch_parser.add_argument('--jobs', type=int,
+                              help='Worker processes (default: number of CPUs)')
+    batch_parser.add_argument('--format', choices=('jsonl', 'csv'), default='jsonl',
+                              help='Output format (default: jsonl)')
+    batch_parser.add_argument('--output', help='File to write the results to (default: stdout)')
+    batch_parser.add_argument('--cache', action='store_true',
+                              help='Read parsed inputs from the on-disk parse cache')
+    batch_parser.add_argument('--verbose', action='store_true',
+                              help="Show the solvers' own output")
+
+    imports_parser = subparsers.add_parser('imports',
+                                           help='Report the import time of each solver')
+    imports_parser.add_argument('--day', type=int, help='Day to check (default: all days)')
+    imports_parser.add_argument('--part', type=int, choices=(1, 2),
+                                help='Part to check (default: both parts)')
+    imports_parser.add_argument('--top', type=int, default=3,
+                                help='Slowest imports to list per solver (default: 3)')
+
+    return parser
+
+def select_solvers(day: int | None, part: int | None) -> list[tuple[int, int]]:
+    """
+    Returns the (day, part) pairs matching the command line filters
+    """
+    return [(d, p) for d, p in available_solvers()
+            if (day is None or d == day) and (part is None or p == part)]
+
+def run_command(args) -> int:
+    """
+    Runs the selected solvers (one after another, or on a process pool with --parallel) and
+    prints a report line for each
+    """
+    if args.input and args.day is None:
+        print('--input needs --day', file=sys.stderr)
+        return 2
+    if not args.parallel and (args.jobs or args.timeout or args.memory_limit):
+        print('--jobs, --timeout and --memory-limit need --parallel', file=sys.stderr)
+        return 2
+    if args.allocations and args.no_memory:
+        print('--allocations needs memory tracking, so it can\'t be used with --no-memory',
+              file=sys.stderr)
+        return 2
+    if args.profile_lines is not None and not args.profile:
+        print('--profile-lines needs --profile', file=sys.stderr)
+        return 2
+
+    solvers = select_solvers(args.day, args.part)
+    if not solvers:
+        print('No matching solvers', file=sys.stderr)
+        return 1
+
+    if args.parallel:
+        memory_limit = args.memory_limit * 1024 * 1024 if args.memory_limit else None
+        results = run_parallel(solvers, args.input, jobs=args.jobs, timeout=args.timeout,
+                               memory_limit=memory_limit, quiet=not args.verbose,
+                               track_memory=not args.no_memory, use_cache=args.cache,
+                               profile_dir=args.profile, profile_lines=args.profile_lines,
+                               top_sites=args.allocations)
+    else:
+        results = (try_run_solver(day, part, args.input, quiet=not args.verbose,
+                                  track_memory=not args.no_memory, use_cache=args.cache,
+                                  profile_dir=args.profile, profile_lines=args.profile_lines,
+                                  top_sites=args.allocations)
+                   for day, part in solvers)
+
+    failed = False
+    for result in results:
+        print(format_result(result), flush=True)
+        if result.parse_sites or result.solve_sites:
+            print(format_sites(result), flush=True)
+        failed = failed or result.error is not None
+
+    return 1 if failed else 0
+
+def cache_command(args) -> int:
+    """
+    Prints the parse cache's location and size, emptying it first with --clear
+    """
+    if args.clear:
+        cache.clear()
+    entries = list(cache.CACHE_DIR.iterdir()) if cache.CACHE_DIR.exists() else []
+    total_size = sum(path.stat().st_size for path in entries)
+    print(f'{cache.CACHE_DIR}: {len(entries)} entries, {format_bytes(total_size)} '
+          f'(limit {format_bytes(cache.MAX_CACHE_BYTES)})')
+    return 0
+
+def batch_command(args) -> int:
+    """
+    Solves every matching input file and writes one result line per file
+    """
+    input_paths = find_inputs(args.inputs)
+    if not input_paths:
+        print('No input files match', file=sys.stderr)
+        return 1
+    if not select_solvers(args.day, args.part):
+        print('No matching solvers', file=sys.stderr)
+        return 1
+
+    failed = False
+    with (open(args.output, 'w', encoding='utf-8', newline='') if args.output
+          else contextlib.nullcontext(sys.stdout)) as stream:
+        writer = ResultWriter(stream, args.format)
+        for result in run_batch(args.day, args.part, input_paths, jobs=args.jobs,
+                                quiet=not args.verbose, use_cache=args.cache):
+            writer.write(result)
+            failed = failed or result.error is not None
+
+    return 1 if failed else 0
+
+def imports_command(args) -> int:
+    """
+    Loads each selected solver in a fresh interpreter and prints its import cost
+    """
+    solvers = select_solvers(args.day, args.part)
+    if not solvers:
+        print('No matching solvers', file=sys.stderr)
+        return 1
+
+    for day, part in solvers:
+        print(format_report(measure_imports(day, part), top=args.top), flush=True)
+    return 0
+
+def main(argv=None) -> int:
+    """
+    Parses the command line and dispatches to the requested command
+    """
+    args = build_parser().parse_args(argv)
+    if args.command == 'run':
+        return run_command(args)
+    if args.command == 'cache':
+        return cache_command(args)
+    if args.command == 'batch':
+        return batch_command(args)
+    if args.command == 'imports':
+        return imports_command(args)
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
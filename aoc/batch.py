@@ -0,0 +1,97 @@
+"""
+Solves many input files for one day and part, e.g. a directory with one input per account.
+Each worker process loads the solver once and then solves every file it's handed, so the import
+and anything the solver precomputes at module level (D07's card ranks, D15's HASH table) are
+paid once per worker rather than once per file. Results are written as JSON lines or CSV, one
+line per input, in the order the inputs finish.
+"""
+import csv
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict
+from multiprocessing import get_context
+from pathlib import Path
+
+from aoc.runner import SolverResult, try_run_solver
+from aoc.solvers import load_solver
+
+FIELDS = ['day', 'part', 'input_path', 'answer', 'parse_time', 'solve_time', 'error']
+
+_solver = None
+
+def _init_worker(day: int, part: int):
+    """
+    Loads the solver once when a worker process starts
+    """
+    global _solver
+    _solver = (day, part)
+    load_solver(day, part)
+
+def _solve_file(input_path: str, quiet: bool, use_cache: bool) -> SolverResult:
+    """
+    Solves one input with the worker's solver, returning a result with the error filled in if it
+    failed
+    """
+    day, part = _solver
+    return try_run_solver(day, part, input_path, quiet=quiet, track_memory=False,
+                          use_cache=use_cache)
+
+def find_inputs(patterns: list[str]) -> list[Path]:
+    """
+    Expands glob patterns (with ** for subdirectories) into a sorted list of unique input files
+    """
+    paths = {Path(path) for pattern in patterns for path in glob.glob(pattern, recursive=True)}
+    return sorted(path for path in paths if path.is_file())
+
+def run_batch(day: int, part: int, input_paths: list[Path], jobs: int | None = None,
+              quiet: bool = True, use_cache: bool = False):
+    """
+    Solves every input on a pool of worker processes and yields the results as they finish
+    """
+    jobs = min(jobs or os.cpu_count(), len(input_paths)) or 1
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=get_context('spawn'),
+                             initializer=_init_worker, initargs=(day, part)) as executor:
+        futures = {executor.submit(_solve_file, str(path), quiet, use_cache): path
+                   for path in input_paths}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # The worker itself died, e.g. killed by the OS, so there's no result to report
+                yield SolverResult(day, part, futures[future], None, 0.0, 0.0,
+                                   error=f'worker failed: {type(e).__name__}: {e}')
+
+def result_record(result: SolverResult) -> dict:
+    """
+    Returns the fields of a result written for each input
+    """
+    record = asdict(result)
+    record = {field: record[field] for field in FIELDS}
+    record['input_path'] = str(result.input_path)
+    # Answers are ints, floats or strings depending on the day, so write them all as text
+    record['answer'] = None if result.answer is None else str(result.answer)
+    return record
+
+class ResultWriter:
+    """
+    Writes results to a stream as JSON lines or CSV, flushing after each one so that a long
+    batch can be followed while it runs
+    """
+    def __init__(self, stream, output_format: str = 'jsonl'):
+        if output_format not in ('jsonl', 'csv'):
+            raise ValueError(f'Unknown output format {output_format}')
+        self.stream = stream
+        self.output_format = output_format
+        if output_format == 'csv':
+            self._csv = csv.DictWriter(stream, fieldnames=FIELDS)
+            self._csv.writeheader()
+
+    def write(self, result: SolverResult):
+        record = result_record(result)
+        if self.output_format == 'csv':
+            self._csv.writerow(record)
+        else:
+            self.stream.write(json.dumps(record) + '\n')
+        self.stream.flush()
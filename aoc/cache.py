@@ -0,0 +1,148 @@
+"""
+Content-addressed on-disk cache of parsed puzzle inputs.
+Entries are keyed by a hash of the input file's bytes plus the parser's version, which is a hash
+of the parser's source (and the solver's PARSER_VERSION, if it sets one). Editing a parser or
+its input makes a new key, so stale entries are never read; they just age out. Parts 1 and 2
+of a day usually have identical parsers, so they share one entry.
+
+Grids and NumPy arrays are stored as .npz files and everything else is pickled. The cache is
+bounded in size: once it grows past its limit, the least recently used entries are deleted.
+"""
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from aoc.grid import Grid
+from aoc.solvers import ROOT
+
+CACHE_DIR = Path(os.environ.get('AOC_CACHE_DIR', ROOT / '.cache' / 'parsed'))
+MAX_CACHE_BYTES = int(os.environ.get('AOC_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+
+def parser_version(parser, module=None) -> str:
+    """
+    Returns a hash identifying a parser's behaviour: its source code plus the solver module's
+    PARSER_VERSION, which a solver can bump if its parser depends on something outside itself
+    """
+    try:
+        source = inspect.getsource(parser)
+    except (OSError, TypeError):
+        source = f'{parser.__module__}.{parser.__qualname__}'
+    extra = str(getattr(module, 'PARSER_VERSION', ''))
+    return hashlib.sha256(f'{source}\0{extra}'.encode('utf-8')).hexdigest()
+
+def cache_key(input_path, parser, module=None) -> str:
+    """
+    Returns the cache key for parsing an input file with a parser
+    """
+    digest = hashlib.sha256()
+    with open(input_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    digest.update(parser_version(parser, module).encode('ascii'))
+    return digest.hexdigest()
+
+def _write_atomic(path: Path, write):
+    """
+    Calls write(file) on a temporary file next to path, then moves it into place, so a reader
+    never sees a half-written entry
+    """
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(temp_name, path)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
+def store(key: str, data, cache_dir=CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES) -> Path:
+    """
+    Stores parsed data under a key and evicts old entries if the cache is over its size limit
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    if isinstance(data, Grid):
+        path = cache_dir / f'{key}.grid.npz'
+        _write_atomic(path, lambda f: np.savez(f, cells=data.cells))
+    elif isinstance(data, np.ndarray) and data.dtype != object:
+        path = cache_dir / f'{key}.npz'
+        _write_atomic(path, lambda f: np.savez(f, array=data))
+    else:
+        path = cache_dir / f'{key}.pickle'
+        _write_atomic(path, lambda f: pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL))
+
+    evict(cache_dir, max_bytes)
+    return path
+
+def load(key: str, cache_dir=CACHE_DIR):
+    """
+    Returns (True, data) for a cached entry, or (False, None) if there isn't a usable one
+    """
+    cache_dir = Path(cache_dir)
+    for suffix in ('.grid.npz', '.npz', '.pickle'):
+        path = cache_dir / f'{key}{suffix}'
+        if not path.exists():
+            continue
+        try:
+            if suffix == '.pickle':
+                with open(path, 'rb') as f:
+                    data = pickle.load(f)
+            else:
+                with np.load(path) as archive:
+                    data = Grid(archive['cells']) if suffix == '.grid.npz' else archive['array']
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError,
+                KeyError, ValueError):
+            # A corrupt entry, or one pickled from a class that no longer exists
+            path.unlink(missing_ok=True)
+            return False, None
+        # Bump the modification time so eviction sees this entry as recently used
+        os.utime(path)
+        return True, data
+    return False, None
+
+def evict(cache_dir=CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+    """
+    Deletes the least recently used entries until the cache fits in max_bytes
+    """
+    entries = []
+    for path in Path(cache_dir).iterdir():
+        if path.suffix == '.tmp':
+            continue
+        stat = path.stat()
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total_size -= size
+
+def clear(cache_dir=CACHE_DIR):
+    """
+    Deletes every cache entry
+    """
+    cache_dir = Path(cache_dir)
+    if cache_dir.exists():
+        for path in cache_dir.iterdir():
+            path.unlink(missing_ok=True)
+
+def cached_parse(parser, input_path, module=None, cache_dir=CACHE_DIR,
+                 max_bytes: int = MAX_CACHE_BYTES):
+    """
+    Returns the parsed input from the cache if it's there, otherwise parses it and caches it
+    """
+    key = cache_key(input_path, parser, module)
+    found, data = load(key, cache_dir)
+    if found:
+        return data
+
+    data = parser(str(input_path))
+    store(key, data, cache_dir, max_bytes)
+    return data
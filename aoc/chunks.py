@@ -0,0 +1,78 @@
+"""
+Splits a large line-oriented input into chunks and sums a solver's answer over them in parallel.
+The file is memory-mapped and cut into byte ranges that end on newlines, so no line is split
+between chunks and no process has to read the whole file. This only works for puzzles whose
+answer is a sum of independent per-line values, like D01's calibration total.
+"""
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+from aoc.solvers import load_solver
+
+# Files smaller than this are solved in-process, since starting workers would cost more
+CHUNK_SIZE = 8 * 1024 * 1024
+
+def chunk_ranges(path, chunk_size: int = CHUNK_SIZE) -> list[tuple[int, int]]:
+    """
+    Returns (start, end) byte ranges of about chunk_size bytes that cover the file, each ending
+    just after a newline (or at the end of the file)
+    """
+    size = Path(path).stat().st_size
+    if size == 0:
+        return []
+
+    ranges = []
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        start = 0
+        while start < size:
+            newline = data.find(b'\n', min(start + chunk_size, size) - 1)
+            end = size if newline == -1 else newline + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+def read_lines(path, start: int, end: int) -> list[str]:
+    """
+    Returns the lines in a byte range of the file
+    """
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return data[start:end].decode('utf-8').splitlines()
+
+def read_bytes(path, start: int, end: int) -> np.ndarray:
+    """
+    Returns a byte range of the file as a uint8 array
+    """
+    return np.fromfile(path, dtype=np.uint8, count=end - start, offset=start)
+
+def _solve_chunk(day: int, part: int, path: str, start: int, end: int, raw: bool,
+                 solve_args: tuple):
+    """
+    Runs in a worker: solves one byte range with the solver's solve function
+    """
+    read = read_bytes if raw else read_lines
+    return load_solver(day, part).solve(read(path, start, end), *solve_args)
+
+def sum_chunks(solve, day: int, part: int, path, workers: int | None = None,
+               chunk_size: int = CHUNK_SIZE, raw: bool = False, solve_args: tuple = ()):
+    """
+    Returns the sum of solve's answers for each chunk of the file. solve is given each chunk as a
+    list of lines, or with raw as a uint8 array of its bytes, followed by solve_args. Small files are solved in-process
+    as a single chunk; otherwise the chunks are solved on a pool of worker processes, each of
+    which loads the day and part's solver to get its solve function.
+    """
+    ranges = chunk_ranges(path, chunk_size)
+    read = read_bytes if raw else read_lines
+    if len(ranges) <= 1:
+        return sum(solve(read(path, start, end), *solve_args) for start, end in ranges)
+
+    workers = min(workers or os.cpu_count(), len(ranges))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn')) as executor:
+        futures = [executor.submit(_solve_chunk, day, part, str(path), start, end, raw,
+                                   solve_args)
+                   for start, end in ranges]
+        return sum(future.result() for future in futures)
@@ -0,0 +1,64 @@
+"""
+Debug output helpers for the solvers that only import icecream and tqdm when output is shown.
+Importing icecream alone costs more than parsing most inputs, and when the runner silences a
+solver the debug output is thrown away anyway. Turning debug output off (the runner does this
+while it's silencing a solver) makes ic() a plain passthrough and tqdm() return its iterable
+untouched, so neither library is ever loaded.
+"""
+import contextlib
+
+_enabled = True
+
+def ic(*args):
+    """
+    Drop-in for icecream's ic(): prints the arguments with their source expressions and returns
+    them, importing icecream on the first call that actually prints
+    """
+    if _enabled:
+        import inspect
+
+        from icecream import ic as icecream_ic
+        from icecream.icecream import NoSourceAvailableError, callOrValue
+
+        # Format against our caller's frame, as icecream would if it had been called directly
+        call_frame = inspect.currentframe().f_back
+        try:
+            output = icecream_ic._format(call_frame, *args)
+        except NoSourceAvailableError as e:
+            output = f'{callOrValue(icecream_ic.prefix)}Error: {e.infoMessage}'
+        icecream_ic.outputFunction(output)
+
+    if not args:
+        return None
+    if len(args) == 1:
+        return args[0]
+    return args
+
+def tqdm(iterable, **kwargs):
+    """
+    Drop-in for tqdm(): wraps an iterable in a progress bar, or returns it untouched when debug
+    output is off
+    """
+    if not _enabled:
+        return iterable
+    from tqdm import tqdm as tqdm_bar
+    return tqdm_bar(iterable, **kwargs)
+
+def enabled() -> bool:
+    """
+    Returns whether debug output is on, for solvers with debug output of their own (like log files)
+    """
+    return _enabled
+
+@contextlib.contextmanager
+def disabled(disable: bool = True):
+    """
+    Turns debug output off (if disable is set) for the duration of the block
+    """
+    global _enabled
+    previous = _enabled
+    _enabled = _enabled and not disable
+    try:
+        yield
+    finally:
+        _enabled = previous
@@ -0,0 +1,169 @@
+"""
+A character grid backed by a uint8 NumPy array, shared by the days whose input is a 2D map.
+Each cell holds the byte value of its character, so whole-grid questions (where are the rocks,
+which rows are empty, which tiles are inside the loop) become array operations instead of
+Python loops over list[list[str]]. Rotations, transpositions and flips are views onto the same
+array, so rolling rocks on a rotated grid moves them on the original too.
+"""
+import numpy as np
+
+DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+DIAGONALS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+class Grid:
+    """
+    A rectangular grid of single-byte characters, indexed by (row, col)
+    """
+    def __init__(self, cells: np.ndarray):
+        self.cells = cells
+
+    @classmethod
+    def from_lines(cls, lines: list[str]) -> 'Grid':
+        """
+        Builds a grid from equal-length lines of text
+        """
+        lines = [line for line in lines if line]
+        width = len(lines[0]) if lines else 0
+        if any(len(line) != width for line in lines):
+            raise ValueError('Grid lines must all be the same length')
+        data = ''.join(lines).encode('ascii')
+        return cls(np.frombuffer(data, dtype=np.uint8).reshape(len(lines), width).copy())
+
+    @classmethod
+    def from_text(cls, text: str) -> 'Grid':
+        """
+        Builds a grid from a block of text with one row per line
+        """
+        return cls.from_lines(text.splitlines())
+
+    @staticmethod
+    def code(char: str) -> int:
+        """
+        Returns the byte value a character is stored as
+        """
+        return ord(char)
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.cells.shape
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, position: tuple[int, int]) -> str:
+        return chr(self.cells[position])
+
+    def __setitem__(self, position: tuple[int, int], char: str):
+        self.cells[position] = ord(char)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return np.array_equal(self.cells, other.cells)
+
+    __hash__ = None
+
+    def __str__(self) -> str:
+        return '\n'.join(self.lines())
+
+    def __repr__(self) -> str:
+        return f'Grid({self.height}x{self.width})'
+
+    def lines(self) -> list[str]:
+        """
+        Returns the rows of the grid as strings
+        """
+        return [row.tobytes().decode('ascii') for row in self.cells]
+
+    def tobytes(self) -> bytes:
+        """
+        Returns the grid contents as bytes, e.g. to use a grid's state as a dict key
+        """
+        return self.cells.tobytes()
+
+    def copy(self) -> 'Grid':
+        """
+        Returns a grid with its own copy of the cells
+        """
+        return Grid(self.cells.copy())
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        """
+        Returns True if (row, col) is inside the grid
+        """
+        return 0 <= row < self.cells.shape[0] and 0 <= col < self.cells.shape[1]
+
+    def neighbours(self, row: int, col: int, diagonal: bool = False) -> list[tuple[int, int]]:
+        """
+        Returns the in-bounds positions next to (row, col), including diagonals if asked
+        """
+        height, width = self.cells.shape
+        offsets = DIRECTIONS + DIAGONALS if diagonal else DIRECTIONS
+        return [(row + d_row, col + d_col) for d_row, d_col in offsets
+                if 0 <= row + d_row < height and 0 <= col + d_col < width]
+
+    def mask(self, chars: str) -> np.ndarray:
+        """
+        Returns a boolean array that is True wherever the grid holds one of the given characters
+        """
+        return np.isin(self.cells, np.frombuffer(chars.encode('ascii'), dtype=np.uint8))
+
+    def find(self, char: str) -> tuple[int, int] | None:
+        """
+        Returns the (row, col) of the first occurrence of a character, or None if it isn't there
+        """
+        matches = np.flatnonzero(self.cells == ord(char))
+        if matches.size == 0:
+            return None
+        return self.position(int(matches[0]))
+
+    def find_all(self, char: str) -> list[tuple[int, int]]:
+        """
+        Returns the (row, col) of every occurrence of a character, in reading order
+        """
+        return [(int(row), int(col)) for row, col in np.argwhere(self.cells == ord(char))]
+
+    def flat_index(self, row: int, col: int) -> int:
+        """
+        Returns the index of (row, col) in the grid flattened row by row
+        """
+        return row * self.cells.shape[1] + col
+
+    def position(self, index: int) -> tuple[int, int]:
+        """
+        Returns the (row, col) of an index into the grid flattened row by row
+        """
+        return divmod(index, self.cells.shape[1])
+
+    def padded(self, fill: str = '.', width: int = 1) -> 'Grid':
+        """
+        Returns a new grid with a border of the given character around it, so that lookups next
+        to the edge don't need a bounds check. Positions shift by the border width.
+        """
+        return Grid(np.pad(self.cells, width, constant_values=ord(fill)))
+
+    def rotated(self, turns: int = 1) -> 'Grid':
+        """
+        Returns a view of the grid rotated 90 degrees clockwise the given number of times
+        """
+        return Grid(np.rot90(self.cells, -turns))
+
+    def transposed(self) -> 'Grid':
+        """
+        Returns a view of the grid with rows and columns swapped
+        """
+        return Grid(self.cells.T)
+
+    def flipped(self, axis: int) -> 'Grid':
+        """
+        Returns a view of the grid mirrored top to bottom (axis 0) or left to right (axis 1)
+        """
+        return Grid(np.flip(self.cells, axis))
@@ -0,0 +1,74 @@
+"""
+Measures what each solver costs to load, using Python's -X importtime in a fresh interpreter.
+A solver is loaded in its own process so that nothing is already cached in sys.modules. Only
+imports made while the solver module loads are counted, not the runner's own.
+"""
+import subprocess
+import sys
+from dataclasses import dataclass
+
+from aoc.solvers import ROOT
+
+# Printed to stderr between the runner's imports and the solver's, so the report can skip the former
+MARKER = 'aoc-importtime-start'
+
+LOAD_SCRIPT = f"""
+import sys, time
+from aoc.solvers import load_solver
+print({MARKER!r}, file=sys.stderr, flush=True)
+start_time = time.perf_counter()
+load_solver(int(sys.argv[1]), int(sys.argv[2]))
+print(time.perf_counter() - start_time, file=sys.stderr)
+"""
+
+@dataclass
+class ImportReport:
+    """
+    Time taken to load one solver and the top-level imports it triggered
+    """
+    day: int
+    part: int
+    load_time: float
+    imports: list[tuple[str, float]]
+
+def parse_importtime(lines: list[str]) -> list[tuple[str, float]]:
+    """
+    Returns (module, cumulative seconds) for each top-level import in -X importtime output.
+    Nested imports are indented under the module that triggered them and are already counted
+    in its cumulative time.
+    """
+    imports = []
+    for line in lines:
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Top-level imports are indented by exactly one space after the bar
+        if not name.startswith(' ') or name.startswith('  '):
+            continue
+        imports.append((name.strip(), int(cumulative) / 1e6))
+    return imports
+
+def measure_imports(day: int, part: int) -> ImportReport:
+    """
+    Loads a solver in a fresh interpreter and reports its load time and the imports it made
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', LOAD_SCRIPT,
+                              str(day), str(part)],
+                             cwd=ROOT, capture_output=True, text=True, check=False)
+    lines = process.stderr.splitlines()
+    if process.returncode != 0 or MARKER not in lines:
+        raise RuntimeError(f'Loading day {day} part {part} failed:\n{process.stderr}')
+
+    solver_lines = lines[lines.index(MARKER) + 1:]
+    load_time = float(solver_lines[-1])
+    imports = sorted(parse_importtime(solver_lines[:-1]), key=lambda item: item[1], reverse=True)
+    return ImportReport(day, part, load_time, imports)
+
+def format_report(report: ImportReport, top: int = 3) -> str:
+    """
+    Formats an import report as a single line listing the slowest imports
+    """
+    slowest = ', '.join(f'{name} {seconds * 1000:.1f} ms'
+                        for name, seconds in report.imports[:top])
+    return (f'Day {report.day:2d} Part {report.part}: load {report.load_time * 1000:8.2f} ms'
+            f'  {slowest or "no imports"}')
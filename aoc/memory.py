@@ -0,0 +1,117 @@
+"""
+Finds where a solver's memory goes at its peak, using tracemalloc.
+tracemalloc reports the peak size exactly but can only snapshot what's allocated right now, and
+by the time a solver returns its big temporary structures are gone. PeakSnapshot polls the
+traced size from a background thread and takes a snapshot whenever it reaches a new high, so the
+sites it reports are those holding memory close to (not exactly at) the peak.
+
+Allocations are charged to the innermost line of solver code that led to them, rather than to
+the line inside numpy or the Grid class that made the actual allocation, as long as tracemalloc
+was started with enough frames (TRACE_FRAMES) to see it.
+"""
+import re
+import threading
+import tracemalloc
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.solvers import ROOT
+
+TRACE_FRAMES = 32
+
+SOLVER_FILE = re.compile(r'D\d\d[/\\]d\d+p\d\.py$')
+# Shared code that does work on a solver's behalf, e.g. loading a cached parse
+HELPER_FILES = {str(ROOT / 'aoc' / name) for name in ('grid.py', 'debug.py', 'cache.py')}
+
+@dataclass
+class AllocationSite:
+    """
+    Memory held by the allocations made on one source line
+    """
+    filename: str
+    lineno: int
+    size: int
+    count: int
+
+    def __str__(self) -> str:
+        path = Path(self.filename)
+        if path.is_relative_to(ROOT):
+            path = path.relative_to(ROOT)
+        return f'{path}:{self.lineno}'
+
+class PeakSnapshot:
+    """
+    Context manager that keeps the tracemalloc snapshot taken closest to the peak while the block
+    runs. tracemalloc must already be tracing. A new snapshot is only taken once memory has grown
+    by growth (a fraction) over the last one, since each snapshot copies every live trace.
+    """
+    def __init__(self, interval: float = 0.005, growth: float = 0.05):
+        self.interval = interval
+        self.growth = growth
+        self.snapshot = None
+        self._snapshot_size = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self._take_snapshot()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        # Anything still allocated at the end may be the peak, e.g. an ever growing cache
+        self._take_snapshot()
+
+    def _take_snapshot(self):
+        if not tracemalloc.is_tracing():
+            return
+        current = tracemalloc.get_traced_memory()[0]
+        if current > self._snapshot_size * (1 + self.growth):
+            try:
+                self.snapshot = tracemalloc.take_snapshot()
+                self._snapshot_size = current
+            except RuntimeError:
+                # Tracing was stopped between the check and the snapshot
+                pass
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._take_snapshot()
+
+    def top_sites(self, limit: int = 10) -> list[AllocationSite]:
+        """
+        Returns the source lines holding the most memory in the kept snapshot
+        """
+        if self.snapshot is None:
+            return []
+
+        totals = defaultdict(lambda: [0, 0])
+        for trace in self.snapshot.traces:
+            frame = site_frame(trace.traceback)
+            if frame is not None:
+                total = totals[(frame.filename, frame.lineno)]
+                total[0] += trace.size
+                total[1] += 1
+
+        sites = [AllocationSite(filename, lineno, size, count)
+                 for (filename, lineno), (size, count) in totals.items()]
+        return sorted(sites, key=lambda site: site.size, reverse=True)[:limit]
+
+def site_frame(traceback: tracemalloc.Traceback) -> tracemalloc.Frame | None:
+    """
+    Returns the frame to charge an allocation to: the innermost one in a solver, or failing that
+    the innermost one in a shared helper. Allocations made by the runner's own machinery return
+    None.
+    """
+    # Tracebacks run from the oldest frame to the most recent
+    frames = list(reversed(traceback))
+    for frame in frames:
+        if SOLVER_FILE.search(frame.filename):
+            return frame
+    for frame in frames:
+        if frame.filename in HELPER_FILES:
+            return frame
+    return None
@@ -0,0 +1,84 @@
+"""
+Runs many solvers at once on a process pool and streams their results back as they finish.
+Every solver gets a fresh worker process, so module state, memory use and crashes can't leak
+from one solver into the next. Each worker enforces its own time and memory limits: a solver
+that runs too long or allocates too much is stopped and reported as an error instead of
+holding up (or taking down) the rest of the run.
+"""
+import os
+import resource
+import signal
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from pathlib import Path
+
+from aoc.runner import SolverResult, run_solver
+from aoc.solvers import default_input
+
+class SolverTimeout(Exception):
+    """
+    Raised inside a worker when its solver runs past the time limit
+    """
+
+def _raise_timeout(signum, frame):
+    raise SolverTimeout()
+
+def _limited_run(day: int, part: int, input_path, timeout: float | None,
+                 memory_limit: int | None, quiet: bool, track_memory: bool,
+                 use_cache: bool, profile_dir, profile_lines: list[str] | None,
+                 top_sites: int) -> SolverResult:
+    """
+    Runs one solver inside a worker process under the given time (seconds) and memory (bytes)
+    limits, returning a result with the error filled in if it failed
+    """
+    input_path = Path(input_path) if input_path else default_input(day)
+    if memory_limit:
+        _, hard_limit = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard_limit))
+    if timeout:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        return run_solver(day, part, input_path, quiet=quiet, track_memory=track_memory,
+                          use_cache=use_cache, profile_dir=profile_dir,
+                          profile_lines=profile_lines, top_sites=top_sites)
+    except SolverTimeout:
+        error = f'timed out after {timeout}s'
+    except MemoryError:
+        error = f'exceeded the memory limit of {memory_limit} bytes'
+    except Exception as e:
+        error = f'{type(e).__name__}: {e}'
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    return SolverResult(day, part, input_path, None, 0.0, 0.0, error=error)
+
+def run_parallel(solvers: list[tuple[int, int]], input_path=None, jobs: int | None = None,
+                 timeout: float | None = None, memory_limit: int | None = None,
+                 quiet: bool = True, track_memory: bool = True, use_cache: bool = False,
+                 profile_dir=None, profile_lines: list[str] | None = None, top_sites: int = 0):
+    """
+    Runs the given (day, part) solvers on a process pool and yields their results in the order
+    they finish. jobs defaults to the number of CPUs, timeout is in seconds and memory_limit is
+    the address space limit in bytes for each solver's process. The address space includes the
+    libraries a solver imports, so a very low limit can make numpy fail to import.
+    """
+    jobs = jobs or os.cpu_count()
+    # max_tasks_per_child=1 gives every solver a clean interpreter and limits that die with it
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=get_context('spawn'),
+                             max_tasks_per_child=1) as executor:
+        futures = {executor.submit(_limited_run, day, part, input_path, timeout, memory_limit,
+                                   quiet, track_memory, use_cache, profile_dir,
+                                   profile_lines, top_sites): (day, part)
+                   for day, part in solvers}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # The worker itself died (e.g. killed by the OS), so there's no result to report
+                day, part = futures[future]
+                path = Path(input_path) if input_path else default_input(day)
+                yield SolverResult(day, part, path, None, 0.0, 0.0,
+                                   error=f'worker failed: {type(e).__name__}: {e}')
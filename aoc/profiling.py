@@ -0,0 +1,190 @@
+"""
+Opt-in profiling of a solver run, so finding a hot spot doesn't mean hand-editing the script.
+Three profilers run together while a solver parses and solves:
+* cProfile, written as a binary .prof file and a text report sorted by cumulative time
+* a sampling profiler that records the call stack every millisecond, written as a collapsed
+  stack file (one 'frame;frame;frame count' line per stack) for flamegraph.pl or speedscope
+* line timings for a few named hot functions, in the style of line_profiler
+
+Line timing traces every line of the named functions, so it slows them down a lot more than
+cProfile does. The timings are for finding the expensive lines, not for benchmarking.
+"""
+import cProfile
+import contextlib
+import inspect
+import io
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+# The functions worth line timing in each day's solvers, used when none are named explicitly
+HOT_FUNCTIONS = {
+    12: ['backtrack'],
+    14: ['roll_rocks'],
+    16: ['get_energy_value'],
+    17: ['get_possible_moves'],
+    20: ['process_signal'],
+}
+
+class LineTimer:
+    """
+    Records the hits and time spent on each line of the given functions using sys.settrace.
+    Time spent in a call is charged to the line that made it, except for calls to the timed
+    functions themselves, so a recursive function's lines add up to its real running time.
+    """
+    def __init__(self, functions: list):
+        self.functions = {inspect.unwrap(function).__code__: function for function in functions}
+        self.timings = defaultdict(lambda: [0, 0.0])
+        # Time spent in nested timed calls, one entry per timed frame currently running
+        self._nested_times = []
+
+    def start(self):
+        sys.settrace(self._trace_call)
+
+    def stop(self):
+        sys.settrace(None)
+
+    def _trace_call(self, frame, event, arg):
+        """
+        Global trace function: only frames of the named functions get a line tracer
+        """
+        if frame.f_code not in self.functions:
+            return None
+        code = frame.f_code
+        timings = self.timings
+        nested_times = self._nested_times
+        nested_times.append(0.0)
+        depth = len(nested_times) - 1
+        start_time = time.perf_counter()
+        # Line being run in this frame and when it started
+        current = [None, start_time]
+
+        def trace_lines(frame, event, arg):
+            now = time.perf_counter()
+            if current[0] is not None:
+                entry = timings[(code, current[0])]
+                entry[0] += 1
+                entry[1] += now - current[1] - nested_times[depth]
+            nested_times[depth] = 0.0
+
+            if event == 'return':
+                # Charge this whole call to the timed frame that made it, so it isn't counted twice
+                del nested_times[depth:]
+                if depth:
+                    nested_times[depth - 1] += now - start_time
+                current[0] = None
+            else:
+                current[0] = frame.f_lineno if event == 'line' else None
+            current[1] = time.perf_counter()
+            return trace_lines
+
+        return trace_lines
+
+    def report(self) -> str:
+        """
+        Returns a per-line report of each function, with the source next to its timings
+        """
+        sections = []
+        for code, function in self.functions.items():
+            lines, first_line = inspect.getsourcelines(code)
+            total_time = sum(seconds for (line_code, _), (_, seconds) in self.timings.items()
+                             if line_code is code)
+            rows = [f'Line timings for {function.__qualname__} ({code.co_filename}:{first_line})',
+                    f'Total time: {total_time:.6f} s',
+                    f"{'Line':>6} {'Hits':>10} {'Time (ms)':>12} {'Per hit (us)':>13} "
+                    f"{'% Time':>7}  Source"]
+            for offset, source in enumerate(lines):
+                line_number = first_line + offset
+                hits, seconds = self.timings.get((code, line_number), (0, 0.0))
+                if hits:
+                    share = 100 * seconds / total_time if total_time else 0.0
+                    rows.append(f'{line_number:>6} {hits:>10} {seconds * 1000:>12.3f} '
+                                f'{seconds / hits * 1e6:>13.2f} {share:>7.1f}  '
+                                f'{source.rstrip()}')
+                else:
+                    rows.append(f"{line_number:>6} {'':>10} {'':>12} {'':>13} {'':>7}  "
+                                f'{source.rstrip()}')
+            sections.append('\n'.join(rows))
+        return '\n\n'.join(sections)
+
+class StackSampler:
+    """
+    Samples a thread's call stack at a fixed interval from a background thread and counts how
+    often each stack was seen
+    """
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                # Leave out the line timer's trace functions, which run inside the solver's frames
+                if code.co_filename != __file__:
+                    location = f'{Path(code.co_filename).name}:{code.co_firstlineno}'
+                    stack.append(f'{code.co_name} ({location})')
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """
+        Returns the samples in collapsed stack format, most frequent stacks first
+        """
+        return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common())
+
+def find_functions(module, names: list[str]) -> list:
+    """
+    Returns the module's functions with the given names, skipping names it doesn't define
+    """
+    return [getattr(module, name) for name in names if callable(getattr(module, name, None))]
+
+@contextlib.contextmanager
+def profiled(output_dir, name: str, functions: list = (), sort: str = 'cumulative',
+             limit: int = 40):
+    """
+    Profiles the block and writes name.prof, name.txt (the sorted cProfile report followed by
+    any line timings) and name.collapsed into output_dir
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    profiler = cProfile.Profile()
+    sampler = StackSampler(threading.get_ident())
+    line_timer = LineTimer(functions) if functions else None
+
+    sampler.start()
+    if line_timer:
+        line_timer.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        if line_timer:
+            line_timer.stop()
+        sampler.stop()
+
+        profiler.dump_stats(output_dir / f'{name}.prof')
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats(sort).print_stats(limit)
+        if line_timer:
+            report.write('\n' + line_timer.report() + '\n')
+        (output_dir / f'{name}.txt').write_text(report.getvalue(), encoding='utf-8')
+        (output_dir / f'{name}.collapsed').write_text(sampler.collapsed(), encoding='utf-8')
@@ -0,0 +1,153 @@
+"""
+Runs a solver in-process and measures how long parsing and solving take, along with the peak
+memory allocated by each phase.
+"""
+import contextlib
+import os
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc import debug
+from aoc.cache import cached_parse
+from aoc.memory import TRACE_FRAMES, AllocationSite, PeakSnapshot
+from aoc.profiling import HOT_FUNCTIONS, find_functions, profiled
+from aoc.solvers import default_input, get_parser, load_solver
+
+@dataclass
+class SolverResult:
+    """
+    Answer and measurements from a single run of a solver
+    """
+    day: int
+    part: int
+    input_path: Path
+    answer: object
+    parse_time: float
+    solve_time: float
+    parse_peak: int | None = None
+    solve_peak: int | None = None
+    error: str | None = None
+    parse_sites: list[AllocationSite] | None = None
+    solve_sites: list[AllocationSite] | None = None
+
+@contextlib.contextmanager
+def silenced(quiet: bool = True):
+    """
+    Swallows everything the solvers print while quiet is set. Debug output (ic and tqdm from
+    aoc.debug) is switched off rather than redirected, so icecream and tqdm never get imported.
+    """
+    if not quiet:
+        yield
+        return
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, debug.disabled(), \
+            contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+        yield
+
+def measure(function, *args, track_memory: bool = True, top_sites: int = 0):
+    """
+    Calls a function and returns its result, the elapsed time in seconds, the peak number of
+    bytes it allocated (None if memory isn't being tracked) and, if top_sites is set, the source
+    lines holding the most memory near that peak (otherwise None)
+    """
+    if track_memory:
+        # Finding allocation sites needs the stack of each allocation, not just its innermost line
+        tracemalloc.start(TRACE_FRAMES if top_sites else 1)
+        tracemalloc.reset_peak()
+    peak_snapshot = PeakSnapshot() if track_memory and top_sites else None
+
+    try:
+        with peak_snapshot or contextlib.nullcontext():
+            start_time = time.perf_counter()
+            result = function(*args)
+            elapsed_time = time.perf_counter() - start_time
+        peak = tracemalloc.get_traced_memory()[1] if track_memory else None
+    finally:
+        if track_memory:
+            tracemalloc.stop()
+
+    sites = peak_snapshot.top_sites(top_sites) if peak_snapshot else None
+    return result, elapsed_time, peak, sites
+
+def run_solver(day: int, part: int, input_path=None, quiet: bool = True,
+               track_memory: bool = True, use_cache: bool = False, profile_dir=None,
+               profile_lines: list[str] | None = None, top_sites: int = 0) -> SolverResult:
+    """
+    Loads the solver for a day and part, parses the input and solves it.
+    Tracing memory slows the solvers down, so pass track_memory=False for clean timings.
+    With use_cache, the parsed input is read from the on-disk parse cache when it's there.
+    With profile_dir, the run is profiled and the reports are written there; profile_lines names
+    the functions to time line by line (default: the day's entry in HOT_FUNCTIONS).
+    With top_sites, the result lists the source lines holding the most memory at each phase's
+    peak (this needs track_memory).
+    """
+    input_path = Path(input_path) if input_path else default_input(day)
+    module = load_solver(day, part)
+    parser = get_parser(module, day)
+
+    if profile_dir:
+        names = HOT_FUNCTIONS.get(day, []) if profile_lines is None else profile_lines
+        profiler = profiled(profile_dir, f'd{day:02d}p{part}', find_functions(module, names))
+    else:
+        profiler = contextlib.nullcontext()
+
+    with silenced(quiet), profiler:
+        if use_cache:
+            data, parse_time, parse_peak, parse_sites = measure(
+                cached_parse, parser, input_path, module,
+                track_memory=track_memory, top_sites=top_sites)
+        else:
+            data, parse_time, parse_peak, parse_sites = measure(
+                parser, str(input_path), track_memory=track_memory, top_sites=top_sites)
+        answer, solve_time, solve_peak, solve_sites = measure(
+            module.solve, data, track_memory=track_memory, top_sites=top_sites)
+
+    return SolverResult(day, part, input_path, answer, parse_time, solve_time,
+                        parse_peak, solve_peak, parse_sites=parse_sites, solve_sites=solve_sites)
+
+def try_run_solver(day: int, part: int, input_path=None, **kwargs) -> SolverResult:
+    """
+    Runs a solver like run_solver, but returns a result with the error filled in if it failed
+    rather than raising, so one broken solver doesn't stop the rest of a run
+    """
+    try:
+        return run_solver(day, part, input_path, **kwargs)
+    except Exception as e:
+        input_path = Path(input_path) if input_path else default_input(day)
+        return SolverResult(day, part, input_path, None, 0.0, 0.0,
+                            error=f'{type(e).__name__}: {e}')
+
+def format_bytes(num_bytes: int | None) -> str:
+    """
+    Formats a byte count as a human readable string
+    """
+    if num_bytes is None:
+        return '-'
+    for unit in ('B', 'KiB', 'MiB'):
+        if num_bytes < 1024:
+            return f'{num_bytes:.1f} {unit}'
+        num_bytes /= 1024
+    return f'{num_bytes:.1f} GiB'
+
+def format_sites(result: SolverResult) -> str:
+    """
+    Formats a result's top allocation sites as indented lines, one per site
+    """
+    lines = []
+    for phase, sites in (('parse', result.parse_sites), ('solve', result.solve_sites)):
+        for site in sites or []:
+            lines.append(f'    {phase}  {format_bytes(site.size):>10}  {site.count:>9} blocks  '
+                         f'{site}')
+    return '\n'.join(lines)
+
+def format_result(result: SolverResult) -> str:
+    """
+    Formats a solver result as a single report line
+    """
+    if result.error:
+        return f'Day {result.day:2d} Part {result.part}: {result.error}'
+    return (f'Day {result.day:2d} Part {result.part}: {str(result.answer):>16}  '
+            f'parse {result.parse_time * 1000:9.2f} ms  '
+            f'solve {result.solve_time * 1000:10.2f} ms  '
+            f'peak {format_bytes(result.parse_peak):>10} / {format_bytes(result.solve_peak):>10}')
@@ -0,0 +1,75 @@
+"""
+Finds the solver scripts in the DXX folders and loads them in-process.
+The solvers aren't a package, so each one is imported straight from its file path and kept in
+a module cache so that running it again doesn't pay the import cost a second time.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Days whose parser isn't called parse_input
+PARSERS = {
+    2: 'game_parser',
+    3: 'engine_parser',
+    4: 'card_parser',
+    5: 'map_parser',
+    6: 'race_parser',
+    7: 'hand_parser',
+    8: 'parse_map',
+    9: 'parse_sequences',
+    10: 'parse_maze',
+}
+
+_loaded_modules = {}
+
+def solver_path(day: int, part: int) -> Path:
+    """
+    Returns the path of the solver script for a given day and part
+    """
+    return ROOT / f'D{day:02d}' / f'd{day}p{part}.py'
+
+def default_input(day: int) -> Path:
+    """
+    Returns the path of the puzzle input for a given day
+    """
+    return ROOT / f'D{day:02d}' / 'input.txt'
+
+def available_solvers() -> list[tuple[int, int]]:
+    """
+    Returns every (day, part) that has a solver script, in order
+    """
+    return [(day, part) for day in range(1, 26) for part in (1, 2)
+            if solver_path(day, part).exists()]
+
+def load_solver(day: int, part: int):
+    """
+    Imports the solver module for a given day and part, reusing it if it's already loaded
+    """
+    if (day, part) in _loaded_modules:
+        return _loaded_modules[(day, part)]
+
+    path = solver_path(day, part)
+    if not path.exists():
+        raise ValueError(f'No solver for day {day} part {part} at {path}')
+
+    # Register the module under its own name so that anything pickled from it can be found again
+    module_name = f'd{day}p{part}'
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+
+    _loaded_modules[(day, part)] = module
+    return module
+
+def get_parser(module, day: int):
+    """
+    Returns the parse function of a loaded solver module
+    """
+    return getattr(module, PARSERS.get(day, 'parse_input'))
@@ -0,0 +1,33 @@
+"""
+Reads a grid-shaped input one row at a time, for puzzles where a row only interacts with the rows
+directly above and below it, like D03's engine schematic. Only a three-row window is ever held, so
+memory stays the same however tall the input is.
+"""
+from typing import Iterable, Iterator, TypeVar
+
+Row = TypeVar('Row')
+
+def read_rows(file_name) -> Iterator[str]:
+    """
+    Yields the lines of a file one at a time, without their line endings
+    """
+    try:
+        with open(file_name, 'r', encoding='utf-8') as f:
+            for line in f:
+                yield line.rstrip('\r\n')
+    except (FileNotFoundError, IOError) as e:
+        raise RuntimeError(f"An error occurred: {e}") from e
+
+def sliding_rows(rows: Iterable[Row], empty: Row = '') -> Iterator[tuple[Row, Row, Row]]:
+    """
+    Yields (previous, current, next) for each row in turn. There is nothing above the first row
+    or below the last one, so empty stands in for those.
+    """
+    previous, current = empty, None
+    for row in rows:
+        if current is not None:
+            yield previous, current, row
+            previous = current
+        current = row
+    if current is not None:
+        yield previous, current, empty
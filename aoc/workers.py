@@ -0,0 +1,42 @@
+"""
+Spreads a solver's own work over a pool of worker processes.
+Workers are spawned, so each starts from a fresh interpreter and loads the solver by day and part
+before running anything. Functions are named rather than pickled, since a solver run as a script
+and the same solver loaded by the runner are different modules. A solver can name an initializer
+that each worker runs once when it starts, so large read-only data (like D05's almanac) is sent
+to each worker once instead of with every task.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from aoc.solvers import load_solver
+
+def _init_worker(day: int, part: int, initializer: str | None, initargs: tuple):
+    """
+    Runs in each worker as it starts: loads the solver and calls its initializer
+    """
+    module = load_solver(day, part)
+    if initializer:
+        getattr(module, initializer)(*initargs)
+
+def _run_task(day: int, part: int, function: str, args: tuple):
+    """
+    Runs in a worker: calls one of the solver's functions
+    """
+    return getattr(load_solver(day, part), function)(*args)
+
+def map_tasks(day: int, part: int, function: str, tasks: list[tuple], workers: int | None = None,
+              initializer: str | None = None, initargs: tuple = ()) -> list:
+    """
+    Calls the solver's function with each tuple of arguments in tasks on a pool of worker
+    processes and returns the results in the order of the tasks
+    """
+    if not tasks:
+        return []
+    workers = min(workers or os.cpu_count(), len(tasks))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn'),
+                             initializer=_init_worker,
+                             initargs=(day, part, initializer, initargs)) as executor:
+        futures = [executor.submit(_run_task, day, part, function, args) for args in tasks]
+        return [future.result() for future in futures]
@@ -0,0 +1,4 @@
+"""
+Benchmark suite for the daily solvers. Runs every solver several times against its input,
+stores the timings in a JSON baseline and flags regressions against a previous baseline.
+"""
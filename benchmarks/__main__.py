@@ -0,0 +1,107 @@
+"""
+Command line entry point for the benchmark suite.
+
+Usage:
+    python -m benchmarks --repeats 5 --save            # record a new baseline
+    python -m benchmarks --day 17 --threshold 0.2      # compare against the stored baseline
+    python -m benchmarks --day 4 --sizes 100,1000,10000 --plot d04.png   # time vs input size
+"""
+import argparse
+import sys
+
+from aoc.runner import format_bytes
+from aoc.solvers import available_solvers
+from benchmarks.harness import (BASELINE_FILE, benchmark_scaling, benchmark_solver,
+                                find_regressions, load_baseline, plot_scaling, save_baseline,
+                                solver_key)
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the command line argument parser
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Benchmark the solvers against a baseline')
+    parser.add_argument('--day', type=int, help='Day to benchmark (default: all days)')
+    parser.add_argument('--part', type=int, choices=(1, 2),
+                        help='Part to benchmark (default: both parts)')
+    parser.add_argument('--repeats', type=int, default=5, help='Runs per solver (default: 5)')
+    parser.add_argument('--timeout', type=float, default=300,
+                        help='Seconds before a solver is killed (default: 300)')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='Baseline JSON file')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Allowed slowdown before flagging a regression (default: 0.1)')
+    parser.add_argument('--save', action='store_true',
+                        help='Store the results in the baseline file instead of comparing')
+    parser.add_argument('--sizes', type=lambda value: [int(size) for size in value.split(',')],
+                        help='Comma separated synthetic input sizes to benchmark instead of the '
+                             'real input (requires --day)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic inputs')
+    parser.add_argument('--plot', help='With --sizes, save a time vs size plot to this file')
+    parser.add_argument('--cache', action='store_true',
+                        help='Read parsed inputs from the parse cache so timings skip parsing')
+    return parser
+
+def format_stats(key: str, stats: dict) -> str:
+    """
+    Formats a solver's benchmark stats as a single report line
+    """
+    if 'error' in stats:
+        return f"{key:>6}: {stats['error']}"
+    return (f"{key:>6}: {stats['answer']:>16}  min {stats['min'] * 1000:10.2f} ms  "
+            f"median {stats['median'] * 1000:10.2f} ms  p95 {stats['p95'] * 1000:10.2f} ms  "
+            f"peak RSS {format_bytes(stats['peak_rss']):>10}")
+
+def scaling_command(solvers: list[tuple[int, int]], args) -> int:
+    """
+    Benchmarks the selected solvers across synthetic input sizes and optionally plots the results
+    """
+    scaling = {}
+    for day, part in solvers:
+        key = solver_key(day, part)
+        scaling[key] = benchmark_scaling(day, part, args.sizes, repeats=args.repeats,
+                                         timeout=args.timeout, seed=args.seed)
+        for size, stats in scaling[key].items():
+            print(format_stats(f'{key} @ {size}', stats), flush=True)
+
+    if args.plot:
+        plot_scaling(scaling, args.plot)
+        print(f'Saved plot to {args.plot}')
+    return 0
+
+def main(argv=None) -> int:
+    """
+    Benchmarks the selected solvers, then either saves or checks the baseline
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.sizes and args.day is None:
+        parser.error('--sizes requires --day')
+    if args.plot and not args.sizes:
+        parser.error('--plot requires --sizes')
+
+    solvers = [(day, part) for day, part in available_solvers()
+               if (args.day is None or day == args.day) and (args.part is None or part == args.part)]
+    if args.sizes:
+        return scaling_command(solvers, args)
+
+    current = {}
+    for day, part in solvers:
+        key = solver_key(day, part)
+        current[key] = benchmark_solver(day, part, repeats=args.repeats, timeout=args.timeout,
+                                        use_cache=args.cache)
+        print(format_stats(key, current[key]), flush=True)
+
+    baseline = load_baseline(args.baseline)
+    if args.save:
+        baseline.update(current)
+        save_baseline(baseline, args.baseline)
+        print(f'Saved baseline to {args.baseline}')
+        return 0
+
+    regressions = find_regressions(baseline, current, args.threshold)
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""
+Synthetic input generators for every day's puzzle format.
+Each dXX module has a generate(size, seed) function that returns a valid puzzle input as a
+string. What "size" means depends on the day (lines, grid side, number of bricks, ...) and is
+described at the top of each module. The same size and seed always give the same input.
+"""
+import importlib
+from pathlib import Path
+
+def get_generator(day: int):
+    """
+    Returns the generate function for a given day
+    """
+    try:
+        module = importlib.import_module(f'benchmarks.generators.d{day:02d}')
+    except ModuleNotFoundError as e:
+        raise ValueError(f'No input generator for day {day}') from e
+    return module.generate
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    """
+    Returns a synthetic puzzle input for a given day at the given size
+    """
+    return get_generator(day)(size, seed)
+
+def write_input(day: int, size: int, path, seed: int = 0) -> Path:
+    """
+    Writes a synthetic puzzle input for a given day to a file and returns its path
+    """
+    path = Path(path)
+    path.write_text(generate(day, size, seed), encoding='utf-8')
+    return path
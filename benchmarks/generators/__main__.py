@@ -0,0 +1,33 @@
+"""
+Writes a synthetic puzzle input to stdout or a file.
+
+Usage:
+    python -m benchmarks.generators --day 14 --size 500 --seed 1 > big_input.txt
+"""
+import argparse
+import sys
+
+from benchmarks.generators import generate
+
+def main(argv=None) -> int:
+    """
+    Parses the command line and writes the generated input
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.generators',
+                                     description='Generate a synthetic puzzle input')
+    parser.add_argument('--day', type=int, required=True, help='Day to generate an input for')
+    parser.add_argument('--size', type=int, required=True, help='Size of the input')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--output', help='File to write to (default: stdout)')
+    args = parser.parse_args(argv)
+
+    text = generate(args.day, args.size, args.seed)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
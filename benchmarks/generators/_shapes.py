@@ -0,0 +1,64 @@
+"""
+Shape helpers shared by the generators that need a closed loop (D10 pipes and D18 trenches).
+"""
+
+def random_loop(width: int, height: int, rng) -> list[tuple[int, int]]:
+    """
+    Returns the corners of a random simple rectilinear loop as (row, col) lattice points in
+    walking order. The loop is the outline of a stack of column intervals that each overlap
+    their neighbour, which guarantees a single loop that never touches itself.
+    Rows lie in [0, height] and columns in [0, width].
+    """
+    # Pick a [top, bottom) interval of cells for every column, overlapping the previous one
+    intervals = []
+    top, bottom = 0, height
+    for _ in range(width):
+        new_top = rng.randrange(0, height)
+        new_bottom = rng.randrange(new_top + 1, height + 1)
+        if intervals:
+            # Push the interval back into overlap with the previous column if needed
+            if new_top >= bottom:
+                new_top = bottom - 1
+            if new_bottom <= top:
+                new_bottom = top + 1
+        top, bottom = new_top, new_bottom
+        intervals.append((top, bottom))
+
+    # Collect the unit edges of the region's outline: every cell side not shared with another cell
+    cells = {(row, col) for col, (top, bottom) in enumerate(intervals) for row in range(top, bottom)}
+    neighbours = {}
+    for row, col in cells:
+        sides = [((row - 1, col), (row, col), (row, col + 1)),
+                 ((row + 1, col), (row + 1, col), (row + 1, col + 1)),
+                 ((row, col - 1), (row, col), (row + 1, col)),
+                 ((row, col + 1), (row, col + 1), (row + 1, col + 1))]
+        for other_cell, start, end in sides:
+            if other_cell not in cells:
+                neighbours.setdefault(start, []).append(end)
+                neighbours.setdefault(end, []).append(start)
+
+    # Walk the outline; every lattice point on it has exactly two neighbours
+    start = min(neighbours)
+    loop = [start]
+    previous, current = None, start
+    while True:
+        first, second = neighbours[current]
+        following = second if first == previous else first
+        if following == start:
+            break
+        loop.append(following)
+        previous, current = current, following
+
+    return loop
+
+def loop_corners(loop: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Drops the points of a loop that sit in the middle of a straight run, leaving only the corners
+    """
+    corners = []
+    for index, point in enumerate(loop):
+        before = loop[index - 1]
+        after = loop[(index + 1) % len(loop)]
+        if not (before[0] == point[0] == after[0] or before[1] == point[1] == after[1]):
+            corners.append(point)
+    return corners
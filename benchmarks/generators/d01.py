@@ -0,0 +1,28 @@
+"""
+Day 1: calibration document. Size is the number of lines.
+Every line mixes lowercase letters, digits and spelled-out digits, and holds at least one digit.
+"""
+import random
+import string
+
+WORDS = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a calibration document with the given number of lines
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        pieces = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 8)):
+            roll = rng.random()
+            if roll < 0.3:
+                pieces.append(str(rng.randint(1, 9)))
+            elif roll < 0.5:
+                pieces.append(rng.choice(WORDS))
+            else:
+                pieces.append(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        rng.shuffle(pieces)
+        lines.append(''.join(pieces))
+    return '\n'.join(lines) + '\n'
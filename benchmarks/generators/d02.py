@@ -0,0 +1,20 @@
+"""
+Day 2: cube game log. Size is the number of games.
+"""
+import random
+
+COLORS = ['red', 'green', 'blue']
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a game log with the given number of games
+    """
+    rng = random.Random(seed)
+    lines = []
+    for game_id in range(1, size + 1):
+        reveals = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(COLORS, rng.randint(1, 3))
+            reveals.append(', '.join(f'{rng.randint(1, 20)} {color}' for color in colors))
+        lines.append(f'Game {game_id}: ' + '; '.join(reveals))
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,30 @@
+"""
+Day 3: engine schematic. Size is the side length of the square schematic.
+"""
+import random
+
+SYMBOLS = '*#+$/@%=&-'
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a size x size engine schematic of numbers, symbols and periods
+    """
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(size):
+        row = []
+        while len(row) < size:
+            roll = rng.random()
+            if roll < 0.12:
+                number = str(rng.randint(1, 999))
+                # Numbers can't run into each other or off the end of the row
+                row.extend(number[:size - len(row)])
+                if len(row) < size:
+                    row.append('.')
+            elif roll < 0.17:
+                # Gears are the most common symbol, so part 2 has something to find
+                row.append('*' if rng.random() < 0.4 else rng.choice(SYMBOLS))
+            else:
+                row.append('.')
+        rows.append(''.join(row))
+    return '\n'.join(rows) + '\n'
@@ -0,0 +1,28 @@
+"""
+Day 4: scratchcards. Size is the number of cards.
+Like the real input, no card wins copies of cards past the end of the table.
+"""
+import random
+
+WINNING_COUNT = 10
+YOUR_COUNT = 25
+MATCH_WEIGHTS = [60, 12, 8, 5, 4, 3, 2, 2, 2, 1, 1]
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a pile of scratchcards with the given number of cards
+    """
+    rng = random.Random(seed)
+    lines = []
+    width = len(str(size))
+    for card_id in range(1, size + 1):
+        # Most cards win little or nothing, which keeps the copy counts from exploding
+        matches = rng.choices(range(WINNING_COUNT + 1), weights=MATCH_WEIGHTS)[0]
+        matches = min(matches, size - card_id)
+        numbers = rng.sample(range(1, 100), WINNING_COUNT + YOUR_COUNT - matches)
+        winning = numbers[:WINNING_COUNT]
+        yours = rng.sample(winning, matches) + numbers[WINNING_COUNT:]
+        rng.shuffle(yours)
+        lines.append(f'Card {card_id:>{width}}: ' + ' '.join(f'{num:>2}' for num in winning)
+                     + ' | ' + ' '.join(f'{num:>2}' for num in yours))
+    return '\n'.join(lines) + '\n'
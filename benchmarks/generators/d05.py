@@ -0,0 +1,40 @@
+"""
+Day 5: seed almanac. Size is the number of ranges in each of the seven maps; there are
+max(1, size // 4) seed ranges. Each map shuffles blocks of [0, 2^32) around, so like the real
+input every map is a bijection.
+"""
+import random
+
+MAP_NAMES = ['seed-to-soil', 'soil-to-fertilizer', 'fertilizer-to-water', 'water-to-light',
+             'light-to-temperature', 'temperature-to-humidity', 'humidity-to-location']
+SPACE = 2 ** 32
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns an almanac with the given number of ranges per map
+    """
+    rng = random.Random(seed)
+
+    seeds = []
+    for _ in range(max(1, size // 4)):
+        start = rng.randrange(SPACE // 2)
+        seeds.extend([start, rng.randrange(1, SPACE // 16)])
+    sections = ['seeds: ' + ' '.join(map(str, seeds))]
+
+    for name in MAP_NAMES:
+        # Cut the number line into blocks and lay them back down in a shuffled order
+        cuts = sorted(rng.sample(range(1, SPACE), size - 1)) if size > 1 else []
+        starts = [0] + cuts
+        lengths = [end - start for start, end in zip(starts, cuts + [SPACE])]
+        order = list(range(size))
+        rng.shuffle(order)
+        destinations = {}
+        position = 0
+        for block in order:
+            destinations[block] = position
+            position += lengths[block]
+
+        entries = [f'{destinations[block]} {starts[block]} {lengths[block]}' for block in order]
+        sections.append(f'{name} map:\n' + '\n'.join(entries))
+
+    return '\n\n'.join(sections) + '\n'
@@ -0,0 +1,16 @@
+"""
+Day 6: boat races. Size is the number of races.
+Times have two digits and records four, so the concatenated part 2 race is winnable too.
+"""
+import random
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a race sheet with the given number of races
+    """
+    rng = random.Random(seed)
+    times = [rng.randint(70, 99) for _ in range(size)]
+    # Keep every record comfortably below the best possible distance of (time / 2) ** 2
+    distances = [rng.randint(1000, time * time // 4 - 2) for time in times]
+    return ('Time:     ' + ' '.join(f'{time:>4}' for time in times) + '\n'
+            'Distance: ' + ' '.join(f'{distance:>4}' for distance in distances) + '\n')
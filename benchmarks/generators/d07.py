@@ -0,0 +1,17 @@
+"""
+Day 7: camel card hands. Size is the number of hands.
+"""
+import random
+
+CARDS = 'AKQJT98765432'
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a list of hands and bids with the given number of hands
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        hand = ''.join(rng.choices(CARDS, k=5))
+        lines.append(f'{hand} {rng.randint(1, 1000)}')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,50 @@
+"""
+Day 8: desert map network. Size is the length of the left/right instruction string.
+Like the real input, there are six ghosts, each walking its own loop whose length is the
+instruction length times a distinct prime, and AAA leads to ZZZ.
+"""
+import random
+
+PRIMES = [43, 47, 53, 59, 61, 67]
+LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a network whose instruction string has the given length
+    """
+    rng = random.Random(seed)
+    instructions = ''.join(rng.choice('LR') for _ in range(size))
+
+    # Names are unique and only start/end nodes end in A/Z
+    used_names = set()
+    def new_name(last_letter=None):
+        while True:
+            name = ''.join(rng.choices(LETTERS, k=3 if size < 20 else 4))
+            if last_letter:
+                name = name[:-1] + last_letter
+            elif name[-1] in 'AZ':
+                continue
+            if name not in used_names:
+                used_names.add(name)
+                return name
+
+    nodes = {}
+    for ghost, prime in enumerate(PRIMES):
+        # Each node in the chain is only ever visited at one position in the instructions, so
+        # the instruction at that position picks the next node and the other branch is a decoy
+        start = 'AAA' if ghost == 0 else new_name('A')
+        end = 'ZZZ' if ghost == 0 else new_name('Z')
+        used_names.update((start, end))
+        chain = [start] + [new_name() for _ in range(prime * size - 1)] + [end]
+        for position, node in enumerate(chain):
+            following = chain[position + 1] if node != end else chain[1]
+            decoy = rng.choice(chain[1:])
+            if instructions[position % size] == 'L':
+                nodes[node] = (following, decoy)
+            else:
+                nodes[node] = (decoy, following)
+
+    names = list(nodes)
+    rng.shuffle(names)
+    lines = [f'{name} = ({nodes[name][0]}, {nodes[name][1]})' for name in names]
+    return instructions + '\n\n' + '\n'.join(lines) + '\n'
@@ -0,0 +1,21 @@
+"""
+Day 9: OASIS sequences. Size is the number of sequences.
+Every sequence is a polynomial of degree at most 8 sampled at 21 points, so the differences
+always bottom out at zero like in the real input.
+"""
+import random
+
+LENGTH = 21
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns the given number of sequences
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 9))]
+        coefficients[0] = rng.randint(-20, 20)
+        values = [sum(c * x ** power for power, c in enumerate(coefficients)) for x in range(LENGTH)]
+        lines.append(' '.join(map(str, values)))
+    return '\n'.join(lines) + '\n'
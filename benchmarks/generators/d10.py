@@ -0,0 +1,43 @@
+"""
+Day 10: pipe maze. Size is the side length of the square maze.
+The maze holds one loop through S, surrounded by junk pipe pieces that aren't part of it.
+"""
+import random
+
+from benchmarks.generators._shapes import random_loop
+
+PIPES = {frozenset({(-1, 0), (1, 0)}): '|', frozenset({(0, -1), (0, 1)}): '-',
+         frozenset({(-1, 0), (0, 1)}): 'L', frozenset({(-1, 0), (0, -1)}): 'J',
+         frozenset({(1, 0), (0, -1)}): '7', frozenset({(1, 0), (0, 1)}): 'F'}
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a size x size pipe maze
+    """
+    rng = random.Random(seed)
+    maze = [[rng.choice('|-LJ7F...') for _ in range(size)] for _ in range(size)]
+
+    # Draw the loop at double scale so that it has room for enclosed tiles between its runs
+    lattice = (size - 1) // 2
+    corners = random_loop(lattice, lattice, rng)
+    loop = []
+    for (row, col), (next_row, next_col) in zip(corners, corners[1:] + corners[:1]):
+        loop.append((2 * row, 2 * col))
+        loop.append((row + next_row, col + next_col))
+
+    for index, (row, col) in enumerate(loop):
+        before = loop[index - 1]
+        after = loop[(index + 1) % len(loop)]
+        exits = frozenset({(before[0] - row, before[1] - col), (after[0] - row, after[1] - col)})
+        maze[row][col] = PIPES[exits]
+
+    # Only the two loop pipes next to the animal may connect to it
+    start_row, start_col = rng.choice(loop)
+    on_loop = set(loop)
+    for row_offset, col_offset in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        row, col = start_row + row_offset, start_col + col_offset
+        if 0 <= row < size and 0 <= col < size and (row, col) not in on_loop:
+            maze[row][col] = '.'
+    maze[start_row][start_col] = 'S'
+
+    return '\n'.join(''.join(row) for row in maze) + '\n'
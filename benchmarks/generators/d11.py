@@ -0,0 +1,18 @@
+"""
+Day 11: galaxy image. Size is the side length of the square image.
+About 2% of the cells are galaxies, leaving some rows and columns empty to expand.
+"""
+import random
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a size x size galaxy image
+    """
+    rng = random.Random(seed)
+    empty_rows = set(rng.sample(range(size), size // 10))
+    empty_cols = set(rng.sample(range(size), size // 10))
+    rows = []
+    for row in range(size):
+        rows.append(''.join('#' if row not in empty_rows and col not in empty_cols
+                            and rng.random() < 0.02 else '.' for col in range(size)))
+    return '\n'.join(rows) + '\n'
@@ -0,0 +1,27 @@
+"""
+Day 12: spring condition records. Size is the number of records.
+Each record is built from a real arrangement of its damaged groups with some springs hidden
+behind '?', so it always has at least one valid arrangement.
+"""
+import random
+
+MAX_LENGTH = 20
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns the given number of condition records
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        # Real records are at most 20 springs long, which part 1's brute force depends on
+        springs = None
+        while springs is None or len(springs) > MAX_LENGTH:
+            groups = [rng.randint(1, 5) for _ in range(rng.randint(1, 6))]
+            springs = '.'.join('#' * group for group in groups)
+            # Spread the groups apart with extra operational springs
+            springs = ''.join(char + '.' * (rng.random() < 0.3) for char in springs)
+            springs = '.' * rng.randint(0, 3) + springs + '.' * rng.randint(0, 3)
+        springs = ''.join('?' if rng.random() < 0.5 else char for char in springs)
+        lines.append(f"{springs} {','.join(map(str, groups))}")
+    return '\n'.join(lines) + '\n'
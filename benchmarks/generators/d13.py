@@ -0,0 +1,71 @@
+"""
+Day 13: mirror patterns. Size is the number of patterns.
+Every pattern has exactly one vertical line of reflection, and exactly one smudge that turns a
+horizontal line into a reflection instead, so both parts have a single answer per pattern.
+"""
+import random
+
+def reflection_lines(pattern: list[str]) -> set[tuple[str, int]]:
+    """
+    Returns every line of reflection in a pattern as ('row', n) or ('col', n), where n is the
+    number of rows above or columns left of the line
+    """
+    lines = set()
+    columns = [''.join(column) for column in zip(*pattern)]
+    for label, rows in (('row', pattern), ('col', columns)):
+        for split in range(1, len(rows)):
+            width = min(split, len(rows) - split)
+            if rows[split - width:split] == rows[split:split + width][::-1]:
+                lines.add((label, split))
+    return lines
+
+def flip(pattern: list[str], row: int, col: int) -> list[str]:
+    """
+    Returns a copy of the pattern with one cell flipped between ash and rock
+    """
+    flipped = list(pattern)
+    char = '.' if pattern[row][col] == '#' else '#'
+    flipped[row] = pattern[row][:col] + char + pattern[row][col + 1:]
+    return flipped
+
+def make_pattern(rng) -> list[str]:
+    """
+    Builds one pattern, retrying until both its reflection and its smudge are unique
+    """
+    while True:
+        height = rng.randrange(7, 18)
+        width = rng.randrange(7, 18)
+        # Mirror the columns around a vertical line near the left edge, leaving the columns on
+        # the right free, then mirror the rows around a horizontal line
+        col_line = rng.randrange(1, width // 2)
+        row_line = rng.randrange(1, height)
+        cells = [[rng.choice('#.') for _ in range(width)] for _ in range(height)]
+        for row in cells:
+            for offset in range(col_line):
+                row[col_line + offset] = row[col_line - 1 - offset]
+        for offset in range(min(row_line, height - row_line)):
+            cells[row_line + offset] = list(cells[row_line - 1 - offset])
+        pattern = [''.join(row) for row in cells]
+
+        # The smudge sits in a mirrored row but outside the mirrored columns
+        reach = min(row_line, height - row_line)
+        smudge_row = rng.randrange(row_line - reach, row_line + reach)
+        smudge_col = rng.randrange(2 * col_line, width)
+        pattern = flip(pattern, smudge_row, smudge_col)
+
+        original = reflection_lines(pattern)
+        if original != {('col', col_line)}:
+            continue
+        smudged_lines = set()
+        for row in range(height):
+            for col in range(width):
+                smudged_lines |= reflection_lines(flip(pattern, row, col)) - original
+        if smudged_lines == {('row', row_line)}:
+            return pattern
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns the given number of mirror patterns
+    """
+    rng = random.Random(seed)
+    return '\n\n'.join('\n'.join(make_pattern(rng)) for _ in range(size)) + '\n'
@@ -0,0 +1,12 @@
+"""
+Day 14: rolling rock platform. Size is the side length of the square platform.
+"""
+import random
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a size x size platform of round rocks, cube rocks and empty space
+    """
+    rng = random.Random(seed)
+    return '\n'.join(''.join(rng.choices('O#.', weights=(20, 10, 70), k=size))
+                     for _ in range(size)) + '\n'
@@ -0,0 +1,18 @@
+"""
+Day 15: initialization sequence. Size is the number of steps.
+"""
+import random
+import string
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a single-line initialization sequence with the given number of steps
+    """
+    rng = random.Random(seed)
+    labels = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+              for _ in range(max(1, size // 4))]
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        steps.append(f'{label}={rng.randint(1, 9)}' if rng.random() < 0.6 else f'{label}-')
+    return ','.join(steps) + '\n'
@@ -0,0 +1,12 @@
+"""
+Day 16: mirror contraption. Size is the side length of the square grid.
+"""
+import random
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a size x size grid of empty space, mirrors and splitters
+    """
+    rng = random.Random(seed)
+    return '\n'.join(''.join(rng.choices('./\\|-', weights=(90, 3, 3, 2, 2), k=size))
+                     for _ in range(size)) + '\n'
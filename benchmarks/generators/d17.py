@@ -0,0 +1,11 @@
+"""
+Day 17: city block heat loss map. Size is the side length of the square map.
+"""
+import random
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a size x size map of heat loss digits
+    """
+    rng = random.Random(seed)
+    return '\n'.join(''.join(rng.choices('123456789', k=size)) for _ in range(size)) + '\n'
@@ -0,0 +1,56 @@
+"""
+Day 18: dig plan. Size is the number of columns in the lagoon outline, which sets the number of
+instructions. The colour codes describe a second, much larger lagoon of the same shape, so part 2
+gets a valid loop too.
+"""
+import random
+
+from benchmarks.generators._shapes import loop_corners, random_loop
+
+DIRECTIONS = {(0, 1): ('R', 0), (1, 0): ('D', 1), (0, -1): ('L', 2), (-1, 0): ('U', 3)}
+
+def stretch(values: set[int], rng, low: int, high: int) -> dict[int, int]:
+    """
+    Returns a strictly increasing map of the given coordinates with random gaps between them,
+    which keeps the loop's shape (and so keeps it simple and closed)
+    """
+    mapping = {}
+    position = 0
+    for value in sorted(values):
+        mapping[value] = position
+        position += rng.randint(low, high)
+    return mapping
+
+def instructions(corners, rows, cols):
+    """
+    Turns a loop's corners into (direction, distance) steps after stretching its coordinates
+    """
+    steps = []
+    for (row, col), (next_row, next_col) in zip(corners, corners[1:] + corners[:1]):
+        row_delta = rows[next_row] - rows[row]
+        col_delta = cols[next_col] - cols[col]
+        distance = abs(row_delta) + abs(col_delta)
+        steps.append(((row_delta // distance, col_delta // distance), distance))
+    return steps
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a dig plan whose outline spans the given number of columns
+    """
+    rng = random.Random(seed)
+    corners = loop_corners(random_loop(size, size, rng))
+    row_values = {row for row, _ in corners}
+    col_values = {col for _, col in corners}
+
+    part_one = instructions(corners, stretch(row_values, rng, 2, 12), stretch(col_values, rng, 2, 12))
+    # Colour code distances only have five hex digits, so the big lagoon has to fit in 0xFFFFF
+    max_gap = max(2, 0xFFFFF // (max(len(row_values), len(col_values)) + 1))
+    part_two = instructions(corners, stretch(row_values, rng, 1, max_gap),
+                            stretch(col_values, rng, 1, max_gap))
+
+    lines = []
+    for (vector, distance), (hex_vector, hex_distance) in zip(part_one, part_two):
+        direction = DIRECTIONS[vector][0]
+        color = f'{hex_distance:05x}{DIRECTIONS[hex_vector][1]}'
+        lines.append(f'{direction} {distance} (#{color})')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,66 @@
+"""
+Day 19: workflows and part ratings. Size is the number of workflows; there are as many parts.
+The workflows form a tree rooted at 'in', so every workflow is reached by exactly one rule, like
+in the real input. Each rule's threshold falls inside the ratings that can still reach it, so no
+rule is dead.
+"""
+import random
+import string
+
+CATEGORIES = 'xmas'
+
+def split_range(ranges, category, operator, threshold):
+    """
+    Returns the ratings that pass and fail a rule, given the ratings that reach it
+    """
+    low, high = ranges[category]
+    if operator == '<':
+        passed, failed = (low, threshold - 1), (threshold, high)
+    else:
+        passed, failed = (threshold + 1, high), (low, threshold)
+    return {**ranges, category: passed}, {**ranges, category: failed}
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns the given number of workflows followed by the same number of parts
+    """
+    rng = random.Random(seed)
+
+    names = {'in'}
+    while len(names) < size:
+        names.add(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 3))))
+    names.discard('in')
+    pending = list(names)
+    rng.shuffle(pending)
+
+    def destination(ranges):
+        # Keep the tree growing until every name is used
+        if pending and (not queue or rng.random() < 0.7):
+            name = pending.pop()
+            queue.append((name, ranges))
+            return name
+        return rng.choice('AR')
+
+    # Grow the tree breadth first, handing out the unused names as rule destinations
+    workflows = {}
+    queue = [('in', {category: (1, 4000) for category in CATEGORIES})]
+    while queue:
+        name, ranges = queue.pop(0)
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            splittable = [category for category in CATEGORIES if ranges[category][1] > ranges[category][0]]
+            if not splittable:
+                break
+            category = rng.choice(splittable)
+            low, high = ranges[category]
+            operator = rng.choice('<>')
+            threshold = rng.randint(low + 1, high) if operator == '<' else rng.randint(low, high - 1)
+            passed, ranges = split_range(ranges, category, operator, threshold)
+            rules.append(f'{category}{operator}{threshold}:{destination(passed)}')
+        workflows[name] = rules + [destination(ranges)]
+
+    lines = [f"{name}{{{','.join(rules)}}}" for name, rules in workflows.items()]
+    rng.shuffle(lines)
+    parts = ['{' + ','.join(f'{category}={rng.randint(1, 4000)}' for category in CATEGORIES) + '}'
+             for _ in range(size)]
+    return '\n'.join(lines) + '\n\n' + '\n'.join(parts) + '\n'
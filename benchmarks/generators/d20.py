@@ -0,0 +1,50 @@
+"""
+Day 20: pulse module network. Size is the number of flip-flops in each of the four counters.
+Like the real input, the broadcaster drives four binary counters whose conjunction hubs feed the
+inverters jq, cc, sp and nx, which feed a final conjunction wired to rx. Part 2 relies on those
+four inverter names.
+"""
+import random
+import string
+
+INVERTERS = ['jq', 'cc', 'sp', 'nx']
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a module network with four counters of the given number of bits
+    """
+    rng = random.Random(seed)
+    bits = max(2, size)
+
+    used_names = set(INVERTERS) | {'rx'}
+    def new_name():
+        while True:
+            name = ''.join(rng.choices(string.ascii_lowercase, k=2 if bits < 10 else 3))
+            if name not in used_names:
+                used_names.add(name)
+                return name
+
+    final = new_name()
+    lines = [f'&{final} -> rx']
+    broadcasts = []
+    for inverter in INVERTERS:
+        flip_flops = [new_name() for _ in range(bits)]
+        hub = new_name()
+        broadcasts.append(flip_flops[0])
+
+        # The counter resets when it reaches its period: set bits report to the hub, and the hub
+        # pulses the unset bits (and the first bit) to roll the counter back to zero
+        period = rng.randrange(2 ** (bits - 1) + 1, 2 ** bits, 2)
+        hub_links = []
+        for bit, flip_flop in enumerate(flip_flops):
+            links = [flip_flops[bit + 1]] if bit + 1 < bits else []
+            if period >> bit & 1:
+                links.append(hub)
+            if not period >> bit & 1 or bit == 0:
+                hub_links.append(flip_flop)
+            lines.append(f"%{flip_flop} -> {', '.join(links)}")
+        lines.append(f"&{hub} -> {', '.join(hub_links + [inverter])}")
+        lines.append(f'&{inverter} -> {final}')
+
+    rng.shuffle(lines)
+    return f"broadcaster -> {', '.join(broadcasts)}\n" + '\n'.join(lines) + '\n'
@@ -0,0 +1,23 @@
+"""
+Day 21: garden map. Size is the side length of the square map (rounded up to an odd number).
+The start sits in the middle, and its row, its column and the border are clear of rocks like in
+the real input.
+"""
+import random
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a square garden map with the start in the middle
+    """
+    rng = random.Random(seed)
+    size = size | 1
+    middle = size // 2
+    rows = []
+    for row in range(size):
+        cells = []
+        for col in range(size):
+            clear = row in (0, middle, size - 1) or col in (0, middle, size - 1)
+            cells.append('.' if clear or rng.random() > 0.12 else '#')
+        rows.append(cells)
+    rows[middle][middle] = 'S'
+    return '\n'.join(''.join(row) for row in rows) + '\n'
@@ -0,0 +1,31 @@
+"""
+Day 22: falling brick snapshot. Size is the number of bricks.
+Bricks are dropped onto a 10 x 10 floor with a random gap above whatever is below them, so none
+overlap, and are listed in a shuffled order.
+"""
+import random
+
+FLOOR = 10
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a snapshot of the given number of bricks
+    """
+    rng = random.Random(seed)
+    heights = [[0] * FLOOR for _ in range(FLOOR)]
+    lines = []
+    for _ in range(size):
+        length = rng.randint(1, 4)
+        axis = rng.choice('xyz')
+        x1 = rng.randrange(FLOOR - (length - 1 if axis == 'x' else 0))
+        y1 = rng.randrange(FLOOR - (length - 1 if axis == 'y' else 0))
+        x2 = x1 + (length - 1 if axis == 'x' else 0)
+        y2 = y1 + (length - 1 if axis == 'y' else 0)
+        footprint = [(x, y) for x in range(x1, x2 + 1) for y in range(y1, y2 + 1)]
+        z1 = max(heights[x][y] for x, y in footprint) + 1 + rng.randint(0, 5)
+        z2 = z1 + (length - 1 if axis == 'z' else 0)
+        for x, y in footprint:
+            heights[x][y] = z2
+        lines.append(f'{x1},{y1},{z1}~{x2},{y2},{z2}')
+    rng.shuffle(lines)
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,39 @@
+"""
+Day 23: hiking trail map. Size is the number of junctions along each side.
+Like the real input, the junctions form a grid joined by trails heading right and down, with
+slopes next to every junction so that part 1 can only go right or down.
+"""
+import random
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a trail map with a size x size grid of junctions
+    """
+    rng = random.Random(seed)
+    junctions = max(2, size)
+
+    # Junction rows and columns are spread out with random gaps of at least 4 tiles
+    positions = [1]
+    for _ in range(junctions - 1):
+        positions.append(positions[-1] + rng.randint(4, 10))
+    side = positions[-1] + 2
+    rows = positions
+    cols = list(positions)
+
+    maze = [['#'] * side for _ in range(side)]
+    maze[0][1] = '.'
+    maze[side - 1][side - 2] = '.'
+    for row in rows:
+        for col_index in range(junctions - 1):
+            start, end = cols[col_index], cols[col_index + 1]
+            for col in range(start, end + 1):
+                maze[row][col] = '.'
+            maze[row][start + 1] = maze[row][end - 1] = '>'
+    for col in cols:
+        for row_index in range(junctions - 1):
+            start, end = rows[row_index], rows[row_index + 1]
+            for row in range(start, end + 1):
+                maze[row][col] = '.'
+            maze[start + 1][col] = maze[end - 1][col] = 'v'
+
+    return '\n'.join(''.join(row) for row in maze) + '\n'
@@ -0,0 +1,22 @@
+"""
+Day 24: hailstones. Size is the number of hailstones.
+A hidden rock is placed first and every hailstone is aimed to meet it at its own integer time,
+so part 2 has an exact answer; positions land around the part 1 test area.
+"""
+import random
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns the given number of hailstones
+    """
+    rng = random.Random(seed)
+    rock = [rng.randint(200_000_000_000_000, 400_000_000_000_000) for _ in range(3)]
+    rock_velocity = [rng.randint(-300, 300) for _ in range(3)]
+
+    lines = []
+    times = rng.sample(range(10_000_000_000, 1_000_000_000_000), size)
+    for time in times:
+        velocity = [rng.randint(-300, 300) for _ in range(3)]
+        position = [p + (v - hv) * time for p, v, hv in zip(rock, rock_velocity, velocity)]
+        lines.append(', '.join(map(str, position)) + ' @ ' + ', '.join(map(str, velocity)))
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,41 @@
+"""
+Day 25: component wiring diagram. Size is the total number of components.
+The components are split into two groups that are each well connected inside (every group is a
+ring where each component also links to the next but one), and exactly three wires join the groups.
+"""
+import random
+import string
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Returns a wiring diagram with the given number of components
+    """
+    rng = random.Random(seed)
+    size = max(size, 10)
+
+    names = set()
+    while len(names) < size:
+        names.add(''.join(rng.choices(string.ascii_lowercase, k=3)))
+    names = sorted(names)
+    rng.shuffle(names)
+
+    split = rng.randint(size // 3, size - size // 3)
+    edges = set()
+    for group in (names[:split], names[split:]):
+        for index, name in enumerate(group):
+            for step in (1, 2):
+                edges.add(frozenset((name, group[(index + step) % len(group)])))
+        # Some extra random wires inside the group
+        for _ in range(len(group) // 2):
+            edges.add(frozenset(rng.sample(group, 2)))
+    for left, right in zip(rng.sample(names[:split], 3), rng.sample(names[split:], 3)):
+        edges.add(frozenset((left, right)))
+
+    # Each wire is listed once, under one of its two components
+    wiring = {}
+    for edge in edges:
+        left, right = rng.sample(sorted(edge), 2)
+        wiring.setdefault(left, []).append(right)
+    lines = [f"{name}: {' '.join(connections)}" for name, connections in wiring.items()]
+    rng.shuffle(lines)
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,162 @@
+"""
+Runs each solver N times in its own process and summarises the wall times and peak RSS.
+Each solver gets a fresh interpreter so that its peak RSS isn't polluted by the solvers that
+ran before it, and so that one that hangs can be killed without taking the suite down with it.
+"""
+import json
+import multiprocessing
+import resource
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+from aoc.runner import run_solver
+from aoc.solvers import ROOT, default_input
+from benchmarks.generators import write_input
+
+BASELINE_FILE = Path(__file__).resolve().parent / 'baseline.json'
+
+def solver_key(day: int, part: int) -> str:
+    """
+    Returns the key used for a solver in the baseline file, e.g. d17p2
+    """
+    return f'd{day}p{part}'
+
+def summarise(times: list[float]) -> dict:
+    """
+    Returns the min, median and 95th percentile of a list of wall times
+    """
+    if len(times) > 1:
+        p95 = statistics.quantiles(times, n=20, method='inclusive')[18]
+    else:
+        p95 = times[0]
+    return {'min': min(times), 'median': statistics.median(times), 'p95': p95}
+
+def peak_rss() -> int:
+    """
+    Returns the peak resident set size of the current process in bytes
+    """
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+def _benchmark_worker(day, part, input_path, repeats, use_cache, results):
+    """
+    Runs inside the child process: times the solver and sends back its stats
+    """
+    try:
+        times = []
+        answer = None
+        for _ in range(repeats):
+            result = run_solver(day, part, input_path, track_memory=False, use_cache=use_cache)
+            times.append(result.parse_time + result.solve_time)
+            answer = result.answer
+        results.put({'answer': str(answer), **summarise(times), 'peak_rss': peak_rss()})
+    except Exception as e:
+        results.put({'error': f'{type(e).__name__}: {e}'})
+
+def benchmark_solver(day: int, part: int, input_path=None, repeats: int = 5,
+                     timeout: float | None = None, use_cache: bool = False) -> dict:
+    """
+    Benchmarks one solver in a fresh process and returns its stats.
+    If the solver fails or runs past the timeout, the stats contain an 'error' entry instead.
+    With use_cache, repeats after the first read the parsed input from the parse cache.
+    """
+    input_path = Path(input_path) if input_path else default_input(day)
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=_benchmark_worker,
+                              args=(day, part, str(input_path), repeats, use_cache, results))
+    process.start()
+    process.join(timeout)
+
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        stats = {'error': f'timed out after {timeout}s'}
+    elif results.empty():
+        stats = {'error': f'worker exited with code {process.exitcode}'}
+    else:
+        stats = results.get()
+
+    # Store inputs inside the repo relative to it so baselines can be compared across machines
+    if input_path.resolve().is_relative_to(ROOT):
+        input_path = input_path.resolve().relative_to(ROOT)
+    return {'input': str(input_path), 'repeats': repeats, **stats}
+
+def load_baseline(path=BASELINE_FILE) -> dict:
+    """
+    Reads a baseline file, returning an empty baseline if it doesn't exist yet
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def save_baseline(baseline: dict, path=BASELINE_FILE):
+    """
+    Writes a baseline file
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+def find_regressions(baseline: dict, current: dict, threshold: float = 0.1) -> list[str]:
+    """
+    Compares current stats against a baseline and returns a description of every solver whose
+    median time or peak RSS grew by more than the threshold (0.1 = 10%), or whose answer changed
+    """
+    regressions = []
+    for key, stats in current.items():
+        old_stats = baseline.get(key)
+        if not old_stats or 'error' in old_stats:
+            continue
+        if 'error' in stats:
+            regressions.append(f"{key}: {stats['error']}")
+            continue
+        if stats['answer'] != old_stats['answer']:
+            regressions.append(f"{key}: answer changed from {old_stats['answer']} to {stats['answer']}")
+        for metric in ('median', 'peak_rss'):
+            if stats[metric] > old_stats[metric] * (1 + threshold):
+                change = stats[metric] / old_stats[metric] - 1
+                regressions.append(f'{key}: {metric} regressed by {change:.0%} '
+                                   f'({old_stats[metric]:.4g} -> {stats[metric]:.4g})')
+    return regressions
+
+def benchmark_scaling(day: int, part: int, sizes: list[int], repeats: int = 5,
+                      timeout: float | None = None, seed: int = 0) -> dict:
+    """
+    Benchmarks one solver on synthetic inputs of increasing size and returns its stats by size.
+    The inputs are written to a temporary directory that is removed afterwards.
+    """
+    scaling = {}
+    with tempfile.TemporaryDirectory(prefix='aoc-bench-') as directory:
+        for size in sizes:
+            input_path = write_input(day, size, Path(directory) / f'd{day:02d}-{size}.txt', seed)
+            scaling[size] = benchmark_solver(day, part, input_path, repeats, timeout)
+            scaling[size]['input'] = f'generated (size {size}, seed {seed})'
+    return scaling
+
+def plot_scaling(scaling: dict, path):
+    """
+    Plots median solve time against input size for each solver, on log-log axes.
+    Expects a dict of solver key -> stats by size, as returned by benchmark_scaling.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    for key, by_size in scaling.items():
+        points = [(size, stats['median']) for size, stats in by_size.items() if 'error' not in stats]
+        if points:
+            ax.plot(*zip(*points), marker='o', label=key)
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel('Input size')
+    ax.set_ylabel('Median time (s)')
+    ax.legend()
+    fig.savefig(path)
+    plt.close(fig)